@@ -1,29 +1,25 @@
 #!/usr/bin/env python3
 
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
 import time
 
-def demo_basic_browser():
+from browser_pool import launch_chrome
+from demo_settings import demo_url
+
+def demo_basic_browser(driver=None):
     print("Demo 1: Basic Browser Launch and Navigation")
     print("=" * 50)
     
-    chrome_options = Options()
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    
-    service = Service(ChromeDriverManager().install())
+    owns_driver = driver is None
     
     try:
-        print("Setting up ChromeDriver...")
-        driver = webdriver.Chrome(service=service, options=chrome_options)
+        if owns_driver:
+            print("Setting up ChromeDriver...")
+            driver = launch_chrome()
         
         driver.implicitly_wait(10)
         
         print("Opening DemoQA test site...")
-        driver.get("https://demoqa.com/books")
+        driver.get(demo_url("/books"))
         
         page_title = driver.title
         print(f"Page title: {page_title}")
@@ -43,7 +39,7 @@ def demo_basic_browser():
         print(f"An error occurred: {str(e)}")
     
     finally:
-        if 'driver' in locals():
+        if driver and owns_driver:
             print("Closing browser...")
             driver.quit()
 
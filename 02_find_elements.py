@@ -1,32 +1,27 @@
 #!/usr/bin/env python3
 
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from webdriver_manager.chrome import ChromeDriverManager
 import time
 import os
 
-def demo_find_elements():
+from browser_pool import launch_chrome
+from demo_settings import demo_url
+from element_snapshot import snapshot, snapshot_many
+
+def demo_find_elements(driver=None):
     print("Demo 2: Finding and Interacting with Elements")
     print("=" * 50)
     
-    # Setup ChromeDriver
-    chrome_options = Options()
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    
-    service = Service(ChromeDriverManager().install())
-    driver = None
+    owns_driver = driver is None
     
     try:
-        print("Launching browser...")
-        driver = webdriver.Chrome(service=service, options=chrome_options)
+        if owns_driver:
+            print("Launching browser...")
+            driver = launch_chrome()
         driver.implicitly_wait(10)
         
-        driver.get("https://demoqa.com/text-box")
+        driver.get(demo_url("/text-box"))
         print("Navigated to DemoQA Text Box demo")
         
         print("\nFinding form elements...")
@@ -51,11 +46,12 @@ def demo_find_elements():
         
         print("\nElement Properties:")
         if 'name_field' in locals():
-            print(f"   Tag name: {name_field.tag_name}")
-            print(f"   Element size: {name_field.size}")
-            print(f"   Element location: {name_field.location}")
-            print(f"   Is displayed: {name_field.is_displayed()}")
-            print(f"   Is enabled: {name_field.is_enabled()}")
+            name_properties = snapshot(driver, name_field)
+            print(f"   Tag name: {name_properties.tag_name}")
+            print(f"   Element size: {name_properties.size}")
+            print(f"   Element location: {name_properties.location}")
+            print(f"   Is displayed: {name_properties.displayed}")
+            print(f"   Is enabled: {name_properties.enabled}")
         
         print("\nInteracting with form fields...")
         name_field.clear()
@@ -68,10 +64,9 @@ def demo_find_elements():
         
         time.sleep(2)
         
-        name_value = name_field.get_attribute("value")
-        email_value = email_field.get_attribute("value")
-        print(f"   Name field value: '{name_value}'")
-        print(f"   Email field value: '{email_value}'")
+        name_values, email_values = snapshot_many(driver, [name_field, email_field], properties=("value",))
+        print(f"   Name field value: '{name_values.value}'")
+        print(f"   Email field value: '{email_values.value}'")
         
         name_field.clear()
         email_field.clear()
@@ -85,7 +80,7 @@ def demo_find_elements():
         print(f"An error occurred: {str(e)}")
     
     finally:
-        if driver:
+        if driver and owns_driver:
             print("Closing browser...")
             driver.quit()
 
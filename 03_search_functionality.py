@@ -1,43 +1,68 @@
 #!/usr/bin/env python3
 
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import time
 import os
 
-def demo_search_functionality():
+from batch_lookup import find_many
+from browser_pool import launch_chrome
+from demo_settings import demo_url
+from dom_waits import wait_for_text
+from form_fill import fill_form
+
+TEXT_BOX_URL = demo_url("/text-box")
+
+TEXT_BOX_FIELDS = {
+    'name': (By.ID, "userName"),
+    'email': (By.ID, "userEmail"),
+    'current_address': (By.ID, "currentAddress"),
+    'permanent_address': (By.ID, "permanentAddress")
+}
+
+def submit_text_box(driver, form_data, fast_fill=False):
+    """Fill the text box form, submit it and return the #output element"""
+    fields = find_many(driver, dict(TEXT_BOX_FIELDS, submit=(By.ID, "submit")), timeout=10)
+    
+    if fast_fill:
+        fill_form(driver, form_data, fields)
+    else:
+        for key, value in form_data.items():
+            fields[key].clear()
+            fields[key].send_keys(value)
+    
+    fields['submit'].click()
+    
+    # #output exists before submitting, so wait for it to show what was sent
+    expected = next((value for value in form_data.values() if value), None)
+    if expected:
+        return wait_for_text(driver, (By.ID, "output"), expected)
+    WebDriverWait(driver, 10).until(
+        EC.presence_of_element_located((By.ID, "output"))
+    )
+    return driver.find_element(By.ID, "output")
+
+def check_output(output_text, form_data):
+    """Return which submitted values appear in the output text"""
+    return {key: value in output_text for key, value in form_data.items()}
+
+def demo_search_functionality(driver=None):
     print("Demo 3: Search Functionality and Results")
     print("=" * 45)
     
-    chrome_options = Options()
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    
-    service = Service(ChromeDriverManager().install())
-    driver = None
+    owns_driver = driver is None
     
     try:
-        print("Launching browser...")
-        driver = webdriver.Chrome(service=service, options=chrome_options)
+        if owns_driver:
+            print("Launching browser...")
+            driver = launch_chrome()
         driver.implicitly_wait(10)
         
-        driver.get("https://demoqa.com/text-box")
+        driver.get(TEXT_BOX_URL)
         print("Navigated to DemoQA Text Box demo")
         
-        print("\nFinding form fields...")
-        name_field = driver.find_element(By.ID, "userName")
-        email_field = driver.find_element(By.ID, "userEmail")
-        current_address = driver.find_element(By.ID, "currentAddress")
-        permanent_address = driver.find_element(By.ID, "permanentAddress")
-        submit_button = driver.find_element(By.ID, "submit")
-        
-        print("Filling out form with test data...")
+        print("\nFilling out form with test data...")
         form_data = {
             'name': 'Alex Johnson',
             'email': 'alex.johnson@testmail.com',
@@ -45,27 +70,9 @@ def demo_search_functionality():
             'permanent_address': '456 Oak Avenue, Town, State 67890'
         }
         
-        name_field.clear()
-        name_field.send_keys(form_data['name'])
-        
-        email_field.clear()
-        email_field.send_keys(form_data['email'])
-        
-        current_address.clear()
-        current_address.send_keys(form_data['current_address'])
+        print("Submitting form and waiting for results...")
+        output_div = submit_text_box(driver, form_data)
         
-        permanent_address.clear()
-        permanent_address.send_keys(form_data['permanent_address'])
-        
-        print("Submitting form...")
-        submit_button.click()
-        
-        print("Waiting for form submission results...")
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.ID, "output"))
-        )
-        
-        output_div = driver.find_element(By.ID, "output")
         if output_div.is_displayed():
             print("Form submitted successfully!")
             
@@ -73,8 +80,8 @@ def demo_search_functionality():
             print(f"Form submission output:")
             print(f"   {output_text}")
             
-            for key, value in form_data.items():
-                if value in output_text:
+            for key, found in check_output(output_text, form_data).items():
+                if found:
                     print(f"   {key}: Found in output")
                 else:
                     print(f"   {key}: Not found in output")
@@ -82,16 +89,13 @@ def demo_search_functionality():
         else:
             print("Form submission output not visible")
         
-        print("\nPausing to observe results...")
-        time.sleep(3)
-        
         print("\nDemo 3 completed successfully!")
         
     except Exception as e:
         print(f"An error occurred: {str(e)}")
     
     finally:
-        if driver:
+        if driver and owns_driver:
             print("Closing browser...")
             driver.quit()
 
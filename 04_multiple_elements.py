@@ -1,32 +1,27 @@
 #!/usr/bin/env python3
 
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
-import time
 
-def demo_multiple_elements():
+from browser_pool import launch_chrome
+from demo_settings import demo_url
+from dom_waits import wait_for_element, wait_for_text
+
+def demo_multiple_elements(driver=None):
     print("Demo 4: Working with Multiple Elements")
     print("=" * 45)
     
-    chrome_options = Options()
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    
-    service = Service(ChromeDriverManager().install())
-    driver = None
+    owns_driver = driver is None
     
     try:
-        print("Launching browser...")
-        driver = webdriver.Chrome(service=service, options=chrome_options)
+        if owns_driver:
+            print("Launching browser...")
+            driver = launch_chrome()
         driver.implicitly_wait(10)
         
-        driver.get("https://demoqa.com/elements")
+        driver.get(demo_url("/elements"))
         print("Navigated to DemoQA Elements page")
         
         print("\nTesting Text Box functionality...")
@@ -50,7 +45,7 @@ def demo_multiple_elements():
         print("Text Box test completed successfully")
         
         print("\nTesting Buttons functionality...")
-        driver.get("https://demoqa.com/buttons")
+        driver.get(demo_url("/buttons"))
         
         double_click_btn = WebDriverWait(driver, 10).until(
             EC.element_to_be_clickable((By.ID, "doubleClickBtn"))
@@ -62,20 +57,17 @@ def demo_multiple_elements():
         
         print("Performing double click...")
         actions.double_click(double_click_btn).perform()
-        time.sleep(1)
         
         print("Performing right click...")
         actions.context_click(right_click_btn).perform()
-        time.sleep(1)
         
         print("Performing single click...")
         click_me_btn.click()
-        time.sleep(1)
         
         try:
-            double_msg = driver.find_element(By.ID, "doubleClickMessage")
-            right_msg = driver.find_element(By.ID, "rightClickMessage")
-            click_msg = driver.find_element(By.ID, "dynamicClickMessage")
+            double_msg = wait_for_element(driver, (By.ID, "doubleClickMessage"), timeout=5)
+            right_msg = wait_for_element(driver, (By.ID, "rightClickMessage"), timeout=5)
+            click_msg = wait_for_element(driver, (By.ID, "dynamicClickMessage"), timeout=5)
             
             if double_msg.is_displayed():
                 print("Double click message: " + double_msg.text)
@@ -88,13 +80,13 @@ def demo_multiple_elements():
             print("Some button messages may not have appeared")
         
         print("\nTesting Checkbox functionality...")
-        driver.get("https://demoqa.com/checkbox")
+        driver.get(demo_url("/checkbox"))
         
         expand_all = WebDriverWait(driver, 10).until(
             EC.element_to_be_clickable((By.CSS_SELECTOR, "button[title='Expand all']"))
         )
         expand_all.click()
-        time.sleep(1)
+        wait_for_element(driver, (By.ID, "tree-node-desktop"), timeout=5)
         
         checkboxes = driver.find_elements(By.CSS_SELECTOR, "span.rct-checkbox")
         print(f"Found {len(checkboxes)} checkboxes")
@@ -103,30 +95,29 @@ def demo_multiple_elements():
             for i in range(min(3, len(checkboxes))):
                 try:
                     driver.execute_script("arguments[0].click();", checkboxes[i])
-                    time.sleep(0.5)
                 except:
                     continue
         
         try:
-            result_div = driver.find_element(By.ID, "result")
+            result_div = wait_for_element(driver, (By.ID, "result"), timeout=5)
             if result_div.is_displayed():
                 print("Checkbox selections recorded successfully")
         except:
             print("Checkbox results may not be visible")
         
         print("\nTesting Radio Buttons...")
-        driver.get("https://demoqa.com/radio-button")
+        driver.get(demo_url("/radio-button"))
         
         try:
             yes_radio = WebDriverWait(driver, 10).until(
                 EC.element_to_be_clickable((By.CSS_SELECTOR, "label[for='yesRadio']"))
             )
             yes_radio.click()
-            time.sleep(1)
+            wait_for_text(driver, (By.CSS_SELECTOR, "span.text-success"), "Yes", timeout=5)
             
             impressive_radio = driver.find_element(By.CSS_SELECTOR, "label[for='impressiveRadio']")
             impressive_radio.click()
-            time.sleep(1)
+            wait_for_text(driver, (By.CSS_SELECTOR, "span.text-success"), "Impressive", timeout=5)
             
             try:
                 result_span = driver.find_element(By.CSS_SELECTOR, "span.text-success")
@@ -143,7 +134,7 @@ def demo_multiple_elements():
         print(f"An error occurred: {str(e)}")
     
     finally:
-        if driver:
+        if driver and owns_driver:
             print("Closing browser...")
             driver.quit()
 
@@ -1,35 +1,32 @@
 #!/usr/bin/env python3
 
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
-import time
 import tempfile
 import os
 
-def demo_forms_and_inputs():
+from batch_lookup import find_many
+from browser_pool import launch_chrome
+from demo_settings import demo_url
+from dom_waits import wait_for_element, wait_for_text
+from form_fill import fill_form
+
+def demo_forms_and_inputs(driver=None):
     print("Demo 5: Forms and Input Handling")
     print("=" * 40)
     
-    chrome_options = Options()
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    
-    service = Service(ChromeDriverManager().install())
-    driver = None
+    owns_driver = driver is None
     
     try:
-        print("Launching browser...")
-        driver = webdriver.Chrome(service=service, options=chrome_options)
+        if owns_driver:
+            print("Launching browser...")
+            driver = launch_chrome()
         driver.implicitly_wait(10)
         
         print("Testing comprehensive form...")
-        driver.get("https://demoqa.com/automation-practice-form")
+        driver.get(demo_url("/automation-practice-form"))
         
         form_data = {
             'firstName': 'John',
@@ -39,17 +36,18 @@ def demo_forms_and_inputs():
             'address': '123 Test Street, Test City, TX 12345'
         }
         
-        first_name = driver.find_element(By.ID, "firstName")
-        first_name.send_keys(form_data['firstName'])
-        
-        last_name = driver.find_element(By.ID, "lastName")
-        last_name.send_keys(form_data['lastName'])
-        
-        email = driver.find_element(By.ID, "userEmail")
-        email.send_keys(form_data['email'])
+        fields = find_many(driver, {
+            'firstName': (By.ID, "firstName"),
+            'lastName': (By.ID, "lastName"),
+            'email': (By.ID, "userEmail"),
+            'mobile': (By.ID, "userNumber"),
+            'address': (By.ID, "currentAddress"),
+            'submit': (By.ID, "submit")
+        }, timeout=10)
         
-        mobile = driver.find_element(By.ID, "userNumber")
-        mobile.send_keys(form_data['mobile'])
+        fill_result = fill_form(driver, form_data, fields)
+        if fill_result['mismatches']:
+            print(f"Fields not filled as expected: {fill_result['mismatches']}")
         
         print("Selecting gender...")
         try:
@@ -108,34 +106,26 @@ def demo_forms_and_inputs():
         except:
             print("File upload may have failed")
         
-        address_field = driver.find_element(By.ID, "currentAddress")
-        address_field.send_keys(form_data['address'])
-        
         print("Selecting state and city...")
         try:
             state_dropdown = driver.find_element(By.ID, "state")
             state_dropdown.click()
-            time.sleep(1)
-            ncr_option = driver.find_element(By.XPATH, "//div[text()='NCR']")
+            ncr_option = wait_for_element(driver, (By.XPATH, "//div[text()='NCR']"), visible=True)
             ncr_option.click()
             
-            time.sleep(1)
+            wait_for_text(driver, (By.ID, "state"), "NCR")
             city_dropdown = driver.find_element(By.ID, "city")
             city_dropdown.click()
-            time.sleep(1)
-            delhi_option = driver.find_element(By.XPATH, "//div[text()='Delhi']")
+            delhi_option = wait_for_element(driver, (By.XPATH, "//div[text()='Delhi']"), visible=True)
             delhi_option.click()
         except:
             print("State/City selection may have failed")
         
         print("Submitting form...")
-        submit_button = driver.find_element(By.ID, "submit")
-        driver.execute_script("arguments[0].click();", submit_button)
-        
-        time.sleep(2)
+        driver.execute_script("arguments[0].click();", fields['submit'])
         
         try:
-            modal = driver.find_element(By.CSS_SELECTOR, ".modal-content")
+            modal = wait_for_element(driver, (By.CSS_SELECTOR, ".modal-content"), visible=True)
             if modal.is_displayed():
                 print("Form submitted successfully!")
                 close_button = driver.find_element(By.ID, "closeLargeModal")
@@ -146,7 +136,7 @@ def demo_forms_and_inputs():
             print("Form submission status unclear")
         
         print("\nTesting simple text box form...")
-        driver.get("https://demoqa.com/text-box")
+        driver.get(demo_url("/text-box"))
         
         simple_data = {
             "userName": "Simple Test User",
@@ -155,18 +145,12 @@ def demo_forms_and_inputs():
             "permanentAddress": "456 Permanent Ave"
         }
         
-        for field_id, value in simple_data.items():
-            field = driver.find_element(By.ID, field_id)
-            field.clear()
-            field.send_keys(value)
-        
-        submit_btn = driver.find_element(By.ID, "submit")
+        submit_btn = wait_for_element(driver, (By.ID, "submit"))
+        fill_form(driver, simple_data)
         submit_btn.click()
         
-        time.sleep(2)
-        
         try:
-            output = driver.find_element(By.ID, "output")
+            output = wait_for_text(driver, (By.ID, "output"), simple_data["userName"])
             if output.is_displayed():
                 print("Simple form submitted successfully!")
         except:
@@ -178,7 +162,7 @@ def demo_forms_and_inputs():
         print(f"An error occurred: {str(e)}")
     
     finally:
-        if driver:
+        if driver and owns_driver:
             print("Closing browser...")
             driver.quit()
 
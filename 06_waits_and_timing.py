@@ -1,33 +1,28 @@
 #!/usr/bin/env python3
 
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 import time
 
-def demo_waits_and_timing():
+from browser_pool import launch_chrome
+from demo_settings import demo_url
+
+def demo_waits_and_timing(driver=None):
     print("Demo 6: Wait Strategies and Timing")
     print("=" * 40)
     
-    chrome_options = Options()
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    
-    service = Service(ChromeDriverManager().install())
-    driver = None
+    owns_driver = driver is None
     
     try:
-        print("Launching browser...")
-        driver = webdriver.Chrome(service=service, options=chrome_options)
+        if owns_driver:
+            print("Launching browser...")
+            driver = launch_chrome()
         driver.implicitly_wait(10)
         
         print("Testing dynamic properties...")
-        driver.get("https://demoqa.com/dynamic-properties")
+        driver.get(demo_url("/dynamic-properties"))
         
         print("Waiting for elements to become enabled...")
         wait = WebDriverWait(driver, 10)
@@ -51,7 +46,7 @@ def demo_waits_and_timing():
             print("Visible after button timeout")
         
         print("\nTesting progress bar...")
-        driver.get("https://demoqa.com/progress-bar")
+        driver.get(demo_url("/progress-bar"))
         
         start_button = driver.find_element(By.ID, "startStopButton")
         start_button.click()
@@ -67,7 +62,7 @@ def demo_waits_and_timing():
             print("Progress bar did not complete in time")
         
         print("\nTesting alerts with timing...")
-        driver.get("https://demoqa.com/alerts")
+        driver.get(demo_url("/alerts"))
         
         timer_alert_button = driver.find_element(By.ID, "timerAlertButton")
         timer_alert_button.click()
@@ -82,7 +77,7 @@ def demo_waits_and_timing():
             print("Timer alert did not appear")
         
         print("\nTesting text box with waits...")
-        driver.get("https://demoqa.com/text-box")
+        driver.get(demo_url("/text-box"))
         
         name_field = wait.until(EC.presence_of_element_located((By.ID, "userName")))
         name_field.send_keys("Wait Strategy Test")
@@ -102,7 +97,7 @@ def demo_waits_and_timing():
         print(f"An error occurred: {str(e)}")
     
     finally:
-        if driver:
+        if driver and owns_driver:
             print("Closing browser...")
             driver.quit()
 
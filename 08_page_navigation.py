@@ -1,40 +1,36 @@
 #!/usr/bin/env python3
 
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import time
 
-def demo_page_navigation():
+from browser_pool import launch_chrome
+from demo_settings import demo_url
+from page_metrics import MetricsCollector, format_metrics, format_violation
+
+def demo_page_navigation(driver=None):
     print("Demo 8: Page Navigation and Browser Controls")
     print("=" * 45)
     
-    chrome_options = Options()
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    
-    service = Service(ChromeDriverManager().install())
-    driver = None
+    owns_driver = driver is None
     
     try:
-        print("Launching browser...")
-        driver = webdriver.Chrome(service=service, options=chrome_options)
+        if owns_driver:
+            print("Launching browser...")
+            driver = launch_chrome()
         driver.implicitly_wait(10)
         
         print("Starting navigation tests...")
-        driver.get("https://demoqa.com/")
+        driver.get(demo_url("/"))
         print(f"Initial page: {driver.title}")
         
         print("\nNavigating to Elements section...")
-        driver.get("https://demoqa.com/elements")
+        driver.get(demo_url("/elements"))
         print(f"Current page: {driver.title}")
         
         print("Navigating to Forms section...")
-        driver.get("https://demoqa.com/automation-practice-form")
+        driver.get(demo_url("/automation-practice-form"))
         print(f"Current page: {driver.title}")
         
         print("Testing browser back navigation...")
@@ -54,7 +50,7 @@ def demo_page_navigation():
         print(f"Original window handle: {original_window}")
         
         print("Opening new tab...")
-        driver.get("https://demoqa.com/browser-windows")
+        driver.get(demo_url("/browser-windows"))
         
         new_tab_button = WebDriverWait(driver, 10).until(
             EC.element_to_be_clickable((By.ID, "tabButton"))
@@ -98,10 +94,13 @@ def demo_page_navigation():
         driver.switch_to.window(original_window)
         
         print("\nTesting performance and page metrics...")
-        start_time = time.time()
-        driver.get("https://demoqa.com/text-box")
-        load_time = time.time() - start_time
-        print(f"Page load time: {load_time:.2f} seconds")
+        page_metrics = MetricsCollector(driver, budgets=["/text-box DOMContentLoaded < 1.5s", "* CLS < 0.1"])
+        driver.get(demo_url("/text-box"))
+        metrics = page_metrics.collect()
+        if metrics:
+            print(f"Page metrics: {format_metrics(metrics)}")
+        for violation in page_metrics.violations:
+            print(f"Budget exceeded: {format_violation(violation)}")
         
         page_size = len(driver.page_source)
         print(f"Page source size: {page_size} characters")
@@ -146,7 +145,7 @@ def demo_page_navigation():
         print(f"An error occurred: {str(e)}")
     
     finally:
-        if driver:
+        if driver and owns_driver:
             print("Closing browser...")
             driver.quit()
 
@@ -1,9 +1,5 @@
 #!/usr/bin/env python3
 
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -11,33 +7,38 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import time
 import os
 
-def demo_screenshots_and_debugging():
+from batch_lookup import find_many
+from browser_pool import default_chrome_options, launch_chrome
+from demo_settings import baseline_dir, demo_url, screenshots_dir as demo_screenshots_dir
+from element_capture import capture_elements
+from performance_log import PerformanceLogPipeline, enable_performance_log
+from screenshot_sink import ScreenshotSink
+
+def demo_screenshots_and_debugging(driver=None):
     print("Demo 9: Screenshots and Debugging Techniques")
     print("=" * 45)
     
-    chrome_options = Options()
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    
-    service = Service(ChromeDriverManager().install())
-    driver = None
+    owns_driver = driver is None
+    screenshots = ScreenshotSink()
     
     try:
-        print("Launching browser...")
-        driver = webdriver.Chrome(service=service, options=chrome_options)
+        if owns_driver:
+            print("Launching browser...")
+            driver = launch_chrome(enable_performance_log(default_chrome_options()))
         driver.implicitly_wait(10)
         
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        screenshots_dir = os.path.join(current_dir, "screenshots")
-        os.makedirs(screenshots_dir, exist_ok=True)
+        # Drained after every page so Chrome's log buffer never grows large
+        network = PerformanceLogPipeline(driver)
+        
+        screenshots_dir = demo_screenshots_dir()
         
         timestamp = time.strftime("%Y%m%d_%H%M%S")
         
         print("Taking initial screenshot...")
-        driver.get("https://demoqa.com/text-box")
+        driver.get(demo_url("/text-box"))
         
         screenshot_path = os.path.join(screenshots_dir, f"demoqa_textbox_{timestamp}.png")
-        driver.save_screenshot(screenshot_path)
+        screenshots.save(driver, screenshot_path)
         print(f"Screenshot saved: {screenshot_path}")
         
         print("\nDemonstrating successful form interaction...")
@@ -48,9 +49,24 @@ def demo_screenshots_and_debugging():
         email_field.send_keys("debug@test.com")
         
         before_submit_path = os.path.join(screenshots_dir, f"form_filled_{timestamp}.png")
-        driver.save_screenshot(before_submit_path)
+        screenshots.save(driver, before_submit_path)
         print(f"Form filled screenshot: {before_submit_path}")
         
+        print("Capturing form elements from a single screenshot...")
+        form_parts = find_many(driver, {
+            'form': (By.ID, "userForm"),
+            'name': (By.ID, "userName"),
+            'email': (By.ID, "userEmail")
+        })
+        crops = capture_elements(driver, form_parts.values())
+        for part, png_bytes in zip(form_parts, crops):
+            if png_bytes is None:
+                print(f"Element {part} is outside the viewport, skipped")
+                continue
+            element_path = os.path.join(screenshots_dir, f"element_{part}_{timestamp}.png")
+            screenshots.submit(png_bytes, element_path)
+            print(f"Element screenshot: {element_path}")
+        
         submit_button = driver.find_element(By.ID, "submit")
         submit_button.click()
         
@@ -60,12 +76,12 @@ def demo_screenshots_and_debugging():
             )
             
             success_path = os.path.join(screenshots_dir, f"form_submitted_{timestamp}.png")
-            driver.save_screenshot(success_path)
+            screenshots.save(driver, success_path)
             print(f"Success screenshot: {success_path}")
             
         except TimeoutException:
             timeout_path = os.path.join(screenshots_dir, f"timeout_debug_{timestamp}.png")
-            driver.save_screenshot(timeout_path)
+            screenshots.save(driver, timeout_path)
             print(f"Timeout debug screenshot: {timeout_path}")
         
         print("\nDemonstrating error handling...")
@@ -74,14 +90,15 @@ def demo_screenshots_and_debugging():
         except NoSuchElementException:
             print("Element not found (expected behavior)")
             error_path = os.path.join(screenshots_dir, f"no_element_debug_{timestamp}.png")
-            driver.save_screenshot(error_path)
+            screenshots.save(driver, error_path)
             print(f"Error debug screenshot: {error_path}")
         
         print("\nTesting dynamic properties page...")
-        driver.get("https://demoqa.com/dynamic-properties")
+        network.drain()
+        driver.get(demo_url("/dynamic-properties"))
         
         before_dynamic_path = os.path.join(screenshots_dir, f"before_dynamic_{timestamp}.png")
-        driver.save_screenshot(before_dynamic_path)
+        screenshots.save(driver, before_dynamic_path)
         print(f"Before dynamic changes: {before_dynamic_path}")
         
         print("Waiting for dynamic button to become enabled...")
@@ -91,17 +108,18 @@ def demo_screenshots_and_debugging():
             )
             
             enabled_path = os.path.join(screenshots_dir, f"button_enabled_{timestamp}.png")
-            driver.save_screenshot(enabled_path)
+            screenshots.save(driver, enabled_path)
             print(f"Button enabled screenshot: {enabled_path}")
             
         except TimeoutException:
             print("Button did not become enabled in time")
         
         print("\nTesting broken links page...")
-        driver.get("https://demoqa.com/broken")
+        network.drain()
+        driver.get(demo_url("/broken"))
         
         before_broken_path = os.path.join(screenshots_dir, f"before_broken_link_{timestamp}.png")
-        driver.save_screenshot(before_broken_path)
+        screenshots.save(driver, before_broken_path)
         print(f"Before clicking broken link: {before_broken_path}")
         
         try:
@@ -110,17 +128,18 @@ def demo_screenshots_and_debugging():
             time.sleep(3)
             
             after_broken_path = os.path.join(screenshots_dir, f"after_broken_link_{timestamp}.png")
-            driver.save_screenshot(after_broken_path)
+            screenshots.save(driver, after_broken_path)
             print(f"After broken link click: {after_broken_path}")
             
         except Exception as e:
             print(f"Broken link test issue: {e}")
         
         print("\nTesting elements page for debugging...")
-        driver.get("https://demoqa.com/elements")
+        network.drain()
+        driver.get(demo_url("/elements"))
         
         elements_path = os.path.join(screenshots_dir, f"elements_page_{timestamp}.png")
-        driver.save_screenshot(elements_path)
+        screenshots.save(driver, elements_path)
         print(f"Elements page screenshot: {elements_path}")
         
         try:
@@ -128,18 +147,18 @@ def demo_screenshots_and_debugging():
             text_box_link.click()
             
             element_clicked_path = os.path.join(screenshots_dir, f"form_element_{timestamp}.png")
-            driver.save_screenshot(element_clicked_path)
+            screenshots.save(driver, element_clicked_path)
             print(f"Form element clicked: {element_clicked_path}")
             
         except Exception as e:
             print(f"Element click issue: {e}")
             error_element_path = os.path.join(screenshots_dir, f"form_error_{timestamp}.png")
-            driver.save_screenshot(error_element_path)
+            screenshots.save(driver, error_element_path)
             print(f"Form error screenshot: {error_element_path}")
         
         print("\nGenerating final debug report...")
         final_path = os.path.join(screenshots_dir, f"final_state_{timestamp}.png")
-        driver.save_screenshot(final_path)
+        screenshots.save(driver, final_path)
         print(f"Final state screenshot: {final_path}")
         
         print("\nDebug information:")
@@ -148,9 +167,20 @@ def demo_screenshots_and_debugging():
         print(f"Window size: {driver.get_window_size()}")
         print(f"Cookies count: {len(driver.get_cookies())}")
         
+        network.print_summary()
+        
+        screenshots.flush()
         all_screenshots = [f for f in os.listdir(screenshots_dir) if f.endswith('.png') and timestamp in f]
         print(f"\nGenerated {len(all_screenshots)} screenshots for debugging")
         
+        if baseline_dir():
+            from visual_diff import VisualBaseline, print_result
+            
+            print("\nComparing screenshots against baselines...")
+            baselines = VisualBaseline(baseline_dir())
+            for filename in sorted(all_screenshots):
+                print_result(baselines.compare_file(os.path.join(screenshots_dir, filename)))
+        
         print("\nDemo 9 completed successfully!")
         
     except Exception as e:
@@ -159,13 +189,14 @@ def demo_screenshots_and_debugging():
         if driver:
             error_final_path = os.path.join(screenshots_dir, f"error_final_{timestamp}.png")
             try:
-                driver.save_screenshot(error_final_path)
+                screenshots.save(driver, error_final_path)
                 print(f"Error final screenshot: {error_final_path}")
             except:
                 print("Could not capture error screenshot")
     
     finally:
-        if driver:
+        screenshots.close()
+        if driver and owns_driver:
             print("Closing browser...")
             driver.quit()
 
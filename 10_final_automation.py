@@ -1,9 +1,5 @@
 #!/usr/bin/env python3
 
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
@@ -14,30 +10,30 @@ import time
 import os
 import tempfile
 
-def demo_complete_automation():
+from batch_lookup import find_many
+from browser_pool import launch_chrome
+from dom_waits import wait_for_element, wait_for_text
+from form_fill import fill_form
+from demo_settings import demo_url, screenshots_dir as demo_screenshots_dir
+
+def demo_complete_automation(driver=None):
     print("Demo 10: Complete Automation Workflow")
     print("=" * 40)
     
-    chrome_options = Options()
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    
-    service = Service(ChromeDriverManager().install())
-    driver = None
+    owns_driver = driver is None
     
     try:
-        print("Launching browser...")
-        driver = webdriver.Chrome(service=service, options=chrome_options)
+        if owns_driver:
+            print("Launching browser...")
+            driver = launch_chrome()
         driver.implicitly_wait(10)
         wait = WebDriverWait(driver, 10)
         
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        screenshots_dir = os.path.join(current_dir, "screenshots")
-        os.makedirs(screenshots_dir, exist_ok=True)
+        screenshots_dir = demo_screenshots_dir()
         timestamp = time.strftime("%Y%m%d_%H%M%S")
         
         print("Testing comprehensive form automation...")
-        driver.get("https://demoqa.com/automation-practice-form")
+        driver.get(demo_url("/automation-practice-form"))
         
         form_title = wait.until(EC.presence_of_element_located((By.CLASS_NAME, "main-header")))
         print(f"Page loaded: {form_title.text}")
@@ -51,17 +47,18 @@ def demo_complete_automation():
         }
         
         print("Filling basic information...")
-        first_name = driver.find_element(By.ID, "firstName")
-        first_name.send_keys(test_data["firstName"])
-        
-        last_name = driver.find_element(By.ID, "lastName")
-        last_name.send_keys(test_data["lastName"])
-        
-        email = driver.find_element(By.ID, "userEmail")
-        email.send_keys(test_data["email"])
-        
-        mobile = driver.find_element(By.ID, "userNumber")
-        mobile.send_keys(test_data["mobile"])
+        fields = find_many(driver, {
+            "firstName": (By.ID, "firstName"),
+            "lastName": (By.ID, "lastName"),
+            "email": (By.ID, "userEmail"),
+            "mobile": (By.ID, "userNumber"),
+            "address": (By.ID, "currentAddress"),
+            "submit": (By.ID, "submit")
+        })
+        
+        fill_result = fill_form(driver, test_data, fields)
+        if fill_result["mismatches"]:
+            print(f"Fields not filled as expected: {fill_result['mismatches']}")
         
         print("Selecting gender...")
         try:
@@ -98,7 +95,7 @@ def demo_complete_automation():
             for subject in subjects:
                 subjects_field.click()
                 subjects_field.send_keys(subject)
-                time.sleep(1)
+                wait_for_element(driver, (By.CSS_SELECTOR, ".subjects-auto-complete__option"), visible=True)
                 subjects_field.send_keys(Keys.TAB)
         except Exception as e:
             print(f"Subjects adding issue: {e}")
@@ -129,24 +126,19 @@ def demo_complete_automation():
         except Exception as e:
             print(f"File upload issue: {e}")
         
-        address_field = driver.find_element(By.ID, "currentAddress")
-        address_field.send_keys(test_data["address"])
-        
         print("Selecting state and city...")
         try:
             state_dropdown = driver.find_element(By.ID, "state")
             state_dropdown.click()
-            time.sleep(1)
             
-            ncr_option = driver.find_element(By.XPATH, "//div[text()='NCR']")
+            ncr_option = wait_for_element(driver, (By.XPATH, "//div[text()='NCR']"), visible=True)
             ncr_option.click()
             
-            time.sleep(1)
+            wait_for_text(driver, (By.ID, "state"), "NCR")
             city_dropdown = driver.find_element(By.ID, "city")
             city_dropdown.click()
-            time.sleep(1)
             
-            delhi_option = driver.find_element(By.XPATH, "//div[text()='Delhi']")
+            delhi_option = wait_for_element(driver, (By.XPATH, "//div[text()='Delhi']"), visible=True)
             delhi_option.click()
         except Exception as e:
             print(f"State/City selection issue: {e}")
@@ -156,13 +148,10 @@ def demo_complete_automation():
         print(f"Screenshot saved: {screenshot_path}")
         
         print("Submitting form...")
-        submit_button = driver.find_element(By.ID, "submit")
-        driver.execute_script("arguments[0].click();", submit_button)
-        
-        time.sleep(2)
+        driver.execute_script("arguments[0].click();", fields["submit"])
         
         try:
-            modal = driver.find_element(By.CSS_SELECTOR, ".modal-content")
+            modal = wait_for_element(driver, (By.CSS_SELECTOR, ".modal-content"), visible=True)
             if modal.is_displayed():
                 print("Form submitted successfully!")
                 
@@ -183,7 +172,7 @@ def demo_complete_automation():
             print(f"Modal handling issue: {e}")
         
         print("\nTesting simple form for comparison...")
-        driver.get("https://demoqa.com/text-box")
+        driver.get(demo_url("/text-box"))
         
         simple_data = {
             "userName": "Test User Final",
@@ -192,17 +181,13 @@ def demo_complete_automation():
             "permanentAddress": "456 Permanent Avenue"
         }
         
-        for field_id, value in simple_data.items():
-            field = driver.find_element(By.ID, field_id)
-            field.clear()
-            field.send_keys(value)
+        fill_form(driver, simple_data)
         
         submit_btn = driver.find_element(By.ID, "submit")
         submit_btn.click()
-        time.sleep(2)
         
         try:
-            output = driver.find_element(By.ID, "output")
+            output = wait_for_text(driver, (By.ID, "output"), simple_data["userName"])
             if output.is_displayed():
                 print("Simple form submitted with output displayed")
                 
@@ -212,7 +197,7 @@ def demo_complete_automation():
             print("Simple form output not found")
         
         print("\nTesting multiple element interactions...")
-        driver.get("https://demoqa.com/elements")
+        driver.get(demo_url("/elements"))
         
         text_box_link = wait.until(EC.element_to_be_clickable((By.XPATH, "//span[text()='Text Box']")))
         text_box_link.click()
@@ -222,10 +207,13 @@ def demo_complete_automation():
         
         submit_button = driver.find_element(By.ID, "submit")
         submit_button.click()
-        time.sleep(1)
+        try:
+            wait_for_text(driver, (By.ID, "output"), "Multi Test User", timeout=5)
+        except TimeoutException:
+            print("Text box output did not appear")
         
         print("Testing buttons...")
-        driver.get("https://demoqa.com/buttons")
+        driver.get(demo_url("/buttons"))
         
         double_click_btn = wait.until(EC.element_to_be_clickable((By.ID, "doubleClickBtn")))
         actions = ActionChains(driver)
@@ -238,7 +226,7 @@ def demo_complete_automation():
         click_me_btn.click()
         
         print("Testing alerts...")
-        driver.get("https://demoqa.com/alerts")
+        driver.get(demo_url("/alerts"))
         
         alert_btn = wait.until(EC.element_to_be_clickable((By.ID, "alertButton")))
         alert_btn.click()
@@ -270,7 +258,7 @@ def demo_complete_automation():
         print(f"An error occurred: {str(e)}")
     
     finally:
-        if driver:
+        if driver and owns_driver:
             print("Closing browser...")
             driver.quit()
 
@@ -23,7 +23,6 @@ Learning Objectives:
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait, Select
@@ -32,10 +31,19 @@ from selenium.webdriver.common.action_chains import ActionChains
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 import time
 import os
-import json
 import tempfile
 from datetime import datetime
 
+from command_timing import instrument_from_env
+from demo_settings import demo_url
+from driver_resolver import resolve_chromedriver
+from event_log import EventWriter, summarize_events, write_report
+from page_metrics import MetricsCollector, format_violation
+from performance_log import PerformanceLogPipeline, enable_performance_log
+from request_blocking import apply_blocking, parse_rules, rules_from_env
+from screenshot_sink import ScreenshotSink
+from screenshot_store import ScreenshotStore
+
 class SeleniumAutomationFramework:
     """Complete Selenium automation framework demonstrating best practices"""
     
@@ -43,20 +51,32 @@ class SeleniumAutomationFramework:
         self.driver = None
         self.wait = None
         self.results = {
-            'test_results': [],
             'start_time': datetime.now().isoformat(),
             'end_time': None,
             'total_tests': 0,
             'passed_tests': 0,
-            'failed_tests': 0,
-            'screenshots': []
+            'failed_tests': 0
         }
         self.current_dir = os.path.dirname(os.path.abspath(__file__))
         self.screenshots_dir = os.path.join(self.current_dir, "screenshots")
         self.headless = headless
+        self.screenshot_sink = ScreenshotSink()
+        self.command_recorder = None
+        self._commands_logged = 0
+        self.page_metrics = None
+        self.network = None
         
         # Ensure screenshots directory exists
         os.makedirs(self.screenshots_dir, exist_ok=True)
+        
+        # Identical captures share one stored PNG; blobs are written in the background
+        self.screenshot_store = ScreenshotStore(root=self.screenshots_dir, sink=self.screenshot_sink)
+        
+        # Results and screenshots are streamed to disk as they happen, so a crash keeps them
+        self.run_id = datetime.now().strftime('%Y%m%d_%H%M%S')
+        self.events_path = os.path.join(self.current_dir, f"test_events_{self.run_id}.jsonl")
+        self.events = EventWriter(self.events_path)
+        self.events.write('run_started', start_time=self.results['start_time'])
     
     def setup_driver(self):
         """Initialize the Chrome WebDriver with optimal settings"""
@@ -74,12 +94,23 @@ class SeleniumAutomationFramework:
             chrome_options.add_argument("--window-size=1920,1080")
             chrome_options.add_argument("--disable-extensions")
             chrome_options.add_argument("--disable-plugins")
-            chrome_options.add_argument("--disable-images")
+            enable_performance_log(chrome_options)
             
-            service = Service(ChromeDriverManager().install())
+            service = Service(resolve_chromedriver())
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
             self.wait = WebDriverWait(self.driver, 10)
             
+            # Chrome ignores --disable-images, so images are blocked over CDP instead;
+            # SELENIUM_DEMO_BLOCK (e.g. "ads,Image") replaces the default rules
+            apply_blocking(self.driver, rules_from_env() or parse_rules("Image"))
+            self.network = PerformanceLogPipeline(self.driver)
+            
+            # Opt-in per-command timing (set SELENIUM_DEMO_TIMING_DIR)
+            self.command_recorder = instrument_from_env(self.driver, "10_final_automation_new")
+            
+            # Every page opened through open_page() is measured against these budgets
+            self.page_metrics = MetricsCollector(self.driver, budgets=["* CLS < 0.25", "* LCP < 4s"])
+            
             print("✅ Chrome WebDriver initialized successfully")
             return True
             
@@ -90,26 +121,30 @@ class SeleniumAutomationFramework:
     def take_screenshot(self, name, description=""):
         """Take a screenshot and save it with a descriptive name"""
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{timestamp}_{name}.png"
-            filepath = os.path.join(self.screenshots_dir, filename)
-            
-            self.driver.save_screenshot(filepath)
+            reference = self.screenshot_store.capture(self.driver, name, description)
             
-            self.results['screenshots'].append({
-                'name': name,
-                'description': description,
-                'filepath': filepath,
-                'timestamp': timestamp
-            })
+            self.events.write('screenshot',
+                name=name,
+                description=description,
+                filepath=reference['filepath'],
+                timestamp=reference['timestamp'],
+                digest=reference['digest']
+            )
             
-            print(f"📸 Screenshot saved: {filename} - {description}")
-            return filepath
+            status = "unchanged, reused" if reference['duplicate'] else "saved"
+            print(f"📸 Screenshot {status}: {name} ({reference['digest'][:12]}) - {description}")
+            return reference['filepath']
             
         except Exception as e:
             print(f"⚠️ Screenshot failed: {e}")
             return None
     
+    def open_page(self, url, *budgets):
+        """Navigate to url, then collect page metrics and check the test's budgets"""
+        self.network.drain()
+        self.driver.get(url)
+        return self.page_metrics.collect(budgets)
+    
     def log_test_result(self, test_name, status, details="", execution_time=0):
         """Log test results for reporting"""
         result = {
@@ -120,7 +155,14 @@ class SeleniumAutomationFramework:
             'timestamp': datetime.now().isoformat()
         }
         
-        self.results['test_results'].append(result)
+        if self.command_recorder:
+            result['webdriver_commands'] = self.command_recorder.total_commands - self._commands_logged
+            self._commands_logged = self.command_recorder.total_commands
+        
+        if self.page_metrics:
+            result['page_metrics'], result['budget_violations'] = self.page_metrics.drain()
+        
+        self.events.write('test_result', **result)
         self.results['total_tests'] += 1
         
         if status == 'PASSED':
@@ -132,6 +174,9 @@ class SeleniumAutomationFramework:
         
         if details:
             print(f"   📝 {details}")
+        
+        for violation in result.get('budget_violations', []):
+            print(f"   🐢 Budget exceeded: {format_violation(violation)}")
     
     def test_comprehensive_form_automation(self):
         """Test comprehensive form filling using DemoQA practice form"""
@@ -142,7 +187,8 @@ class SeleniumAutomationFramework:
             print("\n🎯 Testing comprehensive form automation...")
             
             # Navigate to DemoQA Automation Practice Form
-            self.driver.get("https://demoqa.com/automation-practice-form")
+            self.open_page(demo_url("/automation-practice-form"),
+                           "/automation-practice-form DOMContentLoaded < 3s")
             self.take_screenshot("form_loaded", "Practice form loaded")
             
             # Wait for form to load
@@ -345,7 +391,7 @@ class SeleniumAutomationFramework:
             print("\n🎯 Testing multi-element interactions...")
             
             # Navigate to Elements page
-            self.driver.get("https://demoqa.com/elements")
+            self.open_page(demo_url("/elements"), "/elements DOMContentLoaded < 2s")
             self.take_screenshot("elements_page", "Elements page loaded")
             
             # Test Text Box
@@ -381,7 +427,7 @@ class SeleniumAutomationFramework:
             
             # Test Buttons
             print("🔘 Testing Buttons...")
-            self.driver.get("https://demoqa.com/buttons")
+            self.open_page(demo_url("/buttons"), "/buttons FCP < 1.5s")
             
             # Double click
             double_click_btn = self.wait.until(EC.element_to_be_clickable((By.ID, "doubleClickBtn")))
@@ -423,7 +469,7 @@ class SeleniumAutomationFramework:
             
             # Test Alerts
             print("⚠️ Testing Alerts...")
-            self.driver.get("https://demoqa.com/alerts")
+            self.open_page(demo_url("/alerts"), "/alerts DOMContentLoaded < 2s")
             self.take_screenshot("alerts_page", "Alerts page loaded")
             
             # Simple alert
@@ -447,7 +493,7 @@ class SeleniumAutomationFramework:
             
             # Test Browser Windows
             print("🪟 Testing Browser Windows...")
-            self.driver.get("https://demoqa.com/browser-windows")
+            self.open_page(demo_url("/browser-windows"), "/browser-windows Load < 4s")
             
             # Open new tab
             new_tab_btn = self.wait.until(EC.element_to_be_clickable((By.ID, "tabButton")))
@@ -491,47 +537,41 @@ class SeleniumAutomationFramework:
         print("\n📊 Generating test report...")
         
         self.results['end_time'] = datetime.now().isoformat()
+        self.events.write('run_finished', end_time=self.results['end_time'])
         
-        # Calculate summary statistics
-        total_time = sum([result['execution_time'] for result in self.results['test_results']])
-        success_rate = (self.results['passed_tests'] / self.results['total_tests'] * 100) if self.results['total_tests'] > 0 else 0
-        
-        # Create report
-        report = {
-            'summary': {
-                'total_tests': self.results['total_tests'],
-                'passed_tests': self.results['passed_tests'],
-                'failed_tests': self.results['failed_tests'],
-                'success_rate': f"{success_rate:.1f}%",
-                'total_execution_time': f"{total_time:.2f}s",
-                'start_time': self.results['start_time'],
-                'end_time': self.results['end_time']
-            },
-            'test_results': self.results['test_results'],
-            'screenshots': self.results['screenshots']
-        }
-        
-        # Save report to file
+        # Stream the event log into the report file instead of holding every result in memory
         report_file = os.path.join(self.current_dir, f"test_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
         
+        summary = None
         try:
-            with open(report_file, 'w') as f:
-                json.dump(report, f, indent=2)
+            summary = write_report(self.events_path, report_file)
             print(f"📄 Report saved: {report_file}")
         except Exception as e:
             print(f"⚠️ Report save failed: {e}")
+            # The summary only needs the event log, so it is still printed without a report file
+            try:
+                summary = summarize_events(self.events_path)
+            except Exception as e:
+                print(f"⚠️ Event log unreadable, no summary: {e}")
         
         # Print summary
-        print("\n" + "="*50)
-        print("🎯 AUTOMATION TEST SUMMARY")
-        print("="*50)
-        print(f"📊 Total Tests: {self.results['total_tests']}")
-        print(f"✅ Passed: {self.results['passed_tests']}")
-        print(f"❌ Failed: {self.results['failed_tests']}")
-        print(f"📈 Success Rate: {success_rate:.1f}%")
-        print(f"⏱️  Total Time: {total_time:.2f}s")
-        print(f"📸 Screenshots: {len(self.results['screenshots'])}")
-        print("="*50)
+        if summary:
+            print("\n" + "="*50)
+            print("🎯 AUTOMATION TEST SUMMARY")
+            print("="*50)
+            print(f"📊 Total Tests: {summary['total_tests']}")
+            print(f"✅ Passed: {summary['passed_tests']}")
+            print(f"❌ Failed: {summary['failed_tests']}")
+            print(f"📈 Success Rate: {summary['success_rate']}")
+            print(f"⏱️  Total Time: {summary['total_execution_time']}")
+            print(f"📸 Screenshots: {summary['screenshots']}")
+            print("="*50)
+        
+        if self.network:
+            self.network.print_summary()
+        
+        if self.command_recorder:
+            self.command_recorder.print_summary(top_n=5)
     
     def run_complete_automation_suite(self):
         """Run the complete automation test suite"""
@@ -575,6 +615,9 @@ class SeleniumAutomationFramework:
             
         finally:
             # Cleanup
+            self.screenshot_store.close()
+            self.screenshot_sink.close()
+            self.events.close()
             if self.driver:
                 print("\n🧹 Cleaning up resources...")
                 self.driver.quit()
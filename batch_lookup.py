@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Batch Lookup
+============
+Resolve a whole dictionary of locators in a single script round trip
+instead of one find_element request per field
+"""
+
+from selenium.common.exceptions import NoSuchElementException
+
+from dom_waits import locator_spec, script_timeout
+
+FIND_MANY_SCRIPT = """
+var specs = arguments[0], timeoutMs = arguments[1], done = arguments[arguments.length - 1];
+
+function find(spec) {
+    if (spec.xpath) {
+        return document.evaluate(spec.xpath, document, null,
+            XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    }
+    return document.querySelector(spec.css);
+}
+
+function resolve() {
+    var found = {}, missing = [];
+    for (var name in specs) {
+        var el = find(specs[name]);
+        if (el) { found[name] = el; } else { missing.push(name); }
+    }
+    return {found: found, missing: missing};
+}
+
+var result = resolve();
+if (!result.missing.length || timeoutMs <= 0) { done(result); return; }
+
+var timer = null;
+var observer = new MutationObserver(function() {
+    var next = resolve();
+    if (!next.missing.length) {
+        observer.disconnect();
+        clearTimeout(timer);
+        done(next);
+    }
+});
+observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true});
+timer = setTimeout(function() {
+    observer.disconnect();
+    done(resolve());
+}, timeoutMs);
+"""
+
+def find_many(driver, locators, timeout=0, required=True):
+    """Find every (By, value) locator in one round trip and return elements keyed by name"""
+    specs = {name: locator_spec(locator) for name, locator in locators.items()}
+    with script_timeout(driver, timeout):
+        result = driver.execute_async_script(FIND_MANY_SCRIPT, specs, int(timeout * 1000))
+    
+    elements = dict(result.get('found') or {})
+    missing = result.get('missing') or []
+    
+    # Report every missing locator at once rather than failing on the first
+    if missing and required:
+        details = ", ".join(f"{name} {locators[name]}" for name in missing)
+        raise NoSuchElementException(f"Could not locate {len(missing)} element(s): {details}")
+    
+    for name in missing:
+        elements[name] = None
+    return elements
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Browser Pool
+============
+Shared Chrome setup for the demos plus a pool of pre-launched browsers,
+so an in-process run pays browser startup once per worker instead of once per demo
+"""
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import NoAlertPresentException, WebDriverException
+
+from command_timing import instrument_from_env
+from demo_settings import chrome_profile_dir, dry_run_source
+from driver_resolver import resolve_chromedriver
+from performance_log import enable_performance_log
+from request_blocking import apply_blocking, rules_from_env
+from session_replay import record_from_env
+
+BLANK_PAGE = "about:blank"
+
+def default_chrome_options():
+    """Build the Chrome options every demo launches with"""
+    chrome_options = Options()
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    
+    profile_dir = chrome_profile_dir()
+    if profile_dir:
+        chrome_options.add_argument(f"--user-data-dir={profile_dir}")
+    return chrome_options
+
+def launch_chrome(chrome_options=None, instrument=True, block=True):
+    """Launch a Chrome WebDriver with the shared demo settings"""
+    if dry_run_source():
+        # Dry runs (SELENIUM_DEMO_DRY_RUN) answer lookups from page snapshots; no browser starts
+        from dry_dom import driver_from_env
+        return driver_from_env()
+    
+    if chrome_options is None:
+        chrome_options = default_chrome_options()
+    
+    # Opt-in request blocking (set SELENIUM_DEMO_BLOCK); the performance log
+    # lets network summaries report what was blocked on each page
+    rules = rules_from_env() if block else None
+    if rules:
+        enable_performance_log(chrome_options)
+    
+    service = Service(resolve_chromedriver())
+    driver = webdriver.Chrome(service=service, options=chrome_options)
+    if rules:
+        apply_blocking(driver, rules)
+    if instrument:
+        instrument_from_env(driver)
+        record_from_env(driver)
+    return driver
+
+def reset_driver(driver):
+    """Clear cookies, storage and extra windows so the next lease starts clean"""
+    try:
+        driver.switch_to.alert.dismiss()
+    except NoAlertPresentException:
+        pass
+    
+    handles = driver.window_handles
+    main_window = handles[0]
+    for handle in handles[1:]:
+        driver.switch_to.window(handle)
+        driver.close()
+    driver.switch_to.window(main_window)
+    
+    try:
+        driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+    except WebDriverException:
+        pass
+    
+    driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+    driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+    driver.implicitly_wait(0)
+    driver.get(BLANK_PAGE)
+    
+    # Pooled browsers keep a performance log; drop this lease's events so the next demo sees only its own
+    try:
+        driver.get_log("performance")
+    except WebDriverException:
+        pass
+
+class BrowserPool:
+    """Pool of warm Chrome sessions leased out to demos one at a time"""
+    
+    def __init__(self, size=1, launcher=None):
+        self.size = size
+        # Pooled browsers outlive any one demo, so timing is attached per lease instead.
+        # They log performance events so demo 9's network summary works as it does standalone
+        self.launcher = launcher or (lambda: launch_chrome(enable_performance_log(default_chrome_options()),
+                                                           instrument=False))
+        self._idle = queue.Queue()
+        self._drivers = []
+        self._lock = threading.Lock()
+    
+    def start(self):
+        """Launch every browser in the pool up front"""
+        print(f"Launching {self.size} pooled browser(s)...")
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            drivers = list(executor.map(lambda _: self.launcher(), range(self.size)))
+        
+        for driver in drivers:
+            self._add(driver)
+        return self
+    
+    def _add(self, driver):
+        with self._lock:
+            self._drivers.append(driver)
+        self._idle.put(driver)
+    
+    def _replace(self, driver):
+        """Swap a broken browser for a fresh one"""
+        with self._lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+        print("Pooled browser was unhealthy, launching a replacement...")
+        self._add(self.launcher())
+    
+    @contextmanager
+    def lease(self, timeout=None):
+        """Borrow a browser, resetting its state when it is handed back"""
+        driver = self._idle.get(timeout=timeout)
+        try:
+            yield driver
+        finally:
+            try:
+                reset_driver(driver)
+                self._idle.put(driver)
+            except WebDriverException:
+                self._replace(driver)
+    
+    def close(self):
+        """Quit every browser owned by the pool"""
+        with self._lock:
+            drivers, self._drivers = self._drivers, []
+        
+        for driver in drivers:
+            try:
+                driver.quit()
+            except WebDriverException:
+                pass
+    
+    def __enter__(self):
+        return self.start()
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Command Timing
+==============
+Opt-in instrumentation that wraps a driver's command executor and records
+every WebDriver command (name, locator, duration, payload size) in a ring buffer
+"""
+
+import atexit
+import json
+import os
+import sys
+import time
+from collections import Counter, deque
+
+from demo_settings import timing_dir
+
+FIELDS = ("started_at", "command", "locator", "duration_ms", "request_bytes", "response_bytes")
+
+def payload_size(value):
+    """Approximate the wire size of a command payload"""
+    if value is None:
+        return 0
+    if isinstance(value, str):
+        return len(value)
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return 0
+
+def describe_locator(params):
+    """Return 'strategy=value' for find commands, or None"""
+    if params and "using" in params:
+        return f"{params['using']}={params.get('value')}"
+    return None
+
+class CommandRecorder:
+    """Records WebDriver command timings in a fixed-size ring buffer"""
+    
+    def __init__(self, capacity=10000):
+        self.records = deque(maxlen=capacity)
+        self.total_commands = 0
+        self._executor = None
+        self._patched_execute = None
+    
+    def attach(self, driver):
+        """Start timing every command sent through this driver"""
+        executor = driver.command_executor
+        original_execute = executor.execute
+        
+        def timed_execute(command, params):
+            started_at = time.time()
+            start = time.perf_counter()
+            response = None
+            try:
+                response = original_execute(command, params)
+                return response
+            finally:
+                duration_ms = (time.perf_counter() - start) * 1000
+                value = response.get("value") if isinstance(response, dict) else None
+                self.records.append((started_at, command, describe_locator(params),
+                                     round(duration_ms, 3), payload_size(params), payload_size(value)))
+                self.total_commands += 1
+        
+        # Keep any instance-level execute another wrapper installed before us
+        self._patched_execute = executor.__dict__.get("execute")
+        executor.execute = timed_execute
+        self._executor = executor
+        return self
+    
+    def detach(self):
+        """Restore the driver's original command executor"""
+        if self._executor is not None:
+            if self._patched_execute is not None:
+                self._executor.execute = self._patched_execute
+            else:
+                del self._executor.execute
+            self._executor = None
+    
+    def clear(self):
+        """Drop all recorded commands"""
+        self.records.clear()
+        self.total_commands = 0
+    
+    def as_dicts(self):
+        """Return the recorded commands as dictionaries"""
+        return [dict(zip(FIELDS, record)) for record in self.records]
+    
+    def export_jsonl(self, path):
+        """Write one JSON object per recorded command"""
+        with open(path, "w") as f:
+            for record in self.records:
+                f.write(json.dumps(dict(zip(FIELDS, record))) + "\n")
+        return path
+    
+    def summary(self, top_n=10):
+        """Summarize round trips per command and the slowest individual commands"""
+        round_trips = Counter(record[1] for record in self.records)
+        time_per_command = Counter()
+        for record in self.records:
+            time_per_command[record[1]] += record[3]
+        
+        slowest = sorted(self.records, key=lambda record: record[3], reverse=True)[:top_n]
+        
+        return {
+            'total_commands': self.total_commands,
+            'recorded_commands': len(self.records),
+            'total_time_ms': round(sum(time_per_command.values()), 3),
+            'round_trips': dict(round_trips.most_common()),
+            'time_per_command_ms': {name: round(ms, 3) for name, ms in time_per_command.most_common()},
+            'slowest_commands': [dict(zip(FIELDS, record)) for record in slowest]
+        }
+    
+    def print_summary(self, top_n=10):
+        """Print a short timing summary"""
+        summary = self.summary(top_n)
+        print("\nWebDriver command timing:")
+        print(f"   Round trips: {summary['total_commands']}")
+        print(f"   Total time: {summary['total_time_ms'] / 1000:.2f}s")
+        for name, count in summary['round_trips'].items():
+            print(f"   {name}: {count} calls, {summary['time_per_command_ms'][name]:.0f}ms")
+        print(f"   Slowest {len(summary['slowest_commands'])} commands:")
+        for entry in summary['slowest_commands']:
+            locator = f" [{entry['locator']}]" if entry['locator'] else ""
+            print(f"      {entry['duration_ms']:.0f}ms {entry['command']}{locator}")
+    
+    def save(self, directory, label, top_n=10):
+        """Write <label>.commands.jsonl and <label>.summary.json into directory"""
+        os.makedirs(directory, exist_ok=True)
+        self.export_jsonl(os.path.join(directory, f"{label}.commands.jsonl"))
+        summary_path = os.path.join(directory, f"{label}.summary.json")
+        with open(summary_path, "w") as f:
+            json.dump(self.summary(top_n), f, indent=2)
+        return summary_path
+
+def script_label():
+    """Name recordings after the running script, e.g. '05_forms_and_inputs'"""
+    return os.path.splitext(os.path.basename(sys.argv[0] or "session"))[0] or "session"
+
+def instrument_from_env(driver, label=None):
+    """Attach a recorder when SELENIUM_DEMO_TIMING_DIR is set; saved at interpreter exit"""
+    directory = timing_dir()
+    if not directory:
+        return None
+    
+    recorder = CommandRecorder().attach(driver)
+    atexit.register(recorder.save, directory, label or script_label())
+    return recorder
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Demo Settings
+=============
+Environment-driven settings shared by every demo, so runners can isolate
+demos from each other without editing the demo files
+"""
+
+import os
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+SCREENSHOTS_DIR_ENV = "SELENIUM_DEMO_SCREENSHOTS_DIR"
+CHROME_PROFILE_ENV = "SELENIUM_DEMO_CHROME_PROFILE"
+TIMING_DIR_ENV = "SELENIUM_DEMO_TIMING_DIR"
+BASELINE_DIR_ENV = "SELENIUM_DEMO_BASELINE_DIR"
+SCREENSHOT_BUDGET_ENV = "SELENIUM_DEMO_SCREENSHOT_BUDGET_MB"
+BLOCK_ENV = "SELENIUM_DEMO_BLOCK"
+BASE_URL_ENV = "SELENIUM_DEMO_BASE_URL"
+RECORD_DIR_ENV = "SELENIUM_DEMO_RECORD_DIR"
+DRY_RUN_ENV = "SELENIUM_DEMO_DRY_RUN"
+GESTURE_TIMING_ENV = "SELENIUM_DEMO_GESTURE_TIMING"
+
+DEFAULT_BASE_URL = "https://demoqa.com"
+
+def screenshots_dir():
+    """Return (and create) the directory demos should write screenshots to"""
+    path = os.environ.get(SCREENSHOTS_DIR_ENV) or os.path.join(PROJECT_DIR, "screenshots")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+def chrome_profile_dir():
+    """Return the Chrome user-data-dir to launch with, or None for Chrome's default"""
+    return os.environ.get(CHROME_PROFILE_ENV) or None
+
+def timing_dir():
+    """Return the directory for WebDriver command timings, or None when timing is off"""
+    return os.environ.get(TIMING_DIR_ENV) or None
+
+def baseline_dir():
+    """Return the directory of visual-diff baselines, or None when comparison is off"""
+    return os.environ.get(BASELINE_DIR_ENV) or None
+
+def screenshot_budget_mb():
+    """Return the screenshots directory size budget in MB, or None when retention is off"""
+    value = os.environ.get(SCREENSHOT_BUDGET_ENV)
+    return float(value) if value else None
+
+def blocking_rules():
+    """Return the comma-separated request blocking rules, or None when blocking is off"""
+    return os.environ.get(BLOCK_ENV) or None
+
+def record_dir():
+    """Return the directory for WebDriver session recordings, or None when recording is off"""
+    return os.environ.get(RECORD_DIR_ENV) or None
+
+def dry_run_source():
+    """Return the page snapshots (fixture directory or session log) for dry runs, or None when off"""
+    return os.environ.get(DRY_RUN_ENV) or None
+
+def gesture_timing():
+    """Return True when gestures should be sent and timed step by step instead of batched"""
+    return bool(os.environ.get(GESTURE_TIMING_ENV))
+
+def base_url():
+    """Return the site the demos run against, without a trailing slash"""
+    return (os.environ.get(BASE_URL_ENV) or DEFAULT_BASE_URL).rstrip("/")
+
+def demo_url(path=""):
+    """Return the full URL of a page on the demo site, e.g. demo_url("/text-box")"""
+    return base_url() + "/" + path.lstrip("/")
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+DOM Waits
+=========
+Event-driven waits: a MutationObserver installed through execute_async_script
+returns the moment a DOM condition holds, instead of sleeping for the worst case
+"""
+
+from contextlib import contextmanager
+
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+# WebDriver's default script timeout; longer waits need it raised first
+DEFAULT_SCRIPT_TIMEOUT = 30
+
+WAIT_SCRIPT = """
+var spec = arguments[0], timeoutMs = arguments[1], done = arguments[arguments.length - 1];
+
+function find() {
+    if (spec.xpath) {
+        return document.evaluate(spec.xpath, document, null,
+            XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    }
+    return document.querySelector(spec.css);
+}
+
+function visible(el) {
+    return !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+}
+
+var initial = null;
+if (spec.attribute && spec.value === null) {
+    var start = find();
+    initial = start ? start.getAttribute(spec.attribute) : null;
+}
+
+function check() {
+    var el = find();
+    if (!el) return spec.absent ? true : null;
+    if (spec.absent) return null;
+    if (spec.visible && !visible(el)) return null;
+    if (spec.text !== null && (el.textContent || "").indexOf(spec.text) === -1) return null;
+    if (spec.attribute) {
+        var current = el.getAttribute(spec.attribute);
+        if (spec.value === null ? current === initial : current !== spec.value) return null;
+    }
+    return el;
+}
+
+var result = check();
+if (result) { done({ok: true, element: result === true ? null : result}); return; }
+
+var timer = null;
+var observer = new MutationObserver(function() {
+    var found = check();
+    if (found) {
+        observer.disconnect();
+        clearTimeout(timer);
+        done({ok: true, element: found === true ? null : found});
+    }
+});
+observer.observe(document.documentElement, {
+    childList: true, subtree: true, attributes: true, characterData: true
+});
+timer = setTimeout(function() {
+    observer.disconnect();
+    done({ok: false, element: null});
+}, timeoutMs);
+"""
+
+def locator_spec(locator):
+    """Translate a (By, value) locator into a CSS or XPath query for the page script"""
+    by, value = locator
+    if by == By.XPATH:
+        return {'xpath': value, 'css': None}
+    if by == By.CSS_SELECTOR:
+        return {'xpath': None, 'css': value}
+    if by == By.ID:
+        return {'xpath': None, 'css': f'[id="{value}"]'}
+    if by == By.NAME:
+        return {'xpath': None, 'css': f'[name="{value}"]'}
+    if by == By.CLASS_NAME:
+        return {'xpath': None, 'css': f".{value}"}
+    if by == By.TAG_NAME:
+        return {'xpath': None, 'css': value}
+    if by == By.LINK_TEXT:
+        return {'xpath': f"//a[normalize-space(.)='{value}']", 'css': None}
+    if by == By.PARTIAL_LINK_TEXT:
+        return {'xpath': f"//a[contains(., '{value}')]", 'css': None}
+    raise ValueError(f"Unsupported locator strategy: {by}")
+
+@contextmanager
+def script_timeout(driver, timeout):
+    """Give an in-page wait of timeout seconds room to finish, restoring the session's script timeout after"""
+    if timeout < DEFAULT_SCRIPT_TIMEOUT:
+        yield
+        return
+    try:
+        previous = driver.timeouts.script
+    except (AttributeError, WebDriverException):
+        previous = DEFAULT_SCRIPT_TIMEOUT
+    driver.set_script_timeout(timeout + 5)
+    try:
+        yield
+    finally:
+        driver.set_script_timeout(previous)
+
+def wait_for_dom(driver, locator, timeout=10, visible=False, text=None,
+                 attribute=None, value=None, absent=False):
+    """Wait for a DOM condition on the element at locator and return that element"""
+    spec = locator_spec(locator)
+    spec.update({
+        'visible': visible,
+        'text': text,
+        'attribute': attribute,
+        'value': value,
+        'absent': absent
+    })
+    
+    with script_timeout(driver, timeout):
+        result = driver.execute_async_script(WAIT_SCRIPT, spec, int(timeout * 1000))
+    if not result or not result.get('ok'):
+        raise TimeoutException(f"DOM condition not met within {timeout}s for {locator}")
+    return result.get('element')
+
+def wait_for_element(driver, locator, timeout=10, visible=False):
+    """Wait until an element exists (and optionally is visible)"""
+    return wait_for_dom(driver, locator, timeout, visible=visible)
+
+def wait_for_text(driver, locator, text, timeout=10):
+    """Wait until an element's text contains the given string"""
+    return wait_for_dom(driver, locator, timeout, text=text)
+
+def wait_for_attribute(driver, locator, attribute, value=None, timeout=10):
+    """Wait until an attribute equals value, or changes from its current value when value is None"""
+    return wait_for_dom(driver, locator, timeout, attribute=attribute, value=value)
+
+def wait_for_absence(driver, locator, timeout=10):
+    """Wait until no element matches the locator"""
+    return wait_for_dom(driver, locator, timeout, absent=True)
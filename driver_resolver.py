@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+ChromeDriver Resolver
+=====================
+Resolves the chromedriver binary once and caches it in a small manifest,
+so later runs reuse it from a stat check instead of asking webdriver_manager
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+
+from demo_settings import PROJECT_DIR
+
+MANIFEST_FILE = os.path.join(PROJECT_DIR, "chromedriver_manifest.json")
+
+CHROME_CANDIDATES = [
+    "google-chrome",
+    "google-chrome-stable",
+    "chromium",
+    "chromium-browser",
+    "chrome",
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+    r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+    r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+]
+
+def find_chrome_binary():
+    """Return the path of the installed Chrome/Chromium binary, or None"""
+    for candidate in CHROME_CANDIDATES:
+        path = shutil.which(candidate) or (candidate if os.path.isfile(candidate) else None)
+        if path:
+            return os.path.realpath(path)
+    return None
+
+def chrome_version(chrome_binary):
+    """Ask the Chrome binary for its version string, e.g. '127.0.6533.88'"""
+    try:
+        output = subprocess.run([chrome_binary, "--version"], capture_output=True,
+                                text=True, timeout=10).stdout
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    match = re.search(r"(\d+)\.(\d+)\.(\d+)\.(\d+)", output)
+    return match.group(0) if match else None
+
+def major_version(version):
+    """Return the major part of a version string"""
+    return version.split(".")[0] if version else None
+
+def file_checksum(path):
+    """Return the SHA-256 of a file"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def stat_signature(path):
+    """Return a (size, mtime) pair used to detect that a file changed"""
+    st = os.stat(path)
+    return [st.st_size, int(st.st_mtime)]
+
+def load_manifest(path=MANIFEST_FILE):
+    """Load the resolver manifest, or None if it does not exist or is unreadable"""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def save_manifest(manifest, path=MANIFEST_FILE):
+    """Write the resolver manifest atomically"""
+    # A private temp file per writer: parallel demo processes may save at once
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=".chromedriver_manifest_",
+                                    suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def refresh_manifest(manifest, path=MANIFEST_FILE):
+    """Save an updated manifest; failing only costs a re-check on the next run"""
+    try:
+        save_manifest(manifest, path)
+    except OSError as e:
+        print(f"Could not update chromedriver manifest: {e}")
+
+def build_manifest(driver_path, chrome_binary, version):
+    """Describe a resolved driver so later runs can trust it without re-resolving"""
+    return {
+        "chrome_binary": chrome_binary,
+        "chrome_signature": stat_signature(chrome_binary) if chrome_binary else None,
+        "chrome_version": version,
+        "driver_path": driver_path,
+        "driver_signature": stat_signature(driver_path),
+        "driver_sha256": file_checksum(driver_path),
+    }
+
+def cached_driver(manifest, chrome_binary, manifest_path=MANIFEST_FILE):
+    """Return the cached driver path if the manifest still matches this machine"""
+    if not manifest:
+        return None
+    
+    driver_path = manifest.get("driver_path")
+    try:
+        driver_signature = stat_signature(driver_path)
+    except (OSError, TypeError):
+        return None
+    
+    if driver_signature != manifest.get("driver_signature"):
+        # The file was touched; only trust it if the contents are unchanged
+        if file_checksum(driver_path) != manifest.get("driver_sha256"):
+            return None
+        manifest["driver_signature"] = driver_signature
+        refresh_manifest(manifest, manifest_path)
+    
+    if chrome_binary and chrome_binary == manifest.get("chrome_binary"):
+        try:
+            if stat_signature(chrome_binary) == manifest.get("chrome_signature"):
+                return driver_path
+        except OSError:
+            return None
+    
+    # Chrome was updated or moved: a new build within the same major still fits
+    version = chrome_version(chrome_binary) if chrome_binary else None
+    if version is None:
+        # Chrome cannot be identified here, so nothing better than the last
+        # resolved driver is known; re-resolving would repeat on every launch
+        return driver_path
+    if major_version(version) != major_version(manifest.get("chrome_version")):
+        return None
+    
+    manifest.update({
+        "chrome_binary": chrome_binary,
+        "chrome_signature": stat_signature(chrome_binary),
+        "chrome_version": version,
+    })
+    refresh_manifest(manifest, manifest_path)
+    return driver_path
+
+def install_driver():
+    """Download or locate a matching chromedriver through webdriver_manager"""
+    from webdriver_manager.chrome import ChromeDriverManager
+    return ChromeDriverManager().install()
+
+def resolve_chromedriver(manifest_path=MANIFEST_FILE):
+    """Return a chromedriver path, hitting webdriver_manager only when Chrome's major version changes"""
+    manifest = load_manifest(manifest_path)
+    chrome_binary = (manifest or {}).get("chrome_binary")
+    if not (chrome_binary and os.path.isfile(chrome_binary)):
+        chrome_binary = find_chrome_binary()
+    
+    driver_path = cached_driver(manifest, chrome_binary, manifest_path)
+    if driver_path:
+        return driver_path
+    
+    try:
+        driver_path = install_driver()
+    except Exception as e:
+        # Offline: a stale driver or one on PATH beats failing outright
+        fallback = (manifest or {}).get("driver_path")
+        if not (fallback and os.path.isfile(fallback)):
+            fallback = shutil.which("chromedriver")
+        if not fallback:
+            raise
+        print(f"webdriver_manager unavailable ({e}), using {fallback}")
+        return fallback
+    
+    version = chrome_version(chrome_binary) if chrome_binary else None
+    try:
+        save_manifest(build_manifest(driver_path, chrome_binary, version), manifest_path)
+    except OSError as e:
+        print(f"Could not write chromedriver manifest: {e}")
+    return driver_path
+
+if __name__ == "__main__":
+    print(resolve_chromedriver())
@@ -0,0 +1,608 @@
+#!/usr/bin/env python3
+"""
+Dry DOM
+=======
+A browserless, driver-compatible backend for dry runs: pages come from
+saved HTML snapshots parsed with lxml, locators are evaluated in memory as
+CSS (through cssselect) or XPath, and field values typed with send_keys are
+tracked per element, so demos can validate their locators in milliseconds
+"""
+
+import argparse
+import base64
+import contextlib
+import io
+import os
+import re
+import sys
+import tempfile
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from urllib.parse import urljoin, urlsplit
+
+from lxml import etree, html as lxml_html
+from lxml.cssselect import CSSSelector
+from cssselect import SelectorError
+from selenium.common.exceptions import (InvalidSelectorException, NoAlertPresentException,
+                                        NoSuchElementException)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+
+from batch_lookup import FIND_MANY_SCRIPT
+from demo_settings import PROJECT_DIR, SCREENSHOTS_DIR_ENV, dry_run_source
+from dom_waits import WAIT_SCRIPT, locator_spec
+from element_capture import RECTS_SCRIPT
+from element_snapshot import SNAPSHOT_SCRIPT
+from form_fill import FILL_SCRIPT, READ_VALUES_SCRIPT
+from page_metrics import COLLECT_SCRIPT
+
+DEFAULT_PAGES = os.path.join(PROJECT_DIR, "fixtures", "demoqa")
+CLICK_SCRIPT = "arguments[0].click();"
+BLANK_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAIAAACQd1PeAAAADElEQVR4nGP4//8/AAX+Av4N70a4AAAAAElFTkSuQmCC"
+)
+
+# Keys.* values live in this private-use range; they type nothing into a field
+SPECIAL_KEYS = re.compile("[\ue000-\ue03d]")
+HIDDEN_STYLE = re.compile(r"(display\s*:\s*none|visibility\s*:\s*hidden)", re.IGNORECASE)
+NON_TEXT_TAGS = frozenset(("script", "style", "template", "head", "title"))
+
+@lru_cache(maxsize=1024)
+def compile_locator(by, value):
+    """Compile a (By, value) locator once into an lxml XPath or CSS selector"""
+    spec = locator_spec((by, value))
+    try:
+        if spec['xpath']:
+            return etree.XPath(spec['xpath'])
+        return CSSSelector(spec['css'], translator="html")
+    except (etree.XPathSyntaxError, SelectorError) as e:
+        raise InvalidSelectorException(f"Invalid locator {by}={value}: {e}")
+
+def match(root, by, value):
+    """Return the elements under root that a locator selects, in document order"""
+    return [node for node in compile_locator(by, value)(root) if isinstance(node, etree.ElementBase)]
+
+class SnapshotPages:
+    """Page HTML keyed by URL path, from a fixture directory or a recorded session log"""
+    
+    def __init__(self, source=DEFAULT_PAGES):
+        self.source = source
+        self._html = {}
+        if source.endswith(".session.gz"):
+            from session_replay import SNAPSHOT, read_log
+            # The latest snapshot of each page wins
+            for kind, _, payload in read_log(source):
+                if kind == SNAPSHOT and payload.get('url'):
+                    self._html[urlsplit(payload['url']).path or "/"] = payload['html']
+    
+    def html_for(self, path):
+        """Return the HTML saved for a URL path, or None"""
+        path = path or "/"
+        if path in self._html:
+            return self._html[path]
+        if os.path.isdir(self.source):
+            name = path.strip("/") or "index"
+            file_path = os.path.join(self.source, name if "." in os.path.basename(name) else name + ".html")
+            if os.path.isfile(file_path):
+                with open(file_path, encoding="utf-8") as f:
+                    self._html[path] = f.read()
+                return self._html[path]
+        return None
+
+class DryElement(WebElement):
+    """A WebElement backed by an lxml node instead of a browser element"""
+    
+    def __init__(self, driver, node):
+        super().__init__(driver, f"dry-{id(node):x}")
+        self.node = node
+    
+    @property
+    def tag_name(self):
+        return self.node.tag
+    
+    @property
+    def text(self):
+        if not self.is_displayed():
+            return ""
+        parts = []
+        for node in self.node.iter():
+            if node.tag in NON_TEXT_TAGS or not isinstance(node.tag, str):
+                continue
+            if node is not self.node and not self._parent.node_displayed(node):
+                continue
+            if node.text:
+                parts.append(node.text)
+            if node is not self.node and node.tail:
+                parts.append(node.tail)
+        return " ".join(" ".join(parts).split())
+    
+    def get_attribute(self, name):
+        if name == "value":
+            return self._parent.value_of(self.node)
+        if name in ("checked", "selected"):
+            return "true" if self.is_selected() else None
+        if name in ("textContent", "innerText"):
+            return self.text
+        return self.node.get(name)
+    
+    def get_dom_attribute(self, name):
+        return self.node.get(name)
+    
+    def get_property(self, name):
+        if name in ("value", "checked", "selected", "textContent", "innerText"):
+            value = self.get_attribute(name)
+            return value == "true" if name in ("checked", "selected") else value
+        if name == "disabled":
+            return not self.is_enabled()
+        return self.node.get(name)
+    
+    def is_displayed(self):
+        return self._parent.node_displayed(self.node)
+    
+    def is_enabled(self):
+        return self.node.get("disabled") is None
+    
+    def is_selected(self):
+        return self._parent.checked.get(self.node, self.node.get("checked") is not None
+                                         or self.node.get("selected") is not None)
+    
+    def send_keys(self, *value):
+        typed = SPECIAL_KEYS.sub("", "".join(str(part) for part in value))
+        if self.node.get("type") == "file":
+            typed = os.path.basename(typed)
+            self._parent.values[self.node] = typed
+            return
+        self._parent.values[self.node] = (self._parent.value_of(self.node) or "") + typed
+    
+    def clear(self):
+        self._parent.values[self.node] = ""
+    
+    def click(self):
+        self._parent.click_node(self.node)
+    
+    def submit(self):
+        pass
+    
+    def value_of_css_property(self, property_name):
+        return ""
+    
+    def find_element(self, by=By.ID, value=None):
+        return self._parent.find_element(by, value, root=self.node)
+    
+    def find_elements(self, by=By.ID, value=None):
+        return self._parent.find_elements(by, value, root=self.node)
+    
+    @property
+    def rect(self):
+        return {'x': 0, 'y': 0, 'width': 0, 'height': 0}
+    
+    @property
+    def size(self):
+        return {'height': 0, 'width': 0}
+    
+    @property
+    def location(self):
+        return {'x': 0, 'y': 0}
+    
+    @property
+    def location_once_scrolled_into_view(self):
+        return {'x': 0, 'y': 0}
+    
+    @property
+    def screenshot_as_png(self):
+        return BLANK_PNG
+    
+    @property
+    def screenshot_as_base64(self):
+        return base64.b64encode(BLANK_PNG).decode("ascii")
+    
+    def screenshot(self, filename):
+        with open(filename, "wb") as f:
+            f.write(BLANK_PNG)
+        return True
+
+class DrySwitchTo:
+    """Window, frame and alert switching for a single static page"""
+    
+    def __init__(self, driver):
+        self._driver = driver
+    
+    @property
+    def alert(self):
+        raise NoAlertPresentException("Dry runs have no alerts")
+    
+    @property
+    def active_element(self):
+        return self._driver.element_for(self._driver.tree.getroot())
+    
+    def window(self, window_name):
+        pass
+    
+    def new_window(self, type_hint=None):
+        pass
+    
+    def frame(self, frame_reference):
+        pass
+    
+    def default_content(self):
+        pass
+    
+    def parent_frame(self):
+        pass
+
+class DryDriver:
+    """Driver-compatible object that answers lookups from saved page snapshots
+    
+    Every lookup is logged with its match count; report() summarizes which
+    locators resolved, which are missing and which find_element calls were
+    ambiguous. Scripts the demos' helper modules send are emulated in
+    Python; any other script is counted and returns None.
+    """
+    
+    def __init__(self, pages=None):
+        self.pages = pages if isinstance(pages, SnapshotPages) else SnapshotPages(pages or DEFAULT_PAGES)
+        self.current_url = "about:blank"
+        self.tree = lxml_html.document_fromstring("<html><body></body></html>").getroottree()
+        self.values = {}
+        self.checked = {}
+        self.lookups = []
+        self.missing_pages = []
+        self.skipped_scripts = []
+        self.history = []
+        self.session_id = "dry"
+        self.switch_to = DrySwitchTo(self)
+        self._elements = {}
+        self._scripts = {
+            FILL_SCRIPT: self._fill,
+            READ_VALUES_SCRIPT: lambda elements: {name: el.get_attribute("value") for name, el in elements.items()},
+            FIND_MANY_SCRIPT: self._find_many,
+            WAIT_SCRIPT: self._wait,
+            SNAPSHOT_SCRIPT: self._snapshot,
+            RECTS_SCRIPT: lambda elements: {'dpr': 1, 'viewport': [0, 0], 'rects': [[0, 0, 0, 0] for _ in elements]},
+            COLLECT_SCRIPT: lambda settle_ms: {'url': self.current_url, 'cls': 0, 'long_tasks': 0},
+            CLICK_SCRIPT: lambda element: element.click()
+        }
+    
+    # Navigation
+    
+    def get(self, url):
+        self._load(url)
+        self.history = self.history[:self._history_index() + 1] + [url]
+    
+    def _load(self, url):
+        path = urlsplit(url).path or "/"
+        source = self.pages.html_for(path)
+        if source is None:
+            self.missing_pages.append(url)
+            source = "<html><head><title></title></head><body></body></html>"
+        self.tree = lxml_html.document_fromstring(source).getroottree()
+        self.current_url = url
+        self.values = {}
+        self.checked = {}
+        self._elements = {}
+    
+    def _history_index(self):
+        return len(self.history) - 1 - self.history[::-1].index(self.current_url) if self.current_url in self.history else -1
+    
+    def back(self):
+        index = self._history_index()
+        if index > 0:
+            self._load(self.history[index - 1])
+    
+    def forward(self):
+        index = self._history_index()
+        if 0 <= index < len(self.history) - 1:
+            self._load(self.history[index + 1])
+    
+    def refresh(self):
+        self._load(self.current_url)
+    
+    @property
+    def title(self):
+        titles = self.tree.findall(".//title")
+        return (titles[0].text or "").strip() if titles else ""
+    
+    @property
+    def page_source(self):
+        return lxml_html.tostring(self.tree, encoding="unicode")
+    
+    # Lookups
+    
+    def element_for(self, node):
+        if node not in self._elements:
+            self._elements[node] = DryElement(self, node)
+        return self._elements[node]
+    
+    def _lookup(self, by, value, root, kind):
+        nodes = match(root if root is not None else self.tree.getroot(), by, value)
+        self.lookups.append((urlsplit(self.current_url).path or "/", by, value, len(nodes), kind))
+        return nodes
+    
+    def find_element(self, by=By.ID, value=None, root=None):
+        nodes = self._lookup(by, value, root, "find_element")
+        if not nodes:
+            raise NoSuchElementException(f"No element matches {by}={value} on {self.current_url}")
+        return self.element_for(nodes[0])
+    
+    def find_elements(self, by=By.ID, value=None, root=None):
+        return [self.element_for(node) for node in self._lookup(by, value, root, "find_elements")]
+    
+    def _spec_nodes(self, spec, kind):
+        if spec.get('element') is not None:
+            return [spec['element'].node]
+        by, value = (By.XPATH, spec['xpath']) if spec.get('xpath') else (By.CSS_SELECTOR, spec['css'])
+        return self._lookup(by, value, None, kind)
+    
+    # Element state
+    
+    def value_of(self, node):
+        if node in self.values:
+            return self.values[node]
+        if node.tag == "textarea":
+            return node.text or ""
+        if node.tag == "select":
+            options = node.findall(".//option")
+            chosen = [option for option in options if option.get("selected") is not None] or options[:1]
+            return chosen[0].get("value", chosen[0].text) if chosen else ""
+        return node.get("value", "" if node.tag == "input" else None)
+    
+    def node_displayed(self, node):
+        if node.tag == "input" and node.get("type") == "hidden":
+            return False
+        while node is not None:
+            if node.get("hidden") is not None or HIDDEN_STYLE.search(node.get("style", "")) \
+                    or "hidden" in node.get("class", "").split():
+                return False
+            node = node.getparent()
+        return True
+    
+    def click_node(self, node):
+        target = node
+        if node.tag == "label" and node.get("for"):
+            found = self.tree.getroot().get_element_by_id(node.get("for"), None)
+            if found is not None:
+                target = found
+        if target.tag == "input" and target.get("type") in ("checkbox", "radio"):
+            selected = self.element_for(target).is_selected()
+            if target.get("type") == "radio":
+                for other in self.tree.getroot().iter("input"):
+                    if other.get("name") == target.get("name") and other.get("type") == "radio":
+                        self.checked[other] = False
+                self.checked[target] = True
+            else:
+                self.checked[target] = not selected
+        elif target.tag == "option":
+            select = next((parent for parent in target.iterancestors("select")), None)
+            if select is not None:
+                self.values[select] = target.get("value", target.text)
+        else:
+            # Clicking inside a plain link follows it; new-tab links stay on this page
+            link = next((node for node in target.iterancestors("a")), target if target.tag == "a" else None)
+            if link is not None and link.get("target") != "_blank":
+                href = link.get("href", "")
+                if href and not href.startswith(("#", "javascript:")):
+                    self.get(urljoin(self.current_url, href))
+    
+    # Scripts
+    
+    def execute_script(self, script, *args):
+        handler = self._scripts.get(script.strip() if script.strip() == CLICK_SCRIPT else script)
+        if handler is None:
+            self.skipped_scripts.append(script)
+            return None
+        return handler(*args)
+    
+    def execute_async_script(self, script, *args):
+        return self.execute_script(script, *args)
+    
+    def _fill(self, targets, values):
+        result = {'elements': {}, 'rejected': [], 'missing': []}
+        for name, value in values.items():
+            nodes = self._spec_nodes(targets[name], "fill")
+            if not nodes:
+                result['missing'].append(name)
+                continue
+            node = nodes[0]
+            result['elements'][name] = self.element_for(node)
+            if node.get("disabled") is not None or node.get("readonly") is not None or node.get("type") == "file":
+                result['rejected'].append(name)
+                continue
+            self.values[node] = value
+        return result
+    
+    def _find_many(self, specs, timeout_ms):
+        found, missing = {}, []
+        for name, spec in specs.items():
+            nodes = self._spec_nodes(spec, "find_many")
+            if nodes:
+                found[name] = self.element_for(nodes[0])
+            else:
+                missing.append(name)
+        return {'found': found, 'missing': missing}
+    
+    def _wait(self, spec, timeout_ms):
+        # A static page never changes, so each condition is checked exactly once
+        nodes = self._spec_nodes(spec, "wait")
+        if spec.get('absent'):
+            return {'ok': not nodes, 'element': None}
+        if not nodes:
+            return {'ok': False, 'element': None}
+        element = self.element_for(nodes[0])
+        if spec.get('visible') and not element.is_displayed():
+            return {'ok': False, 'element': None}
+        if spec.get('text') is not None and spec['text'] not in element.text:
+            return {'ok': False, 'element': None}
+        if spec.get('attribute'):
+            if spec.get('value') is None or element.get_attribute(spec['attribute']) != spec['value']:
+                return {'ok': False, 'element': None}
+        return {'ok': True, 'element': element}
+    
+    def _snapshot(self, elements, wanted, styles):
+        snapshots = []
+        for element in elements:
+            data = {}
+            if wanted.get('tag_name'):
+                data['tag_name'] = element.tag_name
+            if wanted.get('rect'):
+                data['rect'] = dict(element.rect)
+            if wanted.get('displayed'):
+                data['displayed'] = element.is_displayed()
+            if wanted.get('enabled'):
+                data['enabled'] = element.is_enabled()
+            if wanted.get('value'):
+                data['value'] = element.get_attribute("value")
+            if wanted.get('text'):
+                data['text'] = element.text
+            if wanted.get('classes'):
+                data['classes'] = element.node.get("class", "").split()
+            if wanted.get('styles'):
+                data['styles'] = {name: "" for name in styles}
+            snapshots.append(data)
+        return snapshots
+    
+    # Browser plumbing the demos touch; none of it has an effect in a dry run
+    
+    def execute(self, driver_command, params=None):
+        return {'value': None}
+    
+    def execute_cdp_cmd(self, cmd, cmd_args):
+        return {}
+    
+    def get_log(self, log_type):
+        return []
+    
+    def get_screenshot_as_png(self):
+        return BLANK_PNG
+    
+    def get_screenshot_as_base64(self):
+        return base64.b64encode(BLANK_PNG).decode("ascii")
+    
+    def save_screenshot(self, filename):
+        with open(filename, "wb") as f:
+            f.write(BLANK_PNG)
+        return True
+    
+    get_screenshot_as_file = save_screenshot
+    
+    @property
+    def current_window_handle(self):
+        return "dry-window"
+    
+    @property
+    def window_handles(self):
+        return ["dry-window"]
+    
+    def get_window_size(self, windowHandle="current"):
+        return {'width': 1920, 'height': 1080}
+    
+    def get_cookies(self):
+        return []
+    
+    def implicitly_wait(self, time_to_wait):
+        pass
+    
+    def set_script_timeout(self, time_to_wait):
+        pass
+    
+    def set_page_load_timeout(self, time_to_wait):
+        pass
+    
+    def set_window_size(self, width, height, windowHandle="current"):
+        pass
+    
+    def maximize_window(self):
+        pass
+    
+    def delete_all_cookies(self):
+        pass
+    
+    def close(self):
+        pass
+    
+    def quit(self):
+        pass
+    
+    # Results
+    
+    def report(self):
+        """Summarize every locator used: resolved, missing and ambiguous find_element calls"""
+        summary = OrderedDict()
+        for path, by, value, count, kind in self.lookups:
+            key = (path, by, value)
+            entry = summary.setdefault(key, {'page': path, 'by': by, 'value': value,
+                                             'lookups': 0, 'matches': 0, 'single': False})
+            entry['lookups'] += 1
+            entry['matches'] = max(entry['matches'], count)
+            entry['single'] = entry['single'] or kind != "find_elements"
+        entries = list(summary.values())
+        return {
+            'resolved': [entry for entry in entries if entry['matches']],
+            'missing': [entry for entry in entries if not entry['matches']],
+            'ambiguous': [entry for entry in entries if entry['single'] and entry['matches'] > 1],
+            'missing_pages': sorted(set(self.missing_pages)),
+            'skipped_scripts': len(self.skipped_scripts)
+        }
+
+def driver_from_env():
+    """Return a DryDriver when SELENIUM_DEMO_DRY_RUN is set, else None"""
+    source = dry_run_source()
+    if not source:
+        return None
+    return DryDriver(source)
+
+def dry_run_demo(demo_file, pages, quiet=True):
+    """Run a demo's entry point on a DryDriver with waits fast-forwarded; return the driver and elapsed ms"""
+    from run_all_demos import load_demo_function
+    from session_replay import VirtualClock
+    
+    demo = load_demo_function(demo_file)
+    driver = DryDriver(pages)
+    output = io.StringIO()
+    saved_dir = os.environ.get(SCREENSHOTS_DIR_ENV)
+    start = time.perf_counter()
+    # Dry screenshots are blank; keep them out of the real screenshots directory
+    with tempfile.TemporaryDirectory() as scratch, VirtualClock(), \
+            contextlib.redirect_stdout(output if quiet else sys.stdout):
+        os.environ[SCREENSHOTS_DIR_ENV] = scratch
+        try:
+            demo(driver=driver)
+        finally:
+            if saved_dir is None:
+                del os.environ[SCREENSHOTS_DIR_ENV]
+            else:
+                os.environ[SCREENSHOTS_DIR_ENV] = saved_dir
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    return driver, elapsed_ms
+
+def print_report(demo_file, report, elapsed_ms):
+    """Print one demo's locator report"""
+    print(f"{demo_file}: {len(report['resolved'])} locators resolved, {len(report['missing'])} missing, "
+          f"{len(report['ambiguous'])} ambiguous ({elapsed_ms:.0f} ms)")
+    for entry in report['missing']:
+        print(f"   missing   {entry['page']}  {entry['by']}={entry['value']}")
+    for entry in report['ambiguous']:
+        print(f"   ambiguous {entry['page']}  {entry['by']}={entry['value']} ({entry['matches']} matches)")
+    for url in report['missing_pages']:
+        print(f"   no snapshot for {url}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Dry-run demos against saved page snapshots to validate their locators")
+    parser.add_argument("demos", nargs="+", help="demo files to dry-run")
+    parser.add_argument("--pages", default=DEFAULT_PAGES,
+                        help="fixture directory or recorded .session.gz log (default: fixtures/demoqa)")
+    parser.add_argument("--verbose", action="store_true", help="show the demos' own output")
+    parser.add_argument("--strict", action="store_true", help="exit with 1 when any locator is missing")
+    args = parser.parse_args(argv)
+    
+    pages = SnapshotPages(args.pages)
+    failed = False
+    for demo_file in args.demos:
+        driver, elapsed_ms = dry_run_demo(demo_file, pages, quiet=not args.verbose)
+        report = driver.report()
+        print_report(demo_file, report, elapsed_ms)
+        failed = failed or bool(report['missing'])
+    return 1 if failed and args.strict else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
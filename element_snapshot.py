@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Element Snapshot
+================
+Gather several element properties (rect, visibility, enabled, value, text,
+classes, computed styles) for one or many elements in a single script call
+"""
+
+DEFAULT_PROPERTIES = ("tag_name", "rect", "displayed", "enabled", "value", "text")
+ALL_PROPERTIES = DEFAULT_PROPERTIES + ("classes", "styles")
+
+SNAPSHOT_SCRIPT = """
+var elements = arguments[0], wanted = arguments[1], styleNames = arguments[2];
+
+function displayed(el) {
+    var style = window.getComputedStyle(el);
+    return style.display !== "none" && style.visibility !== "hidden" &&
+        style.opacity !== "0" && el.getClientRects().length > 0;
+}
+
+return elements.map(function(el) {
+    var data = {};
+    if (wanted.tag_name) data.tag_name = el.tagName.toLowerCase();
+    if (wanted.rect) {
+        var r = el.getBoundingClientRect();
+        data.rect = {x: r.left + window.scrollX, y: r.top + window.scrollY,
+                     width: r.width, height: r.height};
+    }
+    if (wanted.displayed) data.displayed = displayed(el);
+    if (wanted.enabled) data.enabled = !el.disabled;
+    if (wanted.value) data.value = ("value" in el) ? el.value : el.getAttribute("value");
+    if (wanted.text) data.text = el.innerText;
+    if (wanted.classes) data.classes = Array.prototype.slice.call(el.classList);
+    if (wanted.styles) {
+        var computed = window.getComputedStyle(el);
+        data.styles = {};
+        styleNames.forEach(function(name) { data.styles[name] = computed.getPropertyValue(name); });
+    }
+    return data;
+});
+"""
+
+class ElementSnapshot:
+    """Read-only copy of an element's properties taken in one round trip"""
+    
+    __slots__ = ALL_PROPERTIES
+    
+    def __init__(self, data):
+        for name in self.__slots__:
+            setattr(self, name, data.get(name))
+    
+    @property
+    def size(self):
+        """Element size in the same shape as WebElement.size"""
+        if self.rect is None:
+            return None
+        return {'height': self.rect['height'], 'width': self.rect['width']}
+    
+    @property
+    def location(self):
+        """Element location in the same shape as WebElement.location"""
+        if self.rect is None:
+            return None
+        return {'x': round(self.rect['x']), 'y': round(self.rect['y'])}
+    
+    def as_dict(self):
+        """Return the captured properties, skipping ones that were not requested"""
+        return {name: getattr(self, name) for name in self.__slots__ if getattr(self, name) is not None}
+    
+    def __repr__(self):
+        return f"ElementSnapshot({self.as_dict()})"
+
+def snapshot_many(driver, elements, properties=DEFAULT_PROPERTIES, styles=()):
+    """Snapshot a list of elements with a single execute_script call"""
+    if not elements:
+        return []
+    
+    unknown = set(properties) - set(ALL_PROPERTIES)
+    if unknown:
+        raise ValueError(f"Unknown snapshot properties: {', '.join(sorted(unknown))}")
+    
+    wanted = {name: True for name in properties}
+    if styles:
+        wanted['styles'] = True
+    
+    results = driver.execute_script(SNAPSHOT_SCRIPT, list(elements), wanted, list(styles))
+    return [ElementSnapshot(data) for data in results]
+
+def snapshot(driver, element, properties=DEFAULT_PROPERTIES, styles=()):
+    """Snapshot a single element with a single execute_script call"""
+    return snapshot_many(driver, [element], properties, styles)[0]
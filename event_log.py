@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Event Log
+=========
+Append-only JSONL event stream for automation runs: every test result and
+screenshot is flushed as its own line when it happens, and readers rebuild
+the report summary (or the full test_report JSON) by streaming the file
+"""
+
+import argparse
+import json
+import os
+import sys
+from datetime import datetime
+
+class EventWriter:
+    """Appends one JSON object per line and flushes after every event"""
+    
+    def __init__(self, path, fsync=False):
+        self.path = path
+        self.fsync = fsync
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "a")
+    
+    def write(self, event, **fields):
+        """Record an event of the given type and return it"""
+        record = {'event': event, 'time': datetime.now().isoformat()}
+        record.update(fields)
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        return record
+    
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+def read_events(path, event=None):
+    """Yield events from a log one at a time, optionally only those of one type
+    
+    A truncated final line (the process died mid-write) is skipped.
+    """
+    with open(path) as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if event is None or record.get('event') == event:
+                yield record
+
+def summarize_events(path):
+    """Rebuild the report summary block by streaming the event log"""
+    total = passed = failed = screenshots = 0
+    total_time = 0.0
+    start_time = end_time = last_time = None
+    
+    for record in read_events(path):
+        event = record.get('event')
+        last_time = record.get('time', last_time)
+        if event == 'run_started':
+            start_time = record.get('start_time', record.get('time'))
+        elif event == 'run_finished':
+            end_time = record.get('end_time', record.get('time'))
+        elif event == 'test_result':
+            total += 1
+            if record.get('status') == 'PASSED':
+                passed += 1
+            else:
+                failed += 1
+            total_time += record.get('execution_time', 0)
+        elif event == 'screenshot':
+            screenshots += 1
+    
+    success_rate = (passed / total * 100) if total > 0 else 0
+    return {
+        'total_tests': total,
+        'passed_tests': passed,
+        'failed_tests': failed,
+        'success_rate': f"{success_rate:.1f}%",
+        'total_execution_time': f"{total_time:.2f}s",
+        'start_time': start_time,
+        # A run that crashed never logged run_finished; its last event is the best end time
+        'end_time': end_time or last_time,
+        'screenshots': screenshots
+    }
+
+def _strip_event(record):
+    return {key: value for key, value in record.items() if key not in ('event', 'time')}
+
+def _write_section(f, name, records):
+    f.write(f'  "{name}": [')
+    first = True
+    for record in records:
+        item = json.dumps(_strip_event(record), indent=2).replace("\n", "\n    ")
+        f.write(("\n    " if first else ",\n    ") + item)
+        first = False
+    f.write("]" if first else "\n  ]")
+
+def write_report(events_path, report_path):
+    """Stream an event log into the test_report JSON layout and return its summary
+    
+    Memory use does not grow with the number of events: the log is read
+    once for the summary and once per section.
+    """
+    summary = summarize_events(events_path)
+    report_summary = {key: value for key, value in summary.items() if key != 'screenshots'}
+    
+    tmp_path = report_path + ".part"
+    with open(tmp_path, "w") as f:
+        f.write('{\n  "summary": ')
+        f.write(json.dumps(report_summary, indent=2).replace("\n", "\n  "))
+        f.write(",\n")
+        _write_section(f, "test_results", read_events(events_path, 'test_result'))
+        f.write(",\n")
+        _write_section(f, "screenshots", read_events(events_path, 'screenshot'))
+        f.write("\n}")
+    os.replace(tmp_path, report_path)
+    return summary
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Summarize an automation event log")
+    parser.add_argument("events", help="JSONL event log written by the automation framework")
+    parser.add_argument("--report", default=None, help="also write the full test_report JSON here")
+    args = parser.parse_args(argv)
+    
+    if args.report:
+        summary = write_report(args.events, args.report)
+        print(f"Report saved: {args.report}")
+    else:
+        summary = summarize_events(args.events)
+    print(json.dumps(summary, indent=2))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
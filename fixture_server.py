@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Fixture Server
+==============
+Serve local snapshots of the DemoQA pages the demos visit, with the same
+element IDs and behaviour, so runs need no network and see no third-party
+scripts or ads. Point the demos at it with SELENIUM_DEMO_BASE_URL
+"""
+
+import argparse
+import os
+import re
+import sys
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+from demo_settings import BASE_URL_ENV, PROJECT_DIR
+
+FIXTURES_DIR = os.path.join(PROJECT_DIR, "fixtures", "demoqa")
+
+# Stand-in for the external status-code pages the broken links point to
+STATUS_PATTERN = re.compile(r"^/status_codes/(\d{3})/?$")
+
+class FixtureHandler(SimpleHTTPRequestHandler):
+    """Serves fixture pages under their DemoQA paths ("/text-box" -> text-box.html)"""
+    
+    quiet = True
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, directory=FIXTURES_DIR, **kwargs)
+    
+    def do_GET(self):
+        match = STATUS_PATTERN.match(self.path.split("?", 1)[0])
+        if match:
+            self.send_error(int(match.group(1)))
+            return
+        super().do_GET()
+    
+    def translate_path(self, path):
+        path = path.split("?", 1)[0].split("#", 1)[0].rstrip("/")
+        if path and "." not in os.path.basename(path):
+            path += ".html"
+        return super().translate_path(path or "/")
+    
+    def log_message(self, format, *args):
+        if not self.quiet:
+            super().log_message(format, *args)
+
+class FixtureServer:
+    """The fixture site on a background thread; port 0 picks a free port"""
+    
+    def __init__(self, host="127.0.0.1", port=0):
+        self.httpd = ThreadingHTTPServer((host, port), FixtureHandler)
+        self.httpd.daemon_threads = True
+        self._thread = None
+    
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+    
+    def start(self):
+        """Start serving and return the base URL"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self.url
+    
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread:
+            self._thread.join()
+    
+    def __enter__(self):
+        self.start()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+        return False
+
+def start_for_demos():
+    """Start a fixture server and point this process (and its children) at it"""
+    server = FixtureServer()
+    os.environ[BASE_URL_ENV] = server.start()
+    print(f"Serving DemoQA fixtures at {server.url}")
+    return server
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the local DemoQA fixture pages")
+    parser.add_argument("--host", default="127.0.0.1", help="interface to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8000, help="port to listen on (default: 8000)")
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    args = parser.parse_args(argv)
+    
+    FixtureHandler.quiet = not args.verbose
+    server = FixtureServer(args.host, args.port)
+    print(f"Serving {FIXTURES_DIR} at {server.url}")
+    print(f"Run the demos against it with: export {BASE_URL_ENV}={server.url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Form Fill
+=========
+Fill a whole form in one script call using the native value setter plus
+input/change events (so React state follows), falling back to send_keys
+per field only for fields that reject programmatic input
+"""
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+
+from dom_waits import locator_spec
+
+FILL_SCRIPT = """
+var targets = arguments[0], values = arguments[1];
+var result = {elements: {}, rejected: [], missing: []};
+
+function find(target) {
+    if (target.element) return target.element;
+    if (target.xpath) {
+        return document.evaluate(target.xpath, document, null,
+            XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    }
+    return document.querySelector(target.css);
+}
+
+function nativeSetter(el) {
+    // Anything else (contenteditable, custom widgets) has no native value
+    // setter; calling the input one on it throws, so it goes to send_keys
+    var proto = el instanceof HTMLInputElement ? HTMLInputElement.prototype :
+        el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype :
+        el instanceof HTMLSelectElement ? HTMLSelectElement.prototype : null;
+    var descriptor = proto && Object.getOwnPropertyDescriptor(proto, "value");
+    return descriptor ? descriptor.set : null;
+}
+
+for (var name in values) {
+    var el = find(targets[name]);
+    if (!el) { result.missing.push(name); continue; }
+    result.elements[name] = el;
+    
+    var setter = nativeSetter(el);
+    if (!setter || el.disabled || el.readOnly || el.type === "file") {
+        result.rejected.push(name);
+        continue;
+    }
+    
+    // React tracks the last value it saw; the prototype setter bypasses its
+    // instance override so the dispatched input event is seen as a change
+    try {
+        setter.call(el, values[name]);
+        el.dispatchEvent(new Event("input", {bubbles: true}));
+        el.dispatchEvent(new Event("change", {bubbles: true}));
+    } catch (e) {
+        // One failing field falls back on its own instead of aborting the batch
+        result.rejected.push(name);
+        continue;
+    }
+    
+    if (el.value !== values[name]) result.rejected.push(name);
+}
+return result;
+"""
+
+READ_VALUES_SCRIPT = """
+var elements = arguments[0], values = {};
+for (var name in elements) values[name] = elements[name].value;
+return values;
+"""
+
+def fill_targets(values, locators):
+    """Map each field name to an element or a CSS/XPath query for the fill script"""
+    locators = locators or {}
+    targets = {}
+    for name in values:
+        locator = locators.get(name, (By.ID, name))
+        if isinstance(locator, WebElement):
+            targets[name] = {'element': locator, 'css': None, 'xpath': None}
+        else:
+            targets[name] = locator_spec(locator)
+    return targets
+
+def read_values(driver, elements):
+    """Read the current value of every element in one script call"""
+    if not elements:
+        return {}
+    return driver.execute_script(READ_VALUES_SCRIPT, elements)
+
+def fill_form(driver, values, locators=None, verify=True):
+    """Set every field in values with one script call and verify them with a second
+    
+    locators maps field names to (By, value) tuples or WebElements; unmapped
+    names are looked up by ID. Returns a dict with 'filled', 'fallback',
+    'missing' and 'mismatches' entries.
+    """
+    values = {name: str(value) for name, value in values.items()}
+    result = driver.execute_script(FILL_SCRIPT, fill_targets(values, locators), values)
+    
+    elements = result.get('elements') or {}
+    rejected = result.get('rejected') or []
+    missing = result.get('missing') or []
+    
+    for name in rejected:
+        element = elements[name]
+        element.clear()
+        element.send_keys(values[name])
+    
+    mismatches = {}
+    if verify:
+        actual = read_values(driver, elements)
+        mismatches = {name: (values[name], actual.get(name))
+                      for name in elements if actual.get(name) != values[name]}
+    
+    return {
+        'filled': [name for name in elements if name not in rejected],
+        'fallback': rejected,
+        'missing': missing,
+        'mismatches': mismatches
+    }
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Gesture Builder
+===============
+Compose a whole interaction script (hover paths, drags and resizes, chorded
+keys, pauses) into one W3C Actions payload and dispatch it in a single
+request, instead of one ActionChains.perform() round trip per step
+"""
+
+import time
+
+from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.remote.webelement import WebElement
+
+from demo_settings import gesture_timing
+
+KEY_NAMES = {}
+for _name, _value in vars(Keys).items():
+    if not _name.startswith("_") and isinstance(_value, str):
+        KEY_NAMES.setdefault(_value, "Keys." + _name)
+
+def describe(value):
+    """Short label text for a step argument, without asking the browser"""
+    if isinstance(value, WebElement):
+        return "element"
+    if value in KEY_NAMES:
+        return KEY_NAMES[value]
+    if isinstance(value, str):
+        return repr(value if len(value) <= 20 else value[:17] + "...")
+    return str(value)
+
+def on(element):
+    """Label arguments for an optional target element"""
+    return () if element is None else (element,)
+
+class GestureBuilder:
+    """Chainable gesture steps sent as one Actions request
+    
+    With timed=True (or SELENIUM_DEMO_GESTURE_TIMING set) every step goes out
+    as its own request and is timed, which shows where a gesture stalls. Key
+    and button state carries over between requests, so a gesture behaves the
+    same either way.
+    """
+    
+    def __init__(self, driver, timed=None, duration=250):
+        self.driver = driver
+        self.timed = gesture_timing() if timed is None else timed
+        self.duration = duration
+        self.steps = []
+        self.timings = []
+    
+    def _step(self, name, apply, *args):
+        self.steps.append((f"{name}({', '.join(describe(arg) for arg in args)})", apply))
+        return self
+    
+    def click(self, element=None):
+        return self._step("click", lambda chain: chain.click(element), *on(element))
+    
+    def double_click(self, element=None):
+        return self._step("double_click", lambda chain: chain.double_click(element), *on(element))
+    
+    def context_click(self, element=None):
+        return self._step("context_click", lambda chain: chain.context_click(element), *on(element))
+    
+    def click_and_hold(self, element=None):
+        return self._step("click_and_hold", lambda chain: chain.click_and_hold(element), *on(element))
+    
+    def release(self, element=None):
+        return self._step("release", lambda chain: chain.release(element), *on(element))
+    
+    def move_to_element(self, element):
+        return self._step("move_to_element", lambda chain: chain.move_to_element(element), element)
+    
+    def move_by_offset(self, x, y):
+        return self._step("move_by_offset", lambda chain: chain.move_by_offset(x, y), x, y)
+    
+    def key_down(self, key, element=None):
+        return self._step("key_down", lambda chain: chain.key_down(key, element), key)
+    
+    def key_up(self, key, element=None):
+        return self._step("key_up", lambda chain: chain.key_up(key, element), key)
+    
+    def send_keys(self, *keys):
+        return self._step("send_keys", lambda chain: chain.send_keys(*keys), "".join(keys))
+    
+    def pause(self, seconds):
+        """Wait inside the gesture; the browser holds the pause, not a Python sleep"""
+        return self._step("pause", lambda chain: chain.pause(seconds), seconds)
+    
+    def chord(self, modifier, keys):
+        """Type keys with a modifier held, e.g. chord(Keys.CONTROL, "a")"""
+        return self._step("chord", lambda chain: chain.key_down(modifier).send_keys(keys).key_up(modifier),
+                          modifier, keys)
+    
+    def hover(self, *elements, dwell=0):
+        """Move over each element in turn, waiting dwell seconds on each (menus that open on hover)"""
+        for element in elements:
+            self.move_to_element(element)
+            if dwell:
+                self.pause(dwell)
+        return self
+    
+    def drag_and_drop(self, source, target):
+        return self._step("drag_and_drop", lambda chain: chain.drag_and_drop(source, target), source, target)
+    
+    def drag_by(self, element, x, y):
+        """Press on element, move by (x, y) and release: resize handles and sliders"""
+        return self._step("drag_by", lambda chain: chain.click_and_hold(element).move_by_offset(x, y).release(),
+                          element, x, y)
+    
+    def perform(self):
+        """Dispatch the gesture and clear it; returns the per-step timings in timed mode"""
+        steps, self.steps = self.steps, []
+        self.timings = []
+        if not steps:
+            return self.timings
+        
+        if not self.timed:
+            chain = ActionChains(self.driver, duration=self.duration)
+            for _, apply in steps:
+                apply(chain)
+            chain.perform()
+            return self.timings
+        
+        for label, apply in steps:
+            chain = ActionChains(self.driver, duration=self.duration)
+            apply(chain)
+            start = time.perf_counter()
+            chain.perform()
+            self.timings.append((label, (time.perf_counter() - start) * 1000))
+        return self.timings
+    
+    def print_timings(self):
+        if not self.timings:
+            return
+        print(f"Gesture steps ({sum(ms for _, ms in self.timings):.0f} ms in {len(self.timings)} requests):")
+        for label, ms in self.timings:
+            print(f"   {ms:>7.1f} ms  {label}")
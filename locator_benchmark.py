@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Locator Benchmark
+=================
+Collect every locator the demos use (from dry runs, plus a scan of their
+source for locators the dry run never reached), resolve each one many times
+against the local page snapshots, and report median and p99 latency per
+strategy. Slow and ambiguous locators are flagged, with a faster equivalent
+that selects the same element when one exists
+"""
+
+import argparse
+import ast
+import re
+import sys
+import time
+from collections import OrderedDict
+
+from lxml import html as lxml_html
+from selenium.webdriver.common.by import By
+
+from dom_waits import locator_spec
+from dry_dom import DEFAULT_PAGES, SnapshotPages, compile_locator, dry_run_demo, match
+from percentiles import percentile
+
+DEMOS = [
+    "01_basic_browser_launch.py",
+    "02_find_elements.py",
+    "03_search_functionality.py",
+    "04_multiple_elements.py",
+    "05_forms_and_inputs.py",
+    "06_waits_and_timing.py",
+    "07_advanced_interactions.py",
+    "08_page_navigation.py",
+    "09_screenshots_and_debugging.py",
+    "10_final_automation.py"
+]
+
+BY_NAMES = {name: getattr(By, name) for name in ("ID", "XPATH", "LINK_TEXT", "PARTIAL_LINK_TEXT",
+                                                 "NAME", "TAG_NAME", "CLASS_NAME", "CSS_SELECTOR")}
+
+# Identifiers that can go into a CSS selector without escaping
+CSS_IDENT = re.compile(r"^-?[A-Za-z_][\w-]*$")
+# Helper modules send By.ID locators to the page as [id="..."] selectors
+ID_SELECTOR = re.compile(r'^(\[id="[^"]+"\]|#-?[A-Za-z_][\w-]*)$')
+
+def is_id_locator(by, value):
+    return by == By.ID or (by == By.CSS_SELECTOR and bool(ID_SELECTOR.match(value)))
+
+def source_locators(demo_file):
+    """Return (line, By, value, page path) for every literal (By.X, "...") pair in a demo file
+    
+    The page is the path of the closest demo_url("...") call above the
+    locator, which is where a straight-line demo will be when it runs.
+    """
+    with open(demo_file, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), demo_file)
+    
+    pages = []
+    pairs = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call):
+            if getattr(node.func, "id", None) == "demo_url" and node.args \
+                    and isinstance(node.args[0], ast.Constant):
+                pages.append((node.lineno, node.args[0].value))
+            arguments = node.args
+        elif isinstance(node, ast.Tuple):
+            arguments = node.elts
+        else:
+            continue
+        if len(arguments) >= 2 and isinstance(arguments[0], ast.Attribute) \
+                and getattr(arguments[0].value, "id", None) == "By" and arguments[0].attr in BY_NAMES \
+                and isinstance(arguments[1], ast.Constant) and isinstance(arguments[1].value, str):
+            pairs.append((node.lineno, BY_NAMES[arguments[0].attr], arguments[1].value))
+    
+    pages.sort()
+    locators = []
+    for line, by, value in sorted(set(pairs)):
+        before = [path for page_line, path in pages if page_line <= line]
+        locators.append((line, by, value, "/" + before[-1].lstrip("/") if before else "/"))
+    return locators
+
+def collect_locators(demo_files, pages):
+    """Return one entry per distinct (page, By, value) used by the demos"""
+    locators = OrderedDict()
+    for demo_file in demo_files:
+        try:
+            driver, _ = dry_run_demo(demo_file, pages)
+            lookups = driver.lookups
+        except Exception as e:
+            print(f"Dry run of {demo_file} failed ({e}); using its source locators only")
+            lookups = []
+        
+        for path, by, value, count, kind in lookups:
+            entry = locators.setdefault((path, by, value), {
+                'page': path, 'by': by, 'value': value, 'demo': demo_file,
+                'single': False, 'reached': True
+            })
+            entry['single'] = entry['single'] or kind != "find_elements"
+        
+        reached = {(by, value) for _, by, value, _, _ in lookups}
+        for _, by, value, path in source_locators(demo_file):
+            if (by, value) not in reached:
+                locators.setdefault((path, by, value), {
+                    'page': path, 'by': by, 'value': value, 'demo': demo_file,
+                    'single': True, 'reached': False
+                })
+    return list(locators.values())
+
+def time_locator(root, by, value, repeat):
+    """Resolve a locator repeat times and return the sorted latencies in microseconds"""
+    compile_locator(by, value)
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        match(root, by, value)
+        samples.append((time.perf_counter_ns() - start) / 1000)
+    samples.sort()
+    return samples
+
+def candidate_locators(root, node):
+    """Yield simpler locators that might select this node"""
+    tag = node.tag
+    if node.get("id"):
+        yield By.ID, node.get("id")
+    if node.get("name"):
+        yield By.NAME, node.get("name")
+    classes = [name for name in node.get("class", "").split() if CSS_IDENT.match(name)]
+    if classes:
+        yield By.CSS_SELECTOR, tag + "".join("." + name for name in classes)
+    for attribute in ("for", "value", "type"):
+        if node.get(attribute) and CSS_IDENT.match(node.get(attribute)):
+            yield By.CSS_SELECTOR, f"{tag}[{attribute}='{node.get(attribute)}']"
+    parent = node.getparent()
+    if parent is not None and parent.get("id") and CSS_IDENT.match(parent.get("id")):
+        yield By.CSS_SELECTOR, f"#{parent.get('id')} > {tag}"
+
+def faster_equivalent(root, entry, nodes, repeat):
+    """Return (By, value, median_us) of a better locator selecting the same element(s), or None"""
+    original = locator_spec((entry['by'], entry['value']))
+    best = None
+    for by, value in candidate_locators(root, nodes[0]):
+        if locator_spec((by, value)) == original:
+            continue
+        selected = match(root, by, value)
+        # A find_element locator should pick out exactly that element; a
+        # find_elements locator must select the same list
+        if selected != (nodes[:1] if entry['single'] else nodes):
+            continue
+        median = percentile(time_locator(root, by, value, repeat), 0.5)
+        if by == By.ID:
+            # Browsers resolve IDs from an index, whatever the snapshot timing says
+            return by, value, median
+        if best is None or median < best[2]:
+            best = (by, value, median)
+    return best
+
+def run_benchmark(locators, pages, repeat=200, slow_factor=2.0):
+    """Time every locator on its page and attach results, flags and suggestions to each entry"""
+    trees = {}
+    for entry in locators:
+        if entry['page'] not in trees:
+            source = pages.html_for(entry['page'])
+            trees[entry['page']] = lxml_html.document_fromstring(source) if source else None
+        root = trees[entry['page']]
+        entry['samples'] = []
+        entry['matches'] = 0
+        entry['suggestion'] = None
+        if root is None:
+            continue
+        nodes = match(root, entry['by'], entry['value'])
+        entry['matches'] = len(nodes)
+        entry['samples'] = time_locator(root, entry['by'], entry['value'], repeat)
+        entry['median'] = percentile(entry['samples'], 0.5)
+        entry['p99'] = percentile(entry['samples'], 0.99)
+        entry['ambiguous'] = entry['single'] and len(nodes) > 1
+        entry['suggestion'] = faster_equivalent(root, entry, nodes, repeat) \
+            if nodes and not is_id_locator(entry['by'], entry['value']) else None
+    
+    # Cost grows with page size, so each locator is compared with the others on its page
+    timed = [entry for entry in locators if entry['samples']]
+    page_medians = {}
+    for entry in timed:
+        page_medians.setdefault(entry['page'], []).append(entry['median'])
+    for entry in timed:
+        page_median = percentile(sorted(page_medians[entry['page']]), 0.5)
+        entry['slow'] = entry['matches'] > 0 and not is_id_locator(entry['by'], entry['value']) and entry['median'] > page_median * slow_factor
+        suggestion = entry['suggestion']
+        # Suggest a replacement when it fixes an ambiguity, swaps a slow lookup
+        # for an ID, or is clearly faster
+        if suggestion and not (entry['ambiguous'] or (entry['slow'] and suggestion[0] == By.ID)
+                               or suggestion[2] < entry['median'] * 0.8):
+            entry['suggestion'] = None
+    return timed
+
+def strategy_stats(timed):
+    """Median and p99 over all samples of each locator strategy"""
+    samples = OrderedDict()
+    for entry in sorted(timed, key=lambda entry: entry['by']):
+        samples.setdefault(entry['by'], {'locators': 0, 'samples': []})
+        samples[entry['by']]['locators'] += 1
+        samples[entry['by']]['samples'].extend(entry['samples'])
+    stats = []
+    for by, data in samples.items():
+        values = sorted(data['samples'])
+        stats.append({'by': by, 'locators': data['locators'],
+                      'median': percentile(values, 0.5), 'p99': percentile(values, 0.99)})
+    return stats
+
+def print_results(locators, timed, repeat):
+    """Print per-strategy latency, then the flagged locators"""
+    print(f"\nLocator resolution over {len(timed)} locators, {repeat} runs each (microseconds):")
+    print(f"   {'strategy':<18} {'locators':>8} {'median':>9} {'p99':>9}")
+    for stats in strategy_stats(timed):
+        print(f"   {stats['by']:<18} {stats['locators']:>8} {stats['median']:>9.1f} {stats['p99']:>9.1f}")
+    
+    flagged = [entry for entry in timed if entry['slow'] or entry['ambiguous'] or entry['suggestion']]
+    missing = [entry for entry in timed if not entry['matches']]
+    if flagged:
+        print("\nFlagged locators:")
+    for entry in flagged:
+        flags = [name for name in ("slow", "ambiguous") if entry[name]]
+        print(f"   {entry['demo']} {entry['page']}  {entry['by']}={entry['value']}")
+        print(f"      median {entry['median']:.1f} us, p99 {entry['p99']:.1f} us, {entry['matches']} matches"
+              + (f" [{', '.join(flags)}]" if flags else ""))
+        if entry['suggestion']:
+            by, value, median = entry['suggestion']
+            print(f"      try {by}={value} (median {median:.1f} us)")
+    if missing:
+        print(f"\n{len(missing)} locators match nothing in the snapshots (elements created by page scripts, "
+              f"or pages the demo never reached):")
+        for entry in missing:
+            reached = "" if entry['reached'] else " (not reached by the dry run)"
+            print(f"   {entry['demo']} {entry['page']}  {entry['by']}={entry['value']}{reached}")
+    skipped = [entry for entry in locators if not entry['samples']]
+    for entry in skipped:
+        print(f"   no snapshot of {entry['page']} for {entry['by']}={entry['value']}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the demos' locators against local page snapshots")
+    parser.add_argument("demos", nargs="*", default=DEMOS, help="demo files (default: all ten demos)")
+    parser.add_argument("--pages", default=DEFAULT_PAGES,
+                        help="fixture directory or recorded .session.gz log (default: fixtures/demoqa)")
+    parser.add_argument("--repeat", type=int, default=200, help="resolutions per locator (default: 200)")
+    parser.add_argument("--slow-factor", type=float, default=2.0,
+                        help="flag locators slower than this multiple of the median locator on their page (default: 2.0)")
+    args = parser.parse_args(argv)
+    
+    pages = SnapshotPages(args.pages)
+    locators = collect_locators(args.demos, pages)
+    timed = run_benchmark(locators, pages, args.repeat, args.slow_factor)
+    print_results(locators, timed, args.repeat)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
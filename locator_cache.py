@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Locator Cache
+=============
+Memoize element references per (page URL, locator). Entries are invalidated
+by navigation, write commands, or a stale-element error. After a write
+command the next lookup re-reads a MutationObserver's DOM generation counter
+and keeps the entries only if nothing changed. Hits between commands do not
+ask the page, so changes the page makes on its own (timers, XHR, framework
+renders) go unseen until the next write command
+"""
+
+from selenium.webdriver.common.by import By
+
+from dom_waits import locator_spec
+from element_snapshot import SNAPSHOT_SCRIPT
+from form_fill import READ_VALUES_SCRIPT
+
+FIND_SCRIPT = """
+var spec = arguments[0], all = arguments[1];
+var state = window.__seleniumDemoDom;
+if (!state || state.document !== document) {
+    state = window.__seleniumDemoDom = {
+        token: Math.random().toString(36).slice(2), generation: 0, document: document
+    };
+    new MutationObserver(function() { state.generation++; }).observe(document,
+        {childList: true, subtree: true, attributes: true, characterData: true});
+}
+
+var elements = [];
+if (spec && spec.xpath) {
+    var found = document.evaluate(spec.xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (var i = 0; i < found.snapshotLength && (all || !elements.length); i++) {
+        if (found.snapshotItem(i).nodeType === 1) elements.push(found.snapshotItem(i));
+    }
+} else if (spec) {
+    elements = all ? Array.prototype.slice.call(document.querySelectorAll(spec.css))
+                   : [document.querySelector(spec.css)].filter(Boolean);
+}
+return {token: state.token, generation: state.generation, url: location.href, elements: elements};
+"""
+
+# Commands that cannot change the DOM; anything else may, and the next hit re-checks the generation
+READ_ONLY_COMMANDS = frozenset((
+    "findElement", "findElements", "findChildElement", "findChildElements",
+    "getElementText", "getElementTagName", "isElementSelected", "isElementEnabled",
+    "getElementRect", "getElementAttribute", "getElementProperty", "getElementValueOfCssProperty",
+    "getElementAriaRole", "getElementAriaLabel", "getCurrentUrl", "getPageSource", "getTitle",
+    "screenshot", "elementScreenshot", "getLog", "getAvailableLogTypes", "getTimeouts", "setTimeouts",
+    "getWindowRect", "w3cGetCurrentWindowHandle", "w3cGetWindowHandles", "getCookies", "getCookie",
+    "w3cGetAlertText"
+))
+# Scripts Selenium and the helper modules send that only read the page
+READ_ONLY_SCRIPTS = ("/* getAttribute */", "/* isDisplayed */", "return arguments[0][arguments[1]]",
+                     FIND_SCRIPT, SNAPSHOT_SCRIPT, READ_VALUES_SCRIPT)
+# These load a different document (or switch to one); every entry goes
+NAVIGATION_COMMANDS = frozenset(("get", "goBack", "goForward", "refresh", "switchToWindow",
+                                 "switchToFrame", "switchToParentFrame", "newWindow", "close"))
+
+def is_stale_error(response):
+    return isinstance(response, dict) and response.get("status") not in (None, 0, 200) \
+        and "stale element reference" in str(response.get("value"))
+
+class LocatorCache:
+    """find_element/find_elements with element references memoized per page and DOM generation
+    
+    Drivers without a command executor (dry runs) are passed straight through.
+    Do not poll find_elements through the cache while waiting for the page to
+    add or remove elements: a hit keeps returning the old list.
+    The cache wraps the executor until detach() (or the end of a with block);
+    detach it before other executor wrappers so each restores the one below.
+    """
+    
+    def __init__(self, driver):
+        self.driver = driver
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.invalidations = 0
+        self._state = None
+        self._verified = False
+        self._executor = None
+        self._patched_execute = None
+        if getattr(driver, "command_executor", None) is not None:
+            self.attach()
+    
+    def attach(self):
+        """Watch the driver's commands for navigation, possible DOM changes and stale elements"""
+        executor = self.driver.command_executor
+        original_execute = executor.execute
+        
+        def watched_execute(command, params):
+            response = original_execute(command, params)
+            if command in NAVIGATION_COMMANDS:
+                self.invalidate()
+            elif is_stale_error(response):
+                self.invalidate()
+            elif command not in READ_ONLY_COMMANDS and not self._read_only_script(command, params):
+                self._verified = False
+            return response
+        
+        self._patched_execute = executor.__dict__.get("execute")
+        executor.execute = watched_execute
+        self._executor = executor
+        return self
+    
+    def detach(self):
+        """Restore the driver's original command executor"""
+        if self._executor is not None:
+            if self._patched_execute is not None:
+                self._executor.execute = self._patched_execute
+            else:
+                del self._executor.execute
+            self._executor = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.detach()
+        return False
+    
+    @staticmethod
+    def _read_only_script(command, params):
+        if command not in ("w3cExecuteScript", "w3cExecuteScriptAsync") or not params:
+            return False
+        script = params.get("script") or ""
+        return any(script == known or script.startswith(known) for known in READ_ONLY_SCRIPTS)
+    
+    def invalidate(self):
+        """Forget every cached element"""
+        if self.entries:
+            self.invalidations += 1
+        self.entries.clear()
+        self._state = None
+        self._verified = False
+    
+    def _run(self, locator, all_elements):
+        result = self.driver.execute_script(FIND_SCRIPT, locator_spec(locator) if locator else None, all_elements)
+        state = (result['token'], result['generation'], result['url'])
+        if state != self._state:
+            # The DOM changed (or this is another document): nothing cached is trustworthy
+            if self.entries:
+                self.invalidations += 1
+            self.entries.clear()
+            self._state = state
+        self._verified = True
+        return result.get('elements') or []
+    
+    def _lookup(self, locator, all_elements):
+        if self._executor is None:
+            return None
+        key = (self.url, locator, all_elements)
+        if key in self.entries and self._verified:
+            self.hits += 1
+            return self.entries[key]
+        
+        # A lookup after a possible DOM change re-validates every entry in the same round trip
+        cached = key in self.entries
+        elements = self._run(locator, all_elements)
+        key = (self.url, locator, all_elements)
+        if cached and key in self.entries:
+            self.revalidated += 1
+        else:
+            self.misses += 1
+        if elements:
+            self.entries[key] = elements
+        return elements
+    
+    def find_element(self, by=By.ID, value=None):
+        """Like driver.find_element; a cached element is returned while the page is unchanged"""
+        elements = self._lookup((by, value), False)
+        if not elements:
+            # Not there yet: fall back to the driver so its implicit wait applies
+            return self.driver.find_element(by, value)
+        return elements[0]
+    
+    def find_elements(self, by=By.ID, value=None):
+        """Like driver.find_elements; a cached list is returned while the page is unchanged"""
+        elements = self._lookup((by, value), True)
+        if not elements:
+            return self.driver.find_elements(by, value)
+        return list(elements)
+    
+    @property
+    def url(self):
+        return self._state[2] if self._state else None
+    
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'revalidated': self.revalidated,
+                'invalidations': self.invalidations, 'entries': len(self.entries)}
+    
+    def print_stats(self):
+        if self._executor is None:
+            return
+        print(f"Locator cache: {self.hits} hits, {self.revalidated} re-validated after page activity, "
+              f"{self.misses} misses, {self.invalidations} invalidations")
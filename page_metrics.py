@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Page Metrics
+============
+Collect Navigation Timing, paint, LCP, CLS and long-task metrics after a
+navigation through buffered PerformanceObservers, and check them against
+per-page budgets such as "/text-box DOMContentLoaded < 1.5s"
+"""
+
+import re
+
+from selenium.common.exceptions import WebDriverException
+
+COLLECT_SCRIPT = """
+var settleMs = arguments[0], done = arguments[arguments.length - 1];
+var lcp = null, shifts = [], longTasks = [];
+var observers = [];
+
+function observe(type, handler) {
+    try {
+        var observer = new PerformanceObserver(function(list) { list.getEntries().forEach(handler); });
+        // buffered: true replays entries recorded before the observer existed
+        observer.observe({type: type, buffered: true});
+        observers.push(observer);
+    } catch (e) {}
+}
+
+observe("largest-contentful-paint", function(entry) { lcp = entry; });
+observe("layout-shift", function(entry) {
+    if (!entry.hadRecentInput) shifts.push([entry.startTime, entry.value]);
+});
+observe("longtask", function(entry) { longTasks.push(entry.duration); });
+
+function cumulativeLayoutShift() {
+    // Largest session window: shifts less than 1s apart, window at most 5s long
+    var best = 0, current = 0, windowStart = 0, previous = -Infinity;
+    shifts.forEach(function(shift) {
+        if (shift[0] - previous > 1000 || shift[0] - windowStart > 5000) {
+            current = 0;
+            windowStart = shift[0];
+        }
+        current += shift[1];
+        previous = shift[0];
+        best = Math.max(best, current);
+    });
+    return best;
+}
+
+function collect() {
+    observers.forEach(function(observer) { observer.disconnect(); });
+    var nav = performance.getEntriesByType("navigation")[0];
+    var paints = {};
+    performance.getEntriesByType("paint").forEach(function(entry) { paints[entry.name] = entry.startTime; });
+    var blocking = 0;
+    longTasks.forEach(function(duration) { blocking += Math.max(0, duration - 50); });
+    
+    done({
+        url: location.href,
+        ttfb: nav ? nav.responseStart : null,
+        dom_content_loaded: nav ? nav.domContentLoadedEventEnd : null,
+        load: nav && nav.loadEventEnd ? nav.loadEventEnd : null,
+        transfer_size: nav ? nav.transferSize : null,
+        first_paint: paints["first-paint"] || null,
+        first_contentful_paint: paints["first-contentful-paint"] || null,
+        lcp: lcp ? lcp.startTime : null,
+        lcp_element: lcp && lcp.element ? lcp.element.tagName.toLowerCase() : null,
+        cls: cumulativeLayoutShift(),
+        long_tasks: longTasks.length,
+        total_blocking_time: blocking
+    });
+}
+
+// Buffered entries are delivered in a later task; give them a moment to arrive
+function settle() { setTimeout(collect, settleMs); }
+if (document.readyState === "complete") settle();
+else window.addEventListener("load", settle, {once: true});
+"""
+
+METRIC_ALIASES = {
+    'ttfb': 'ttfb',
+    'domcontentloaded': 'dom_content_loaded',
+    'dcl': 'dom_content_loaded',
+    'load': 'load',
+    'fp': 'first_paint',
+    'firstpaint': 'first_paint',
+    'fcp': 'first_contentful_paint',
+    'firstcontentfulpaint': 'first_contentful_paint',
+    'lcp': 'lcp',
+    'cls': 'cls',
+    'tbt': 'total_blocking_time',
+    'longtasks': 'long_tasks',
+    'transfersize': 'transfer_size'
+}
+
+BUDGET_PATTERN = re.compile(r"^\s*(\S+)\s+([A-Za-z_-]+)\s*(<=|<)\s*([\d.]+)\s*(ms|s|kb|mb)?\s*$", re.IGNORECASE)
+
+class Budget:
+    """A limit on one metric for pages whose URL contains url_part"""
+    
+    def __init__(self, url_part, metric, limit, inclusive=False, text=None):
+        self.url_part = url_part
+        self.metric = metric
+        self.limit = limit
+        self.inclusive = inclusive
+        self.text = text or f"{url_part} {metric} {'<=' if inclusive else '<'} {limit}"
+    
+    def applies_to(self, url):
+        return self.url_part == "*" or self.url_part in url
+    
+    def check(self, metrics):
+        """Return a violation dict if metrics break this budget, else None"""
+        value = metrics.get(self.metric)
+        if value is None or value < self.limit or (self.inclusive and value == self.limit):
+            return None
+        return {
+            'budget': self.text,
+            'url': metrics.get('url'),
+            'metric': self.metric,
+            'value': round(value, 3),
+            'limit': self.limit
+        }
+    
+    def __repr__(self):
+        return f"Budget({self.text!r})"
+
+def parse_budget(text):
+    """Parse "<url part> <metric> < <limit>[ms|s|kb|mb]" into a Budget
+    
+    Timing limits are stored in milliseconds (a bare number means ms) and
+    sizes in bytes; CLS and long-task counts take a plain number.
+    """
+    if isinstance(text, Budget):
+        return text
+    match = BUDGET_PATTERN.match(text)
+    if not match:
+        raise ValueError(f"Cannot parse performance budget: {text!r}")
+    
+    url_part, metric_name, operator, number, unit = match.groups()
+    metric = METRIC_ALIASES.get(metric_name.lower().replace("-", "").replace("_", ""))
+    if metric is None:
+        raise ValueError(f"Unknown metric in performance budget: {metric_name!r}")
+    
+    limit = float(number)
+    unit = (unit or "").lower()
+    if unit == "s":
+        limit *= 1000
+    elif unit == "kb":
+        limit *= 1024
+    elif unit == "mb":
+        limit *= 1024 * 1024
+    return Budget(url_part, metric, limit, operator == "<=", text.strip())
+
+def collect_metrics(driver, settle_ms=100):
+    """Read the current page's metrics in one async script call (times in ms)"""
+    return driver.execute_async_script(COLLECT_SCRIPT, settle_ms)
+
+class MetricsCollector:
+    """Collects metrics after each navigation and records budget violations"""
+    
+    def __init__(self, driver, budgets=(), settle_ms=100):
+        self.driver = driver
+        self.budgets = [parse_budget(budget) for budget in budgets]
+        self.settle_ms = settle_ms
+        self.pages = []
+        self.violations = []
+    
+    def collect(self, budgets=()):
+        """Collect metrics for the current page and check the shared plus given budgets"""
+        try:
+            metrics = collect_metrics(self.driver, self.settle_ms)
+        except WebDriverException as e:
+            print(f"Could not collect page metrics: {e}")
+            return None
+        
+        for budget in self.budgets + [parse_budget(budget) for budget in budgets]:
+            if budget.applies_to(metrics['url']):
+                violation = budget.check(metrics)
+                if violation:
+                    self.violations.append(violation)
+        self.pages.append(metrics)
+        return metrics
+    
+    def drain(self):
+        """Return and forget the pages and violations recorded since the last drain"""
+        pages, violations = self.pages, self.violations
+        self.pages, self.violations = [], []
+        return pages, violations
+
+def format_metrics(metrics):
+    """One-line summary of a page's metrics"""
+    def ms(name):
+        value = metrics.get(name)
+        return f"{value:.0f} ms" if value is not None else "n/a"
+    return (f"TTFB {ms('ttfb')}, DCL {ms('dom_content_loaded')}, load {ms('load')}, "
+            f"FCP {ms('first_contentful_paint')}, LCP {ms('lcp')}, CLS {metrics.get('cls', 0):.3f}, "
+            f"long tasks {metrics.get('long_tasks', 0)} (TBT {ms('total_blocking_time')})")
+
+def format_violation(violation):
+    """One-line description of a broken budget"""
+    return f"{violation['budget']} (measured {violation['value']:g} on {violation['url']})"
@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+"""
+Percentiles
+===========
+Small statistics helpers shared by the run-history index and the locator benchmark
+"""
+
+def percentile(sorted_values, fraction):
+    """Linearly interpolated percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    position = (len(sorted_values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Performance Log
+===============
+Drain Chrome's performance log incrementally while a test runs, parse only
+the network and page events that matter, and keep one row per request in a
+column-oriented table so per-page summaries never need the raw log
+"""
+
+import json
+import re
+from array import array
+from collections import Counter
+
+from selenium.common.exceptions import WebDriverException
+
+NETWORK_METHODS = frozenset((
+    "Network.requestWillBeSent",
+    "Network.responseReceived",
+    "Network.loadingFinished",
+    "Network.loadingFailed"
+))
+
+# The method name sits near the start of every message, so it can be read
+# without parsing the (often large) params object
+METHOD_PATTERN = re.compile(r'"method"\s*:\s*"([^"]+)"')
+
+def enable_performance_log(chrome_options):
+    """Turn on Chrome's performance log (network and page events) for these options"""
+    chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL", "browser": "ALL"})
+    return chrome_options
+
+class NetworkTable:
+    """Per-request network records stored column by column in typed arrays"""
+    
+    FAILED = 1
+    BLOCKED = 2
+    
+    def __init__(self):
+        self.page = array("i")
+        self.url = []
+        self.resource_type = array("i")
+        self.status = array("h")
+        self.encoded_bytes = array("q")
+        self.started = array("d")
+        self.finished = array("d")
+        self.failed = array("b")  # 0 ok, FAILED or BLOCKED
+        self._types = []
+        self._type_ids = {}
+    
+    def __len__(self):
+        return len(self.url)
+    
+    def type_id(self, resource_type):
+        """Intern a resource type name and return its small integer id"""
+        if resource_type not in self._type_ids:
+            self._type_ids[resource_type] = len(self._types)
+            self._types.append(resource_type)
+        return self._type_ids[resource_type]
+    
+    def type_name(self, type_id):
+        return self._types[type_id]
+    
+    def add(self, page, url, resource_type, started):
+        """Append a request and return its row index"""
+        self.page.append(page)
+        self.url.append(url)
+        self.resource_type.append(self.type_id(resource_type or "Other"))
+        self.status.append(0)
+        self.encoded_bytes.append(0)
+        self.started.append(started)
+        self.finished.append(0.0)
+        self.failed.append(0)
+        return len(self.url) - 1
+    
+    def duration_ms(self, row):
+        """Time from request to last byte, or None while the request is in flight"""
+        if not self.finished[row]:
+            return None
+        return (self.finished[row] - self.started[row]) * 1000
+    
+    def row(self, index):
+        """Return one request as a dict"""
+        return {
+            'page': self.page[index],
+            'url': self.url[index],
+            'resource_type': self.type_name(self.resource_type[index]),
+            'status': self.status[index],
+            'encoded_bytes': self.encoded_bytes[index],
+            'duration_ms': self.duration_ms(index),
+            'failed': self.failed[index] == self.FAILED,
+            'blocked': self.failed[index] == self.BLOCKED
+        }
+    
+    def rows(self, page=None):
+        """Yield requests as dicts, optionally only those of one page"""
+        for index in range(len(self)):
+            if page is None or self.page[index] == page:
+                yield self.row(index)
+
+class PerformanceLogPipeline:
+    """Incrementally turns a driver's performance log into a NetworkTable"""
+    
+    def __init__(self, driver):
+        self.driver = driver
+        self.table = NetworkTable()
+        self.pages = []
+        self.available = True
+        self.entries_seen = 0
+        self.entries_parsed = 0
+        self._in_flight = {}
+        self._main_frame = None
+    
+    def drain(self):
+        """Pull whatever Chrome has buffered since the last drain; return the entry count"""
+        if not self.available:
+            return 0
+        try:
+            entries = self.driver.get_log("performance")
+        except WebDriverException:
+            # Performance logging was not enabled for this browser
+            self.available = False
+            return 0
+        
+        for entry in entries:
+            self.feed(entry.get("message", ""))
+        self.entries_seen += len(entries)
+        return len(entries)
+    
+    def feed(self, message):
+        """Process one raw performance log message"""
+        match = METHOD_PATTERN.search(message, 0, 200)
+        if not match:
+            return
+        method = match.group(1)
+        if method not in NETWORK_METHODS and method != "Page.loadEventFired":
+            return
+        
+        params = json.loads(message).get("message", {}).get("params", {})
+        self.entries_parsed += 1
+        
+        if method == "Network.requestWillBeSent":
+            self._request_sent(params)
+        elif method == "Page.loadEventFired":
+            if self.pages:
+                self.pages[-1]['load_event'] = params.get("timestamp")
+        else:
+            row = self._in_flight.get(params.get("requestId"))
+            if row is None:
+                return
+            if method == "Network.responseReceived":
+                self.table.status[row] = int(params.get("response", {}).get("status", 0))
+            else:
+                self.table.finished[row] = params.get("timestamp", 0.0)
+                if method == "Network.loadingFinished":
+                    self.table.encoded_bytes[row] = int(params.get("encodedDataLength", 0))
+                elif params.get("blockedReason"):
+                    self.table.failed[row] = NetworkTable.BLOCKED
+                else:
+                    self.table.failed[row] = NetworkTable.FAILED
+                del self._in_flight[params.get("requestId")]
+    
+    def _request_sent(self, params):
+        request_id = params.get("requestId")
+        resource_type = params.get("type")
+        frame_id = params.get("frameId")
+        
+        # A top-level document request (its id equals the loader id) starts a new page
+        if (resource_type == "Document" and request_id == params.get("loaderId")
+                and self._main_frame in (None, frame_id)):
+            self._main_frame = frame_id
+            self.pages.append({
+                'url': params.get("request", {}).get("url"),
+                'started': params.get("timestamp"),
+                'load_event': None
+            })
+        
+        if request_id in self._in_flight:
+            # Redirects reuse the request id; the earlier hop is finished
+            self.table.finished[self._in_flight[request_id]] = params.get("timestamp", 0.0)
+        
+        page = len(self.pages) - 1
+        self._in_flight[request_id] = self.table.add(
+            page, params.get("request", {}).get("url"), resource_type, params.get("timestamp", 0.0)
+        )
+    
+    def page_summary(self, page):
+        """Summarize one page: request count, bytes, failures, blocked requests, types and slowest request"""
+        table = self.table
+        info = self.pages[page]
+        requests = total_bytes = failed = blocked = 0
+        by_type = Counter()
+        slowest = (0.0, None)
+        
+        for index in range(len(table)):
+            if table.page[index] != page:
+                continue
+            requests += 1
+            total_bytes += table.encoded_bytes[index]
+            if table.failed[index] == NetworkTable.BLOCKED:
+                blocked += 1
+                continue
+            if table.failed[index] or table.status[index] >= 400:
+                failed += 1
+            by_type[table.type_name(table.resource_type[index])] += 1
+            duration = table.duration_ms(index)
+            if duration is not None and duration > slowest[0]:
+                slowest = (duration, table.url[index])
+        
+        load_ms = None
+        if info['load_event'] and info['started']:
+            load_ms = (info['load_event'] - info['started']) * 1000
+        
+        return {
+            'url': info['url'],
+            'requests': requests,
+            'encoded_bytes': total_bytes,
+            'failed': failed,
+            'blocked': blocked,
+            'load_event_ms': load_ms,
+            'by_type': dict(by_type),
+            'slowest_ms': slowest[0] if slowest[1] else None,
+            'slowest_url': slowest[1]
+        }
+    
+    def page_summaries(self):
+        """Summaries for every page seen so far, in navigation order"""
+        self.drain()
+        return [self.page_summary(page) for page in range(len(self.pages))]
+    
+    def print_summary(self):
+        """Print one block per page"""
+        summaries = self.page_summaries()
+        if not self.available:
+            print("Performance log not enabled for this browser")
+            return
+        print(f"\nNetwork summary ({len(self.table)} requests, "
+              f"{self.entries_parsed}/{self.entries_seen} log entries parsed):")
+        for summary in summaries:
+            load = f"{summary['load_event_ms']:.0f} ms" if summary['load_event_ms'] is not None else "n/a"
+            print(f"  {summary['url']}")
+            print(f"    {summary['requests']} requests, {summary['encoded_bytes'] / 1024:.1f} KB, "
+                  f"{summary['failed']} failed, {summary['blocked']} blocked, load event {load}")
+            if summary['slowest_url']:
+                print(f"    slowest: {summary['slowest_ms']:.0f} ms {summary['slowest_url'][:80]}")
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Record Runner
+=============
+Streams form records from CSV or JSONL through the DemoQA text-box or
+practice-form flow, writing each result as it completes and checkpointing
+progress so an interrupted run resumes where it stopped
+"""
+
+import argparse
+import csv
+import itertools
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+from selenium.webdriver.common.by import By
+
+from batch_lookup import find_many
+from browser_pool import launch_chrome
+from demo_settings import demo_url
+from dom_waits import wait_for_element
+from form_fill import fill_form
+from run_all_demos import load_demo_module
+
+PRACTICE_FORM_URL = demo_url("/automation-practice-form")
+
+PRACTICE_FORM_FIELDS = {
+    'firstName': (By.ID, "firstName"),
+    'lastName': (By.ID, "lastName"),
+    'email': (By.ID, "userEmail"),
+    'mobile': (By.ID, "userNumber"),
+    'address': (By.ID, "currentAddress")
+}
+
+GENDER_LABELS = {
+    'male': "label[for='gender-radio-1']",
+    'female': "label[for='gender-radio-2']",
+    'other': "label[for='gender-radio-3']"
+}
+
+def read_records(path):
+    """Yield records one at a time from a .csv or .jsonl file"""
+    with open(path, newline="") as f:
+        if path.endswith(".jsonl"):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            for row in csv.DictReader(f):
+                yield row
+
+def load_checkpoint(path, source):
+    """Return how many records of source were already completed"""
+    try:
+        with open(path) as f:
+            checkpoint = json.load(f)
+    except (OSError, ValueError):
+        return 0
+    if checkpoint.get('source') != os.path.abspath(source):
+        return 0
+    return checkpoint.get('completed', 0)
+
+def save_checkpoint(path, source, completed):
+    """Atomically record how many records have been completed"""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({
+            'source': os.path.abspath(source),
+            'completed': completed,
+            'updated': datetime.now().isoformat()
+        }, f)
+    os.replace(tmp_path, path)
+
+def truncate_results(path, keep):
+    """Drop result lines written after the last checkpoint so a resume does not duplicate them"""
+    offset = 0
+    with open(path, "rb+") as f:
+        for _ in range(keep):
+            line = f.readline()
+            if not line:
+                break
+            offset += len(line)
+        f.truncate(offset)
+
+class TextBoxFlow:
+    """Text box flow from demo 03: fill, submit and check every value in #output"""
+    
+    def __init__(self):
+        self.demo = load_demo_module("03_search_functionality.py")
+    
+    def run(self, driver, record):
+        driver.get(self.demo.TEXT_BOX_URL)
+        form_data = {key: record.get(key, "") for key in self.demo.TEXT_BOX_FIELDS}
+        output = self.demo.submit_text_box(driver, form_data, fast_fill=True)
+        
+        found = self.demo.check_output(output.text, form_data)
+        missing = [key for key, ok in found.items() if form_data[key] and not ok]
+        if missing:
+            return False, f"Not found in output: {', '.join(missing)}"
+        return True, ""
+
+class PracticeFormFlow:
+    """Practice form flow from demos 05/10: fill basics, submit and check the modal"""
+    
+    def run(self, driver, record):
+        driver.get(PRACTICE_FORM_URL)
+        fields = find_many(driver, dict(PRACTICE_FORM_FIELDS, submit=(By.ID, "submit")), timeout=10)
+        
+        values = {key: record[key] for key in PRACTICE_FORM_FIELDS if record.get(key)}
+        fill_form(driver, values, fields)
+        
+        gender = GENDER_LABELS.get(str(record.get('gender', 'male')).lower(), GENDER_LABELS['male'])
+        driver.execute_script("arguments[0].click();", driver.find_element(By.CSS_SELECTOR, gender))
+        driver.execute_script("arguments[0].click();", fields['submit'])
+        
+        modal = wait_for_element(driver, (By.CSS_SELECTOR, ".modal-body"), visible=True)
+        modal_text = modal.text
+        missing = [key for key, value in values.items() if value not in modal_text]
+        if missing:
+            return False, f"Not found in submission modal: {', '.join(missing)}"
+        return True, ""
+
+FLOWS = {
+    'textbox': TextBoxFlow,
+    'practice': PracticeFormFlow
+}
+
+def run_records(source, flow_name, results_path, restart=False, checkpoint_every=1):
+    """Push every record from source through a flow, appending results as they finish"""
+    checkpoint_path = results_path + ".checkpoint"
+    completed = 0 if restart else load_checkpoint(checkpoint_path, source)
+    if completed:
+        print(f"Resuming after {completed} completed records")
+    
+    flow = FLOWS[flow_name]()
+    passed = failed = 0
+    driver = launch_chrome()
+    
+    try:
+        driver.implicitly_wait(0)
+        if completed and os.path.exists(results_path):
+            truncate_results(results_path, completed)
+        mode = "w" if completed == 0 else "a"
+        with open(results_path, mode) as results_file:
+            records = itertools.islice(read_records(source), completed, None)
+            for index, record in enumerate(records, completed):
+                start_time = time.time()
+                try:
+                    success, details = flow.run(driver, record)
+                except Exception as e:
+                    success, details = False, f"Exception: {e}"
+                
+                results_file.write(json.dumps({
+                    'index': index,
+                    'status': 'PASSED' if success else 'FAILED',
+                    'details': details,
+                    'execution_time': round(time.time() - start_time, 3)
+                }) + "\n")
+                results_file.flush()
+                
+                if success:
+                    passed += 1
+                else:
+                    failed += 1
+                    print(f"Record {index} failed: {details}")
+                
+                completed = index + 1
+                if completed % checkpoint_every == 0:
+                    save_checkpoint(checkpoint_path, source, completed)
+        
+        save_checkpoint(checkpoint_path, source, completed)
+    finally:
+        driver.quit()
+    
+    print(f"Processed {passed + failed} records: {passed} passed, {failed} failed")
+    return failed == 0
+
+def parse_args(argv=None):
+    """Parse command line options for the record runner"""
+    parser = argparse.ArgumentParser(description="Stream form records through a DemoQA flow")
+    parser.add_argument("source", help="CSV or JSONL file of records")
+    parser.add_argument("--flow", choices=sorted(FLOWS), default="textbox",
+                        help="which DemoQA form to submit each record through")
+    parser.add_argument("--results", default=None,
+                        help="JSONL file for per-record results (default: <source>.results.jsonl)")
+    parser.add_argument("--restart", action="store_true",
+                        help="ignore any checkpoint and start from the first record")
+    parser.add_argument("--checkpoint-every", type=int, default=1,
+                        help="save the resume checkpoint every N records")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    results_path = args.results or os.path.splitext(args.source)[0] + ".results.jsonl"
+    
+    print(f"Running {args.flow} flow over {args.source}")
+    print(f"Results: {results_path}")
+    
+    success = run_records(args.source, args.flow, results_path,
+                          restart=args.restart, checkpoint_every=max(1, args.checkpoint_every))
+    return 0 if success else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
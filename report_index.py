@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Report Index
+============
+Incrementally ingest test_report_*.json files into a local SQLite database
+and query per-test duration percentiles and regressions across runs
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import sys
+import time
+
+from demo_settings import PROJECT_DIR
+from percentiles import percentile
+
+DEFAULT_DB = os.path.join(PROJECT_DIR, "report_index.sqlite")
+REPORT_PATTERN = "test_report_*.json"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS reports (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    mtime REAL NOT NULL,
+    sha256 TEXT NOT NULL,
+    started_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    report_id INTEGER NOT NULL REFERENCES reports(id) ON DELETE CASCADE,
+    test_name TEXT NOT NULL,
+    status TEXT NOT NULL,
+    duration REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS reports_sha256 ON reports(sha256);
+CREATE INDEX IF NOT EXISTS reports_started_at ON reports(started_at);
+CREATE INDEX IF NOT EXISTS results_test ON results(test_name, report_id);
+"""
+
+def connect(db_path=DEFAULT_DB):
+    """Open (and create if needed) the report index database"""
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.executescript(SCHEMA)
+    return conn
+
+def file_sha256(path):
+    """Return the SHA-256 of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def report_start(report, path):
+    """Return when a report's run started, from its summary or its filename stamp"""
+    start_time = report.get('summary', {}).get('start_time')
+    if start_time:
+        return start_time
+    match = re.search(r"(\d{8})_(\d{6})", os.path.basename(path))
+    if match:
+        day, clock = match.groups()
+        return f"{day[:4]}-{day[4:6]}-{day[6:]}T{clock[:2]}:{clock[2:4]}:{clock[4:]}"
+    return ""
+
+def ingest_file(conn, path):
+    """Index one report file; return True if it was new or changed"""
+    path = os.path.abspath(path)
+    mtime = os.path.getmtime(path)
+    row = conn.execute("SELECT id, mtime, sha256 FROM reports WHERE path = ?", (path,)).fetchone()
+    if row and row[1] == mtime:
+        return False
+    
+    sha256 = file_sha256(path)
+    if row and row[2] == sha256:
+        # Touched but unchanged: remember the new mtime so the next run skips the hash
+        conn.execute("UPDATE reports SET mtime = ? WHERE id = ?", (mtime, row[0]))
+        return False
+    if not row and conn.execute("SELECT 1 FROM reports WHERE sha256 = ?", (sha256,)).fetchone():
+        # A copy of a report that is already indexed under another name
+        return False
+    
+    with open(path) as f:
+        report = json.load(f)
+    
+    if row:
+        conn.execute("DELETE FROM reports WHERE id = ?", (row[0],))
+    cursor = conn.execute(
+        "INSERT INTO reports (path, mtime, sha256, started_at) VALUES (?, ?, ?, ?)",
+        (path, mtime, sha256, report_start(report, path))
+    )
+    conn.executemany(
+        "INSERT INTO results (report_id, test_name, status, duration) VALUES (?, ?, ?, ?)",
+        [(cursor.lastrowid, result['test_name'], result['status'], result.get('execution_time', 0))
+         for result in report.get('test_results', [])]
+    )
+    return True
+
+def ingest(conn, directory=PROJECT_DIR):
+    """Index every new or changed report in a directory; return (seen, ingested)"""
+    paths = sorted(glob.glob(os.path.join(directory, REPORT_PATTERN)))
+    ingested = 0
+    with conn:
+        for path in paths:
+            try:
+                ingested += ingest_file(conn, path)
+            except (OSError, ValueError, KeyError) as e:
+                print(f"Skipping {path}: {e}")
+    return len(paths), ingested
+
+def duration_stats(conn, test_name, last_n=30):
+    """Return run count, p50, p95 and pass rate for a test over its last_n runs"""
+    rows = conn.execute(
+        """SELECT results.duration, results.status FROM results JOIN reports ON reports.id = results.report_id
+           WHERE results.test_name = ? ORDER BY reports.started_at DESC LIMIT ?""",
+        (test_name, last_n)
+    ).fetchall()
+    durations = sorted(row[0] for row in rows)
+    passed = sum(1 for row in rows if row[1] == 'PASSED')
+    return {
+        'test_name': test_name,
+        'runs': len(rows),
+        'p50': percentile(durations, 0.50),
+        'p95': percentile(durations, 0.95),
+        'pass_rate': passed / len(rows) if rows else None
+    }
+
+def regressions(conn, threshold=0.20, recent=1, baseline=30):
+    """Return tests whose recent median duration exceeds their baseline median by more than threshold
+    
+    The newest `recent` runs of each test are compared with the `baseline`
+    runs before them.
+    """
+    rows = conn.execute(
+        """SELECT test_name, duration, position FROM (
+               SELECT results.test_name, results.duration,
+                      ROW_NUMBER() OVER (PARTITION BY results.test_name
+                                         ORDER BY reports.started_at DESC) AS position
+               FROM results JOIN reports ON reports.id = results.report_id)
+           WHERE position <= ? ORDER BY test_name""",
+        (recent + baseline,)
+    ).fetchall()
+    
+    windows = {}
+    for test_name, duration, position in rows:
+        current, previous = windows.setdefault(test_name, ([], []))
+        (current if position <= recent else previous).append(duration)
+    
+    found = []
+    for test_name, (current, previous) in windows.items():
+        if not current or not previous:
+            continue
+        current_median = percentile(sorted(current), 0.5)
+        baseline_median = percentile(sorted(previous), 0.5)
+        if baseline_median > 0 and current_median > baseline_median * (1 + threshold):
+            found.append({
+                'test_name': test_name,
+                'baseline': baseline_median,
+                'current': current_median,
+                'change': current_median / baseline_median - 1
+            })
+    return sorted(found, key=lambda item: item['change'], reverse=True)
+
+def parse_args(argv=None):
+    """Parse command line options for the report index"""
+    parser = argparse.ArgumentParser(description="Index and query test_report_*.json files")
+    parser.add_argument("--db", default=DEFAULT_DB, help="SQLite database path")
+    parser.add_argument("--directory", default=PROJECT_DIR, help="directory holding the report files")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    subparsers.add_parser("ingest", help="index new or changed report files")
+    
+    stats = subparsers.add_parser("stats", help="p50/p95 durations of a test")
+    stats.add_argument("test_name")
+    stats.add_argument("--last", type=int, default=30, help="number of most recent runs")
+    
+    slower = subparsers.add_parser("regressions", help="tests that got slower")
+    slower.add_argument("--threshold", type=float, default=20, help="percent slowdown to report")
+    slower.add_argument("--recent", type=int, default=1, help="recent runs to compare")
+    slower.add_argument("--baseline", type=int, default=30, help="earlier runs to compare against")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    conn = connect(args.db)
+    try:
+        # Queries always see the latest reports; unchanged files cost one stat each
+        seen, ingested = ingest(conn, args.directory)
+        if args.command == "ingest":
+            print(f"Indexed {ingested} new or changed reports ({seen} found)")
+            return 0
+        
+        start_time = time.perf_counter()
+        if args.command == "stats":
+            stats = duration_stats(conn, args.test_name, args.last)
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
+            if not stats['runs']:
+                print(f"No runs recorded for {args.test_name}")
+                return 1
+            print(f"{stats['test_name']} over last {stats['runs']} runs:")
+            print(f"  p50: {stats['p50']:.2f}s  p95: {stats['p95']:.2f}s  pass rate: {stats['pass_rate']:.0%}")
+        else:
+            found = regressions(conn, args.threshold / 100, args.recent, args.baseline)
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
+            if not found:
+                print(f"No tests regressed more than {args.threshold:.0f}%")
+            for item in found:
+                print(f"  {item['test_name']}: {item['baseline']:.2f}s -> {item['current']:.2f}s "
+                      f"(+{item['change']:.0%})")
+        print(f"Query took {elapsed_ms:.1f} ms")
+        return 0
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    sys.exit(main())
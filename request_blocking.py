@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Request Blocking
+================
+Block ads, analytics and chosen resource types through CDP
+Network.setBlockedURLs, so DemoQA pages load without third-party weight.
+Blocked requests show up per page in the performance log summary
+"""
+
+import argparse
+import sys
+
+from demo_settings import blocking_rules
+
+# Ad and analytics hosts DemoQA pulls in on every page
+AD_DOMAINS = (
+    "doubleclick.net",
+    "googlesyndication.com",
+    "googletagservices.com",
+    "googletagmanager.com",
+    "google-analytics.com",
+    "adservice.google.com",
+    "amazon-adsystem.com",
+    "adsafeprotected.com",
+    "moatads.com",
+    "ad.plus",
+    "pubmatic.com",
+    "rubiconproject.com",
+    "criteo.com",
+    "taboola.com"
+)
+
+# setBlockedURLs matches URL patterns only, so resource types map to extensions
+RESOURCE_TYPE_PATTERNS = {
+    'Image': ("*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.svg*", "*.ico*"),
+    'Font': ("*.woff*", "*.ttf*", "*.otf*", "*.eot*"),
+    'Media': ("*.mp4*", "*.webm*", "*.mp3*", "*.ogg*"),
+    'Stylesheet': ("*.css*",)
+}
+
+class BlockingRules:
+    """Domains and resource types to block"""
+    
+    def __init__(self, domains=(), resource_types=()):
+        unknown = set(resource_types) - set(RESOURCE_TYPE_PATTERNS)
+        if unknown:
+            raise ValueError(f"Unknown resource types: {', '.join(sorted(unknown))}")
+        self.domains = tuple(domains)
+        self.resource_types = tuple(resource_types)
+    
+    def url_patterns(self):
+        """Return the wildcard URL patterns for Network.setBlockedURLs"""
+        patterns = []
+        for domain in self.domains:
+            # Match the bare host and any subdomain of it
+            patterns.append(f"*://{domain}/*")
+            patterns.append(f"*.{domain}/*")
+        for resource_type in self.resource_types:
+            patterns.extend(RESOURCE_TYPE_PATTERNS[resource_type])
+        return patterns
+    
+    def __bool__(self):
+        return bool(self.domains or self.resource_types)
+    
+    def __repr__(self):
+        return f"BlockingRules(domains={list(self.domains)}, resource_types={list(self.resource_types)})"
+
+def parse_rules(text):
+    """Parse a comma-separated rule list
+    
+    "ads" expands to the known ad and analytics domains, Image / Font /
+    Media / Stylesheet block that resource type, anything else is a domain.
+    """
+    domains = []
+    resource_types = []
+    for token in (part.strip() for part in text.split(",")):
+        if not token:
+            continue
+        if token.lower() == "ads":
+            domains.extend(AD_DOMAINS)
+        elif token.capitalize() in RESOURCE_TYPE_PATTERNS:
+            resource_types.append(token.capitalize())
+        else:
+            domains.append(token)
+    return BlockingRules(domains, resource_types)
+
+def apply_blocking(driver, rules):
+    """Install the rules on a Chrome driver; returns the URL patterns now blocked"""
+    patterns = rules.url_patterns()
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+    return patterns
+
+def clear_blocking(driver):
+    """Remove every blocking rule from a Chrome driver"""
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": []})
+
+def rules_from_env():
+    """Return the BlockingRules configured for the demos, or None when blocking is off"""
+    text = blocking_rules()
+    return parse_rules(text) if text else None
+
+def measure_savings(driver, url, rules):
+    """Load url without and then with blocking and return both page summaries"""
+    from performance_log import PerformanceLogPipeline
+    
+    network = PerformanceLogPipeline(driver)
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": True})
+    
+    clear_blocking(driver)
+    network.drain()
+    driver.get(url)
+    unblocked = network.page_summaries()[-1]
+    
+    apply_blocking(driver, rules)
+    driver.get(url)
+    blocked = network.page_summaries()[-1]
+    return unblocked, blocked
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure what request blocking saves on a page")
+    parser.add_argument("url", help="page to load with and without blocking")
+    parser.add_argument("--rules", default="ads", help="comma-separated rules (default: ads)")
+    args = parser.parse_args(argv)
+    
+    from browser_pool import default_chrome_options, launch_chrome
+    from performance_log import enable_performance_log
+    
+    driver = launch_chrome(enable_performance_log(default_chrome_options()), block=False)
+    try:
+        unblocked, blocked = measure_savings(driver, args.url, parse_rules(args.rules))
+    finally:
+        driver.quit()
+    
+    saved_requests = unblocked['requests'] - (blocked['requests'] - blocked['blocked'])
+    saved_bytes = unblocked['encoded_bytes'] - blocked['encoded_bytes']
+    print(f"Without blocking: {unblocked['requests']} requests, {unblocked['encoded_bytes'] / 1024:.1f} KB, "
+          f"load event {unblocked['load_event_ms'] or 0:.0f} ms")
+    print(f"With blocking:    {blocked['requests'] - blocked['blocked']} requests, "
+          f"{blocked['encoded_bytes'] / 1024:.1f} KB, load event {blocked['load_event_ms'] or 0:.0f} ms "
+          f"({blocked['blocked']} blocked)")
+    print(f"Saved {saved_requests} requests and {saved_bytes / 1024:.1f} KB")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
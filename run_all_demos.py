@@ -2,10 +2,19 @@
 
 import os
 import sys
+import argparse
+import importlib.util
 import subprocess
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+from command_timing import CommandRecorder
+from demo_settings import timing_dir
+from fixture_server import start_for_demos
+from screenshot_retention import print_report, start_from_env
+
 def run_demo(demo_file):
     """Run a single demo and return success status"""
     print(f"\n{'='*60}")
@@ -35,11 +44,119 @@ def run_demo(demo_file):
         else:
             print(f"\nDemo {demo_file} failed with return code {result.returncode}")
             return False
-            
+    
+    except Exception as e:
+        print(f"Error running {demo_file}: {e}")
+        return False
+
+def load_demo_module(demo_file):
+    """Import a numbered demo file as a module"""
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    demo_path = os.path.join(current_dir, demo_file)
+    module_name = "demo_" + os.path.splitext(demo_file)[0]
+    
+    spec = importlib.util.spec_from_file_location(module_name, demo_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def load_demo_function(demo_file):
+    """Import a demo file and return its demo_* entry point"""
+    module = load_demo_module(demo_file)
+    
+    for name in dir(module):
+        candidate = getattr(module, name)
+        if name.startswith("demo_") and callable(candidate) and getattr(candidate, "__module__", None) == module.__name__:
+            return candidate
+    raise AttributeError(f"No demo_* function found in {demo_file}")
+
+def run_demo_in_process(demo_file, pool):
+    """Run a single demo in this process on a browser leased from the pool"""
+    from session_replay import record_from_env
+    
+    print(f"\n{'='*60}")
+    print(f"Running {demo_file} (in-process)")
+    print(f"{'='*60}")
+    
+    try:
+        demo_function = load_demo_function(demo_file)
+        with pool.lease() as driver:
+            # Like timing, recording is attached per lease so each demo gets its own session log
+            session = record_from_env(driver, os.path.splitext(demo_file)[0])
+            recorder = CommandRecorder().attach(driver) if timing_dir() else None
+            try:
+                demo_function(driver=driver)
+            finally:
+                if recorder:
+                    recorder.detach()
+                    recorder.save(timing_dir(), os.path.splitext(demo_file)[0])
+                    recorder.print_summary(top_n=5)
+                if session:
+                    session.detach()
+                    session.close()
+        print(f"\nDemo {demo_file} completed successfully!")
+        return True
     except Exception as e:
         print(f"Error running {demo_file}: {e}")
         return False
 
+class DemoOutput:
+    """sys.stdout stand-in that holds each worker thread's output until its demo finishes"""
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+        self._lock = threading.Lock()
+    
+    def write(self, text):
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is None:
+            with self._lock:
+                return self.stream.write(text)
+        buffer.append(text)
+        return len(text)
+    
+    def flush(self):
+        if getattr(self._local, "buffer", None) is None:
+            self.stream.flush()
+    
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+    
+    def run(self, function, *args):
+        """Call function with this thread's output buffered, then print it in one piece"""
+        self._local.buffer = []
+        try:
+            return function(*args)
+        finally:
+            text, self._local.buffer = "".join(self._local.buffer), None
+            with self._lock:
+                self.stream.write(text)
+                self.stream.flush()
+
+def run_demos_in_process(demos, pool_size):
+    """Run every demo in-process, sharing a pool of warm browsers"""
+    from browser_pool import BrowserPool
+    
+    results = {}
+    with BrowserPool(size=pool_size) as pool:
+        if pool_size == 1:
+            for demo in demos:
+                results[demo] = run_demo_in_process(demo, pool)
+            return results
+        
+        # Concurrent demos would interleave their output line by line; print each one whole instead
+        output = DemoOutput(sys.stdout)
+        sys.stdout = output
+        try:
+            with ThreadPoolExecutor(max_workers=pool_size) as executor:
+                outcomes = executor.map(lambda demo: output.run(run_demo_in_process, demo, pool), demos)
+                for demo, success in zip(demos, outcomes):
+                    results[demo] = success
+        finally:
+            sys.stdout = output.stream
+    return results
+
 def wait_for_user(demo_num, total_demos, pause_seconds=3):
     """Wait between demos with countdown"""
     if demo_num < total_demos:
@@ -49,13 +166,28 @@ def wait_for_user(demo_num, total_demos, pause_seconds=3):
             time.sleep(1)
         print(" " * 30, end="\r")
 
-def main():
+def parse_args(argv=None):
+    """Parse command line options for the demo runner"""
+    parser = argparse.ArgumentParser(description="Run all Selenium demos")
+    parser.add_argument("--in-process", action="store_true",
+                        help="import each demo and run it on a pooled browser instead of a subprocess")
+    parser.add_argument("--pool-size", type=int, default=1,
+                        help="number of pre-launched browsers for --in-process mode")
+    parser.add_argument("--fixtures", action="store_true",
+                        help="serve the local DemoQA fixture pages and run the demos against them")
+    return parser.parse_args(argv)
+
+def main(argv=None):
     """Run all Selenium demos in sequence"""
+    args = parse_args(argv)
     
     print("Selenium WebDriver Demonstration Suite")
     print("=" * 60)
-    print("This will run all 10 demos in sequence")
-    print("Total estimated time: 15-20 minutes")
+    if args.in_process:
+        print(f"This will run all 10 demos in-process on {args.pool_size} pooled browser(s)")
+    else:
+        print("This will run all 10 demos in sequence")
+        print("Total estimated time: 15-20 minutes")
     print("=" * 60)
     
     demos = [
@@ -71,23 +203,40 @@ def main():
         "10_final_automation.py"
     ]
     
+    retention = start_from_env()
+    fixtures = start_for_demos() if args.fixtures else None
+    
     start_time = datetime.now()
     successful_demos = []
     failed_demos = []
     
-    for i, demo in enumerate(demos, 1):
-        print(f"\nDemo {i} of {len(demos)}")
-        
-        if run_demo(demo):
-            successful_demos.append(demo)
-        else:
-            failed_demos.append(demo)
-        
-        wait_for_user(i, len(demos))
+    if args.in_process:
+        results = run_demos_in_process(demos, max(1, args.pool_size))
+        for demo in demos:
+            if results[demo]:
+                successful_demos.append(demo)
+            else:
+                failed_demos.append(demo)
+    else:
+        for i, demo in enumerate(demos, 1):
+            print(f"\nDemo {i} of {len(demos)}")
+            
+            if run_demo(demo):
+                successful_demos.append(demo)
+            else:
+                failed_demos.append(demo)
+            
+            wait_for_user(i, len(demos))
     
     end_time = datetime.now()
     duration = end_time - start_time
     
+    if fixtures:
+        fixtures.stop()
+    
+    if retention:
+        print_report(retention.wait())
+    
     print(f"\n{'='*60}")
     print("DEMONSTRATION COMPLETE")
     print(f"{'='*60}")
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Screenshot Retention
+====================
+Keep the screenshots directory within size and age budgets: expire old
+captures (failure screenshots are kept longer than success ones), trim the
+oldest files when over the size budget, and recompress older captures to
+lossless WebP or palette PNG in a background pass
+"""
+
+import argparse
+import io
+import os
+import re
+import sys
+import threading
+from datetime import datetime, timedelta
+
+from demo_settings import screenshot_budget_mb, screenshots_dir
+
+FAILURE_MARKERS = ("error_final_", "timeout_debug_", "no_element_debug_")
+SKIPPED_DIRS = ("blobs", "baselines")
+IMAGE_EXTENSIONS = (".png", ".webp")
+TIMESTAMP_PATTERN = re.compile(r"(\d{8}_\d{6})")
+
+class RetentionPolicy:
+    """Budgets for the screenshots directory"""
+    
+    def __init__(self, max_bytes=500 * 1024 * 1024, success_days=7, failure_days=30,
+                 recompress_after_days=1, recompress_format="webp"):
+        self.max_bytes = max_bytes
+        self.success_days = success_days
+        self.failure_days = failure_days
+        self.recompress_after_days = recompress_after_days
+        self.recompress_format = recompress_format
+
+def is_failure(filename):
+    """Return True for screenshots taken when something went wrong"""
+    return any(marker in filename for marker in FAILURE_MARKERS)
+
+def captured_at(path):
+    """Return when a screenshot was taken, from its filename stamp or its mtime"""
+    match = TIMESTAMP_PATTERN.search(os.path.basename(path))
+    if match:
+        try:
+            return datetime.strptime(match.group(1), "%Y%m%d_%H%M%S")
+        except ValueError:
+            pass
+    return datetime.fromtimestamp(os.path.getmtime(path))
+
+def scan(root):
+    """Return (path, size, captured_at, failure) for every loose screenshot under root"""
+    entries = []
+    for directory, dirnames, filenames in os.walk(root):
+        # Content-addressed blobs and visual baselines are referenced elsewhere
+        dirnames[:] = [d for d in dirnames if d not in SKIPPED_DIRS]
+        for filename in filenames:
+            if not filename.endswith(IMAGE_EXTENSIONS):
+                continue
+            path = os.path.join(directory, filename)
+            try:
+                entries.append((path, os.path.getsize(path), captured_at(path), is_failure(filename)))
+            except OSError:
+                continue
+    return entries
+
+def compact_image(path, image_format="webp"):
+    """Losslessly recompress a PNG, keeping the result only when it is smaller
+    
+    Returns the path of the file that now holds the image and the bytes saved.
+    """
+    # Pillow is only needed once a budget is set and compaction runs
+    from PIL import Image
+    
+    original_size = os.path.getsize(path)
+    with Image.open(path) as image:
+        image.load()
+        output = io.BytesIO()
+        if image_format == "webp":
+            image.save(output, format="WEBP", lossless=True, quality=100, method=4)
+            target = os.path.splitext(path)[0] + ".webp"
+        else:
+            # Palette conversion is only lossless when the image has at most 256
+            # colours, and the quantizer is checked rather than trusted
+            if image.mode == "RGB" and image.getcolors(256) is not None:
+                paletted = image.quantize(colors=256, method=Image.Quantize.FASTOCTREE)
+                if paletted.convert("RGB").tobytes() == image.tobytes():
+                    image = paletted
+            image.save(output, format="PNG", optimize=True)
+            target = path
+    
+    data = output.getvalue()
+    if len(data) >= original_size:
+        return path, 0
+    
+    tmp_path = target + ".part"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, target)
+    if target != path:
+        os.remove(path)
+    return target, original_size - len(data)
+
+class RetentionManager:
+    """Applies a RetentionPolicy to a screenshots directory"""
+    
+    def __init__(self, root=None, policy=None):
+        self.root = root or screenshots_dir()
+        self.policy = policy or RetentionPolicy()
+        self._thread = None
+        self.report = None
+    
+    def expired(self, entries, now):
+        """Return entries older than their age budget"""
+        success_cutoff = now - timedelta(days=self.policy.success_days)
+        failure_cutoff = now - timedelta(days=self.policy.failure_days)
+        return [entry for entry in entries
+                if entry[2] < (failure_cutoff if entry[3] else success_cutoff)]
+    
+    def over_budget(self, entries):
+        """Return the oldest entries to drop to get under the size budget, success shots first"""
+        total = sum(entry[1] for entry in entries)
+        victims = []
+        for entry in sorted(entries, key=lambda entry: (entry[3], entry[2])):
+            if total <= self.policy.max_bytes:
+                break
+            victims.append(entry)
+            total -= entry[1]
+        return victims
+    
+    def enforce(self, recompress=True):
+        """Delete, trim and recompress screenshots; return a summary dict"""
+        now = datetime.now()
+        entries = scan(self.root)
+        report = {'scanned': len(entries), 'expired': 0, 'trimmed': 0,
+                  'recompressed': 0, 'bytes_freed': 0}
+        
+        expired = self.expired(entries, now)
+        for path, size, _, _ in expired:
+            if self._remove(path):
+                report['expired'] += 1
+                report['bytes_freed'] += size
+        
+        expired_paths = {entry[0] for entry in expired}
+        remaining = [entry for entry in entries if entry[0] not in expired_paths]
+        trimmed = self.over_budget(remaining)
+        for path, size, _, _ in trimmed:
+            if self._remove(path):
+                report['trimmed'] += 1
+                report['bytes_freed'] += size
+        
+        if recompress and self.policy.recompress_format:
+            trimmed_paths = {entry[0] for entry in trimmed}
+            cutoff = now - timedelta(days=self.policy.recompress_after_days)
+            for path, _, taken, _ in remaining:
+                if path in trimmed_paths or taken >= cutoff or not path.endswith(".png"):
+                    continue
+                try:
+                    _, saved = compact_image(path, self.policy.recompress_format)
+                except (OSError, ValueError) as e:
+                    print(f"Could not recompress {path}: {e}")
+                    continue
+                if saved:
+                    report['recompressed'] += 1
+                    report['bytes_freed'] += saved
+        
+        self.report = report
+        return report
+    
+    def start(self):
+        """Run enforce() on a background thread so demo runs are not delayed"""
+        self._thread = threading.Thread(target=self.enforce, name="screenshot-retention", daemon=True)
+        self._thread.start()
+        return self
+    
+    def wait(self):
+        """Wait for a background pass to finish and return its summary"""
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        return self.report
+    
+    def _remove(self, path):
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            return False
+
+def start_from_env():
+    """Start a background retention pass when a screenshot budget is configured, else None"""
+    budget = screenshot_budget_mb()
+    if budget is None:
+        return None
+    policy = RetentionPolicy(max_bytes=int(budget * 1024 * 1024))
+    return RetentionManager(policy=policy).start()
+
+def print_report(report):
+    """Print a retention pass summary"""
+    if not report:
+        return
+    print(f"Screenshot retention: {report['expired']} expired, {report['trimmed']} trimmed, "
+          f"{report['recompressed']} recompressed, {report['bytes_freed'] / (1024 * 1024):.1f} MB freed")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Enforce size and age budgets on the screenshots directory")
+    parser.add_argument("--directory", default=None, help="screenshots directory (default: demo screenshots dir)")
+    parser.add_argument("--max-mb", type=float, default=500, help="size budget in MB")
+    parser.add_argument("--success-days", type=float, default=7, help="days to keep success screenshots")
+    parser.add_argument("--failure-days", type=float, default=30, help="days to keep failure screenshots")
+    parser.add_argument("--recompress-after-days", type=float, default=1,
+                        help="recompress screenshots older than this many days")
+    parser.add_argument("--format", choices=["webp", "png"], default="webp",
+                        help="lossless format for recompressed screenshots")
+    parser.add_argument("--no-recompress", action="store_true", help="only delete, never recompress")
+    args = parser.parse_args(argv)
+    
+    policy = RetentionPolicy(
+        max_bytes=int(args.max_mb * 1024 * 1024),
+        success_days=args.success_days,
+        failure_days=args.failure_days,
+        recompress_after_days=args.recompress_after_days,
+        recompress_format=args.format
+    )
+    manager = RetentionManager(args.directory, policy)
+    print_report(manager.enforce(recompress=not args.no_recompress))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
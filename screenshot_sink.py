@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Screenshot Sink
+===============
+Grabs the screenshot payload on the test thread and hands base64 decoding,
+disk writes and optional recompression to a bounded background pool
+"""
+
+import atexit
+import base64
+import io
+import os
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+_open_sinks = weakref.WeakSet()
+
+def _flush_open_sinks():
+    for sink in list(_open_sinks):
+        sink.close()
+
+atexit.register(_flush_open_sinks)
+
+def recompress_png(png_bytes):
+    """Re-encode a PNG with maximum compression, or return it unchanged without Pillow"""
+    try:
+        from PIL import Image
+    except ImportError:
+        return png_bytes
+    
+    with Image.open(io.BytesIO(png_bytes)) as image:
+        output = io.BytesIO()
+        image.save(output, format="PNG", optimize=True)
+    smaller = output.getvalue()
+    return smaller if len(smaller) < len(png_bytes) else png_bytes
+
+class ScreenshotSink:
+    """Writes screenshots in the background; save() only blocks when the queue is full"""
+    
+    def __init__(self, max_workers=2, max_pending=8, recompress=False):
+        self.recompress = recompress
+        self.errors = []
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="screenshot")
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._closed = False
+        _open_sinks.add(self)
+    
+    def save(self, driver, filepath):
+        """Capture the current page and queue it for writing to filepath"""
+        payload = driver.get_screenshot_as_base64()
+        return self.submit(payload, filepath)
+    
+    def submit(self, payload, filepath, on_error=None):
+        """Queue an already captured payload (base64 text or PNG bytes) for writing
+        
+        on_error, if given, is called with the exception when the write fails.
+        """
+        if self._closed:
+            raise RuntimeError("ScreenshotSink is closed")
+        
+        # Backpressure: wait for a free slot instead of queueing without bound
+        self._slots.acquire()
+        future = self._executor.submit(self._write, payload, filepath, on_error)
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._finished)
+        return filepath
+    
+    def _write(self, payload, filepath, on_error=None):
+        try:
+            self._write_png(payload, filepath)
+        except Exception as error:
+            # Recorded before the future completes, so flush() callers see it in self.errors
+            self.errors.append(error)
+            print(f"Screenshot write failed: {error}")
+            if on_error is not None:
+                on_error(error)
+            raise
+    
+    def _write_png(self, payload, filepath):
+        png_bytes = payload if isinstance(payload, bytes) else base64.b64decode(payload)
+        if self.recompress:
+            png_bytes = recompress_png(png_bytes)
+        
+        directory = os.path.dirname(filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = filepath + ".part"
+        with open(tmp_path, "wb") as f:
+            f.write(png_bytes)
+        os.replace(tmp_path, filepath)
+    
+    def _finished(self, future):
+        with self._lock:
+            self._pending.discard(future)
+        self._slots.release()
+    
+    def flush(self):
+        """Block until every queued screenshot is on disk"""
+        with self._lock:
+            pending = list(self._pending)
+        for future in pending:
+            try:
+                future.result()
+            except Exception:
+                pass
+    
+    def close(self):
+        """Flush outstanding writes and stop the background workers"""
+        if self._closed:
+            return
+        self.flush()
+        self._closed = True
+        self._executor.shutdown(wait=True)
+        _open_sinks.discard(self)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
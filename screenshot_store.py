@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Screenshot Store
+================
+Content-addressed screenshot storage: each capture is hashed, its PNG is
+stored once under the digest, and captures only add a lightweight
+name/timestamp reference, so identical screenshots cost a hash and no write
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import os
+import sys
+import threading
+from datetime import datetime
+
+from demo_settings import screenshots_dir
+
+class ScreenshotStore:
+    """Stores screenshot blobs by SHA-256 and keeps name/timestamp references to them"""
+    
+    def __init__(self, root=None, sink=None):
+        self.root = root or screenshots_dir()
+        self.blobs_dir = os.path.join(self.root, "blobs")
+        self.index_path = os.path.join(self.root, "index.jsonl")
+        self.sink = sink
+        self.references = []
+        self._saved_references = 0
+        self._known = set()
+        self._lock = threading.Lock()
+    
+    def blob_path(self, digest):
+        """Return where the blob for a digest lives"""
+        return os.path.join(self.blobs_dir, digest[:2], f"{digest}.png")
+    
+    def _store_blob(self, digest, png_bytes):
+        """Write a blob unless it is already stored; return True when it was new"""
+        path = self.blob_path(digest)
+        with self._lock:
+            if digest in self._known:
+                return False
+            if os.path.exists(path):
+                self._known.add(digest)
+                return False
+            if self.sink is not None:
+                # Claimed while queued so concurrent captures do not write it twice; released if the write fails
+                self._known.add(digest)
+        
+        if self.sink is not None:
+            self.sink.submit(png_bytes, path, on_error=lambda error: self._forget(digest))
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = path + ".part"
+            with open(tmp_path, "wb") as f:
+                f.write(png_bytes)
+            os.replace(tmp_path, path)
+            with self._lock:
+                self._known.add(digest)
+        return True
+    
+    def _forget(self, digest):
+        """Let the next capture with this digest write the blob again"""
+        with self._lock:
+            self._known.discard(digest)
+    
+    def put(self, png_bytes, name, description=""):
+        """Store PNG bytes under their digest and return a reference to them"""
+        digest = hashlib.sha256(png_bytes).hexdigest()
+        is_new = self._store_blob(digest, png_bytes)
+        
+        reference = {
+            'name': name,
+            'description': description,
+            'filepath': self.blob_path(digest),
+            'digest': digest,
+            'timestamp': datetime.now().strftime("%Y%m%d_%H%M%S"),
+            'duplicate': not is_new
+        }
+        with self._lock:
+            self.references.append(reference)
+        return reference
+    
+    def capture(self, driver, name, description=""):
+        """Take a screenshot of the current page and store it"""
+        png_bytes = base64.b64decode(driver.get_screenshot_as_base64())
+        return self.put(png_bytes, name, description)
+    
+    def latest(self, name):
+        """Return the most recent reference recorded under a name, or None"""
+        with self._lock:
+            for reference in reversed(self.references):
+                if reference['name'] == name:
+                    return reference
+        return None
+    
+    def save_index(self):
+        """Append references recorded since the last save to index.jsonl"""
+        with self._lock:
+            new_references = self.references[self._saved_references:]
+            self._saved_references = len(self.references)
+        if not new_references:
+            return self.index_path
+        
+        os.makedirs(self.root, exist_ok=True)
+        with open(self.index_path, "a") as f:
+            for reference in new_references:
+                f.write(json.dumps(reference) + "\n")
+        return self.index_path
+    
+    def close(self):
+        """Flush pending blob writes and persist the reference index
+        
+        References whose blob never reached disk are marked missing.
+        """
+        if self.sink is not None:
+            self.sink.flush()
+            if self.sink.errors:
+                with self._lock:
+                    lost = [reference for reference in self.references[self._saved_references:]
+                            if not os.path.exists(reference['filepath'])]
+                for reference in lost:
+                    reference['missing'] = True
+                if lost:
+                    print(f"{len(lost)} screenshot reference(s) point at blobs that failed to write")
+        self.save_index()
+
+def ingest_directory(store, directory, remove_originals=False):
+    """Move loose PNGs into the store, returning (files, unique blobs, bytes saved)"""
+    files = unique = saved = 0
+    for filename in sorted(os.listdir(directory)):
+        path = os.path.join(directory, filename)
+        if not filename.endswith(".png") or not os.path.isfile(path):
+            continue
+        
+        with open(path, "rb") as f:
+            png_bytes = f.read()
+        reference = store.put(png_bytes, os.path.splitext(filename)[0], "ingested")
+        files += 1
+        if reference['duplicate']:
+            saved += len(png_bytes)
+        else:
+            unique += 1
+        
+        if remove_originals:
+            os.remove(path)
+    
+    store.save_index()
+    return files, unique, saved
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Deduplicate the screenshots directory into a content-addressed store")
+    parser.add_argument("--directory", default=None, help="screenshots directory (default: demo screenshots dir)")
+    parser.add_argument("--remove-originals", action="store_true", help="delete loose PNGs once they are stored")
+    args = parser.parse_args(argv)
+    
+    directory = args.directory or screenshots_dir()
+    store = ScreenshotStore(root=directory)
+    files, unique, saved = ingest_directory(store, directory, args.remove_originals)
+    
+    print(f"Ingested {files} screenshots into {unique} unique blobs")
+    print(f"Duplicate bytes avoided: {saved / 1024:.1f} KB")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+Session Replay
+==============
+Record every WebDriver command and response of a run (plus page snapshots
+after each navigation and on errors) to a compact binary log, and replay
+that log through a browserless driver so a demo can be re-run
+deterministically in milliseconds
+"""
+
+import argparse
+import atexit
+import gzip
+import json
+import os
+import struct
+import sys
+import threading
+import time
+
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
+
+from demo_settings import record_dir
+
+MAGIC = b"SDREPLAY1\n"
+HEADER = struct.Struct("<BfI")  # record kind, duration in ms, payload length
+
+SESSION = 0
+COMMAND = 1
+SNAPSHOT = 2
+
+NAVIGATION_COMMANDS = frozenset(("get", "goBack", "goForward", "refresh"))
+
+class ReplayMismatch(AssertionError):
+    """The replayed run asked for a different command than the recording holds"""
+
+def encode(value):
+    return json.dumps(value, separators=(",", ":"), default=str).encode("utf-8")
+
+def is_error(response):
+    """True for a failed command; errors carry the HTTP status of the driver's reply"""
+    return isinstance(response, dict) and response.get("status") not in (None, 0, 200)
+
+class SessionRecorder:
+    """Wraps a driver's command executor and appends every command to a session log"""
+    
+    def __init__(self, path, snapshots=True):
+        self.path = path
+        self.snapshots = snapshots
+        self.commands = 0
+        self.snapshot_count = 0
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = gzip.open(path, "wb", compresslevel=6)
+        self._file.write(MAGIC)
+        self._driver = None
+        self._executor = None
+        self._patched_execute = None
+        self._original_execute = None
+    
+    def _write(self, kind, duration_ms, payload):
+        data = encode(payload)
+        self._file.write(HEADER.pack(kind, duration_ms, len(data)))
+        self._file.write(data)
+    
+    def attach(self, driver):
+        """Start recording every command sent through this driver"""
+        # The session already exists; store what newSession returned so replay can answer it
+        self._write(SESSION, 0.0, {'session_id': driver.session_id, 'capabilities': driver.caps,
+                                   'started': time.time()})
+        executor = driver.command_executor
+        original_execute = executor.execute
+        
+        def recorded_execute(command, params):
+            start = time.perf_counter()
+            response = original_execute(command, params)
+            duration_ms = (time.perf_counter() - start) * 1000
+            if self._file.closed:
+                return response
+            # Encode now: WebDriver.execute unwraps the value in place afterwards
+            self._write(COMMAND, duration_ms, [command, params, response])
+            self.commands += 1
+            if self.snapshots:
+                if command in NAVIGATION_COMMANDS:
+                    self.snapshot(command)
+                elif is_error(response):
+                    self.snapshot(f"{command} failed")
+            if command == "quit":
+                self.close()
+            return response
+        
+        self._patched_execute = executor.__dict__.get("execute")
+        self._original_execute = original_execute
+        executor.execute = recorded_execute
+        self._executor = executor
+        self._driver = driver
+        return self
+    
+    def snapshot(self, label):
+        """Store the current URL and page source without recording the commands that read them"""
+        if self._original_execute is None or self._file.closed:
+            return
+        params = {'sessionId': self._driver.session_id}
+        try:
+            url = self._original_execute("getCurrentUrl", params).get("value")
+            html = self._original_execute("getPageSource", params).get("value")
+        except Exception:
+            return
+        if not isinstance(html, str):
+            # An open alert blocks page access; the error response is not a snapshot
+            return
+        self._write(SNAPSHOT, 0.0, {'label': label, 'url': url, 'html': html, 'after_command': self.commands})
+        self.snapshot_count += 1
+    
+    def detach(self):
+        """Restore the driver's original command executor"""
+        if self._executor is not None:
+            if self._patched_execute is not None:
+                self._executor.execute = self._patched_execute
+            else:
+                del self._executor.execute
+            self._executor = None
+    
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+def read_log(path):
+    """Yield (kind, duration_ms, payload) records; a truncated tail ends the log"""
+    with gzip.open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a session log")
+        try:
+            while True:
+                header = f.read(HEADER.size)
+                if len(header) < HEADER.size:
+                    return
+                kind, duration_ms, length = HEADER.unpack(header)
+                data = f.read(length)
+                if len(data) < length:
+                    return
+                yield kind, duration_ms, json.loads(data)
+        except EOFError:
+            # The recording process died before the gzip stream was finished
+            return
+
+class VirtualClock:
+    """Fast-forwards time.sleep, time.time and time.monotonic while installed
+    
+    Sleeps and replayed command durations advance the clock instead of
+    waiting, so WebDriverWait polls and timeouts follow the recorded run.
+    Only the thread that entered the clock sees virtual time; background
+    threads (screenshot sinks, retention compaction) keep real time.
+    """
+    
+    def __init__(self):
+        self.offset = 0.0
+        self._saved = None
+        self._owner = None
+    
+    def advance(self, seconds):
+        self.offset += max(0.0, seconds)
+    
+    def __enter__(self):
+        self._saved = (time.sleep, time.time, time.monotonic)
+        real_sleep, real_time, real_monotonic = self._saved
+        self._owner = threading.get_ident()
+        
+        def virtual(real, shifted):
+            return lambda *args: shifted(*args) if threading.get_ident() == self._owner else real(*args)
+        
+        time.sleep = virtual(real_sleep, self.advance)
+        time.time = virtual(real_time, lambda: real_time() + self.offset)
+        time.monotonic = virtual(real_monotonic, lambda: real_monotonic() + self.offset)
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        time.sleep, time.time, time.monotonic = self._saved
+        return False
+
+class ReplayExecutor:
+    """Answers WebDriver commands from a session log instead of a browser"""
+    
+    def __init__(self, path, strict=False, clock=None):
+        self.path = path
+        self.strict = strict
+        self.clock = clock
+        self.session = None
+        self.commands = []
+        self.snapshots = []
+        for kind, duration_ms, payload in read_log(path):
+            if kind == SESSION:
+                self.session = payload
+            elif kind == COMMAND:
+                self.commands.append((duration_ms, payload))
+            elif kind == SNAPSHOT:
+                self.snapshots.append(payload)
+        if self.session is None:
+            raise ValueError(f"{path} has no session record")
+        self.position = 0
+        self.divergences = []
+        self.failure = None
+    
+    def _mismatch(self, message):
+        # Demos catch Exception broadly; keep the first mismatch so replay_demo can still report it
+        error = ReplayMismatch(message)
+        if self.failure is None:
+            self.failure = error
+        raise error
+    
+    def execute(self, command, params):
+        if command == "newSession":
+            return {'value': {'sessionId': self.session['session_id'],
+                              'capabilities': self.session['capabilities']}}
+        if self.position >= len(self.commands):
+            self.divergences.append({'index': self.position, 'expected': None, 'actual': command})
+            self._mismatch(f"Replay ran past the end of the recording with {command!r}")
+        
+        duration_ms, (recorded_command, recorded_params, response) = self.commands[self.position]
+        if recorded_command != command:
+            self.divergences.append({'index': self.position, 'expected': recorded_command, 'actual': command})
+            self._mismatch(f"Command {self.position}: recorded {recorded_command!r}, replay sent {command!r}")
+        if recorded_params != json.loads(encode(params)):
+            self.divergences.append({'index': self.position, 'expected': recorded_params, 'actual': params})
+            if self.strict:
+                self._mismatch(f"Command {self.position} ({command}): parameters differ from the recording")
+        
+        self.position += 1
+        if self.clock is not None:
+            self.clock.advance(duration_ms / 1000)
+        return response
+    
+    def close(self):
+        pass
+
+class ReplayDriver(RemoteWebDriver):
+    """A WebDriver whose every command is served from a session log"""
+    
+    def __init__(self, path, strict=False, clock=None):
+        super().__init__(command_executor=ReplayExecutor(path, strict, clock), options=Options())
+        # Recorded runs were local: never turn send_keys file paths into uploads
+        self._is_remote = False
+    
+    @property
+    def replay(self):
+        return self.command_executor
+
+def session_label():
+    """Name recordings after the running script, e.g. '10_final_automation'"""
+    return os.path.splitext(os.path.basename(sys.argv[0] or "session"))[0] or "session"
+
+def record_from_env(driver, label=None):
+    """Attach a SessionRecorder when SELENIUM_DEMO_RECORD_DIR is set; closed at interpreter exit"""
+    directory = record_dir()
+    if not directory:
+        return None
+    
+    stamp = time.strftime("%Y%m%d_%H%M%S")
+    path = os.path.join(directory, f"{label or session_label()}_{stamp}.session.gz")
+    recorder = SessionRecorder(path).attach(driver)
+    atexit.register(recorder.close)
+    return recorder
+
+def replay_demo(path, demo_file, strict=False, real_time=False):
+    """Run a demo's entry point on a ReplayDriver and return a result dict"""
+    from run_all_demos import load_demo_function
+    
+    demo = load_demo_function(demo_file)
+    clock = None if real_time else VirtualClock()
+    driver = ReplayDriver(path, strict, clock)
+    replay = driver.replay
+    error = None
+    start = time.perf_counter()
+    try:
+        if clock:
+            with clock:
+                demo(driver=driver)
+        else:
+            demo(driver=driver)
+        # The demo leaves a passed-in driver open; the recording ends with its quit
+        if replay.position == len(replay.commands) - 1 and replay.commands[-1][1][0] == "quit":
+            driver.quit()
+    except Exception as e:
+        error = e
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    if replay.failure is not None and not isinstance(error, ReplayMismatch):
+        # The demo swallowed the mismatch in its own except block
+        error = replay.failure
+    
+    return {
+        'demo': demo_file,
+        'elapsed_ms': elapsed_ms,
+        'replayed': replay.position,
+        'recorded': len(replay.commands),
+        'divergences': replay.divergences,
+        'virtual_seconds': clock.offset if clock else 0.0,
+        'error': error
+    }
+
+def print_info(path):
+    """Print what a session log holds"""
+    commands = snapshots = 0
+    recorded_ms = 0.0
+    counts = {}
+    for kind, duration_ms, payload in read_log(path):
+        if kind == COMMAND:
+            commands += 1
+            recorded_ms += duration_ms
+            counts[payload[0]] = counts.get(payload[0], 0) + 1
+        elif kind == SNAPSHOT:
+            snapshots += 1
+    print(f"{path}: {os.path.getsize(path) / 1024:.1f} KB")
+    print(f"   {commands} commands ({recorded_ms / 1000:.2f}s of WebDriver time), {snapshots} snapshots")
+    for name, count in sorted(counts.items(), key=lambda item: item[1], reverse=True):
+        print(f"   {name}: {count}")
+
+def export_snapshots(path, directory):
+    """Write each snapshot to <directory>/<n>.html and return the paths"""
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for kind, _, payload in read_log(path):
+        if kind != SNAPSHOT:
+            continue
+        target = os.path.join(directory, f"{len(paths):03d}.html")
+        with open(target, "w") as f:
+            f.write(f"<!-- {payload['label']}: {payload['url']} (after command {payload['after_command']}) -->\n")
+            f.write(payload['html'])
+        paths.append(target)
+    return paths
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspect and replay recorded WebDriver sessions")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    info = subparsers.add_parser("info", help="summarize a session log")
+    info.add_argument("log")
+    
+    snapshots = subparsers.add_parser("snapshots", help="write the page snapshots out as HTML files")
+    snapshots.add_argument("log")
+    snapshots.add_argument("--out", default="snapshots", help="output directory (default: snapshots)")
+    
+    replay = subparsers.add_parser("replay", help="run a demo against a session log without a browser")
+    replay.add_argument("log")
+    replay.add_argument("demo", help="demo file, e.g. 10_final_automation.py")
+    replay.add_argument("--strict", action="store_true", help="fail on any parameter difference")
+    replay.add_argument("--real-time", action="store_true", help="really sleep instead of fast-forwarding")
+    args = parser.parse_args(argv)
+    
+    if args.command == "info":
+        print_info(args.log)
+        return 0
+    if args.command == "snapshots":
+        paths = export_snapshots(args.log, args.out)
+        print(f"Wrote {len(paths)} snapshots to {args.out}")
+        return 0
+    
+    result = replay_demo(args.log, args.demo, args.strict, args.real_time)
+    print(f"\nReplayed {result['replayed']}/{result['recorded']} commands in {result['elapsed_ms']:.0f} ms "
+          f"({result['virtual_seconds']:.1f}s of waits fast-forwarded)")
+    if result['divergences'] and not result['error']:
+        # Parameters such as temporary upload paths differ on every run; only --strict fails on them
+        print("Warning: parameters differ from the recording (use --strict to fail on these)")
+    for divergence in result['divergences'][:10]:
+        print(f"   command {divergence['index']}: expected {divergence['expected']}, got {divergence['actual']}")
+    if len(result['divergences']) > 10:
+        print(f"   ... and {len(result['divergences']) - 10} more divergences")
+    if result['error']:
+        print(f"Replay stopped: {result['error']}")
+    return 1 if result['error'] or result['replayed'] != result['recorded'] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -53,7 +53,11 @@ def install_requirements():
     packages = [
         "selenium>=4.0.0",
         "webdriver-manager>=4.0.0", 
-        "requests>=2.31.0"
+        "requests>=2.31.0",
+        "numpy>=1.24.0",
+        "Pillow>=10.0.0",
+        "lxml>=4.9.0",
+        "cssselect>=1.2.0"
     ]
     
     venv_python = ".venv/bin/python" if os.name != 'nt' else ".venv\\Scripts\\python.exe"
@@ -73,7 +77,7 @@ def test_selenium_setup():
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
+from driver_resolver import resolve_chromedriver
 import sys
 
 try:
@@ -82,10 +86,10 @@ try:
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
     
-    service = Service(ChromeDriverManager().install())
+    service = Service(resolve_chromedriver())
     driver = webdriver.Chrome(service=service, options=options)
     
-    driver.get("https://www.google.com")
+    driver.get("data:text/html,<title>Selenium Setup</title>")
     title = driver.title
     driver.quit()
     
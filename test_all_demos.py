@@ -3,12 +3,25 @@
 import subprocess
 import sys
 import os
+import json
 import time
+import shutil
+import argparse
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-def test_demo(demo_file, timeout=60):
+from demo_settings import SCREENSHOTS_DIR_ENV, CHROME_PROFILE_ENV
+from fixture_server import start_for_demos
+from screenshot_retention import print_report, start_from_env
+
+DURATIONS_FILE = "demo_durations.json"
+
+def test_demo(demo_file, timeout=60, env=None, announce=True):
     """Test a single demo with timeout"""
-    print(f"Testing {demo_file}...", end=" ", flush=True)
+    if announce:
+        print(f"Testing {demo_file}...", end=" ", flush=True)
+    label = "" if announce else f"{demo_file}: "
     
     try:
         current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -18,39 +31,98 @@ def test_demo(demo_file, timeout=60):
         start_time = time.time()
         
         result = subprocess.run(
-            [python_path, demo_path], 
-            capture_output=True, 
+            [python_path, demo_path],
+            capture_output=True,
             text=True,
             timeout=timeout,
-            cwd=current_dir
+            cwd=current_dir,
+            env=env
         )
         
         duration = time.time() - start_time
         
         if result.returncode == 0:
-            print(f"PASSED ({duration:.1f}s)")
+            print(f"{label}PASSED ({duration:.1f}s)", flush=True)
             return True, duration, ""
         else:
             error_msg = result.stderr.strip() if result.stderr else "Unknown error"
-            print(f"FAILED ({duration:.1f}s)")
+            print(f"{label}FAILED ({duration:.1f}s)", flush=True)
             return False, duration, error_msg
-            
+    
     except subprocess.TimeoutExpired:
         duration = time.time() - start_time
-        print(f"TIMEOUT (>{timeout}s)")
+        print(f"{label}TIMEOUT (>{timeout}s)", flush=True)
         return False, duration, f"Timeout exceeded {timeout}s"
     except Exception as e:
         duration = time.time() - start_time
-        print(f"ERROR ({duration:.1f}s)")
+        print(f"{label}ERROR ({duration:.1f}s)", flush=True)
         return False, duration, str(e)
 
-def main():
+def load_durations(path):
+    """Load historical per-demo durations, or an empty mapping on first run"""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_durations(path, results):
+    """Record this run's per-demo durations for the next run's scheduling"""
+    durations = load_durations(path)
+    for demo, _, duration, _ in results:
+        durations[demo] = round(duration, 2)
+    
+    try:
+        with open(path, "w") as f:
+            json.dump(durations, f, indent=2, sort_keys=True)
+    except OSError as e:
+        print(f"Could not save demo durations: {e}")
+
+def schedule_longest_first(demos, durations):
+    """Order demos by historical duration, slowest first; unknown demos go first"""
+    return sorted(demos, key=lambda demo: -durations.get(demo, float("inf")))
+
+def test_demo_isolated(demo_file, timeout=60):
+    """Test a demo with its own Chrome profile and screenshots subdirectory"""
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    demo_name = os.path.splitext(demo_file)[0]
+    profile_dir = tempfile.mkdtemp(prefix=f"chrome_profile_{demo_name}_")
+    
+    env = os.environ.copy()
+    env[CHROME_PROFILE_ENV] = profile_dir
+    env[SCREENSHOTS_DIR_ENV] = os.path.join(current_dir, "screenshots", demo_name)
+    
+    try:
+        return test_demo(demo_file, timeout=timeout, env=env, announce=False)
+    finally:
+        shutil.rmtree(profile_dir, ignore_errors=True)
+
+def run_parallel(demos, workers, durations):
+    """Run demos concurrently, longest first, and return results in demo order"""
+    ordered = schedule_longest_first(demos, durations)
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {demo: executor.submit(test_demo_isolated, demo) for demo in ordered}
+        return [(demo,) + futures[demo].result() for demo in demos]
+
+def parse_args(argv=None):
+    """Parse command line options for the test suite"""
+    parser = argparse.ArgumentParser(description="Test all Selenium demos")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="run demos concurrently on N workers, each with an isolated Chrome profile")
+    parser.add_argument("--fixtures", action="store_true",
+                        help="serve the local DemoQA fixture pages and run the demos against them")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    
     print("Selenium Demo Test Suite")
     print("=" * 50)
     
     demos = [
         "01_basic_browser_launch.py",
-        "02_find_elements.py", 
+        "02_find_elements.py",
         "03_search_functionality.py",
         "04_multiple_elements.py",
         "05_forms_and_inputs.py",
@@ -61,16 +133,35 @@ def main():
         "10_final_automation.py"
     ]
     
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    durations_path = os.path.join(current_dir, DURATIONS_FILE)
+    
     print(f"Testing {len(demos)} demos...")
     print()
     
-    results = []
-    total_duration = 0
+    retention = start_from_env()
+    fixtures = start_for_demos() if args.fixtures else None
+    
+    wall_start = time.time()
+    
+    if args.workers > 1:
+        print(f"Running on {args.workers} workers (longest first)")
+        results = run_parallel(demos, args.workers, load_durations(durations_path))
+    else:
+        results = []
+        for demo in demos:
+            success, duration, error = test_demo(demo)
+            results.append((demo, success, duration, error))
+    
+    wall_time = time.time() - wall_start
+    total_duration = sum(duration for _, _, duration, _ in results)
+    save_durations(durations_path, results)
+    
+    if fixtures:
+        fixtures.stop()
     
-    for demo in demos:
-        success, duration, error = test_demo(demo)
-        results.append((demo, success, duration, error))
-        total_duration += duration
+    if retention:
+        print_report(retention.wait())
     
     print("\n" + "=" * 50)
     print("TEST RESULTS SUMMARY")
@@ -84,6 +175,7 @@ def main():
     print(f"Passed: {passed}")
     print(f"Failed: {failed}")
     print(f"Total Duration: {total_duration:.1f}s")
+    print(f"Wall Time: {wall_time:.1f}s")
     print(f"Success Rate: {success_rate:.1f}%")
     
     if failed > 0:
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Visual Diff
+===========
+Compare screenshots against a stored baseline per screenshot name using
+vectorized NumPy operations: per-pixel and per-tile differences, a DCT
+perceptual hash and bounding boxes of the changed regions
+"""
+
+import argparse
+import io
+import os
+import re
+import sys
+import time
+
+import numpy as np
+from PIL import Image
+
+from demo_settings import baseline_dir, screenshots_dir
+
+DEFAULT_THRESHOLD = 16
+DEFAULT_TILE = 32
+HASH_SIZE = 8
+HASH_SAMPLE = 32
+
+TIMESTAMP_PATTERN = re.compile(r"_?\d{8}_\d{6}_?")
+
+def _dct_matrix(size):
+    n = np.arange(size)
+    matrix = np.cos(np.pi * (2 * n[None, :] + 1) * n[:, None] / (2 * size))
+    matrix[0] *= 1 / np.sqrt(2)
+    return (matrix * np.sqrt(2 / size)).astype(np.float32)
+
+DCT_MATRIX = _dct_matrix(HASH_SAMPLE)
+GRAY_WEIGHTS = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+def decode_png(source):
+    """Load PNG bytes, a file path or an array as an RGB uint8 array"""
+    if isinstance(source, np.ndarray):
+        return source
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+    with Image.open(source) as image:
+        return np.asarray(image.convert("RGB"))
+
+def baseline_name(filepath):
+    """Strip the directory, extension and capture timestamp from a screenshot name"""
+    stem = os.path.splitext(os.path.basename(filepath))[0]
+    return TIMESTAMP_PATTERN.sub("", stem) or stem
+
+def pixel_mask(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """Return a boolean mask of pixels whose largest channel difference exceeds threshold"""
+    if baseline.shape == current.shape:
+        # max - min stays in uint8, avoiding a widened copy of both images;
+        # OR-ing the channel planes is much faster than reducing over axis 2
+        delta = np.maximum(baseline, current)
+        np.subtract(delta, np.minimum(baseline, current), out=delta)
+        over = delta > threshold
+        return over[..., 0] | over[..., 1] | over[..., 2]
+    
+    height = max(baseline.shape[0], current.shape[0])
+    width = max(baseline.shape[1], current.shape[1])
+    mask = np.ones((height, width), dtype=bool)
+    h = min(baseline.shape[0], current.shape[0])
+    w = min(baseline.shape[1], current.shape[1])
+    mask[:h, :w] = pixel_mask(baseline[:h, :w], current[:h, :w], threshold)
+    return mask
+
+def tile_ratios(mask, tile=DEFAULT_TILE):
+    """Return the fraction of changed pixels in each tile x tile block"""
+    height, width = mask.shape
+    rows = -(-height // tile)
+    cols = -(-width // tile)
+    padded = np.zeros((rows * tile, cols * tile), dtype=np.uint16)
+    padded[:height, :width] = mask
+    counts = padded.reshape(rows, tile, cols, tile).sum(axis=(1, 3))
+    return counts / float(tile * tile)
+
+def changed_regions(mask, tile=DEFAULT_TILE):
+    """Return (x, y, width, height) boxes around connected groups of changed tiles"""
+    changed = tile_ratios(mask, tile) > 0
+    seen = np.zeros_like(changed)
+    regions = []
+    
+    for row, col in zip(*np.nonzero(changed)):
+        if seen[row, col]:
+            continue
+        seen[row, col] = True
+        stack = [(row, col)]
+        top, left, bottom, right = row, col, row, col
+        while stack:
+            r, c = stack.pop()
+            top, bottom = min(top, r), max(bottom, r)
+            left, right = min(left, c), max(right, c)
+            for nr in (r - 1, r, r + 1):
+                for nc in (c - 1, c, c + 1):
+                    if (0 <= nr < changed.shape[0] and 0 <= nc < changed.shape[1]
+                            and changed[nr, nc] and not seen[nr, nc]):
+                        seen[nr, nc] = True
+                        stack.append((nr, nc))
+        
+        # Tighten the tile-aligned box to the changed pixels inside it
+        y0, x0 = top * tile, left * tile
+        block = mask[y0:(bottom + 1) * tile, x0:(right + 1) * tile]
+        ys = np.flatnonzero(block.any(axis=1))
+        xs = np.flatnonzero(block.any(axis=0))
+        regions.append((int(x0 + xs[0]), int(y0 + ys[0]),
+                        int(xs[-1] - xs[0] + 1), int(ys[-1] - ys[0] + 1)))
+    return regions
+
+def perceptual_hash(image):
+    """Return a 64-bit DCT perceptual hash of an RGB array"""
+    if not image.size:
+        return 0
+    if image.shape[0] < HASH_SAMPLE or image.shape[1] < HASH_SAMPLE:
+        # Small element crops: repeat pixels up to the sample grid so no block is empty
+        image = np.repeat(image, -(-HASH_SAMPLE // image.shape[0]), axis=0)
+        image = np.repeat(image, -(-HASH_SAMPLE // image.shape[1]), axis=1)
+    height = image.shape[0] // HASH_SAMPLE * HASH_SAMPLE
+    width = image.shape[1] // HASH_SAMPLE * HASH_SAMPLE
+    block_height = height // HASH_SAMPLE
+    block_width = width // HASH_SAMPLE
+    
+    # Sum row bands over contiguous memory first, then the narrow column blocks
+    rows = image[:height, :width].reshape(HASH_SAMPLE, block_height, width * 3).sum(axis=1, dtype=np.uint32)
+    blocks = rows.reshape(HASH_SAMPLE, HASH_SAMPLE, block_width, 3).sum(axis=2)
+    small = (blocks @ GRAY_WEIGHTS) / (block_height * block_width)
+    
+    low = (DCT_MATRIX @ small @ DCT_MATRIX.T)[:HASH_SIZE, :HASH_SIZE].ravel()
+    bits = low > np.median(low[1:])
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+def hash_distance(first, second):
+    """Number of differing bits between two perceptual hashes"""
+    return bin(first ^ second).count("1")
+
+def diff_images(baseline, current, threshold=DEFAULT_THRESHOLD, tile=DEFAULT_TILE, baseline_hash=None):
+    """Compare two RGB arrays and describe what changed"""
+    mask = pixel_mask(baseline, current, threshold)
+    changed_pixels = int(np.count_nonzero(mask))
+    if baseline_hash is None:
+        baseline_hash = perceptual_hash(baseline)
+    
+    return {
+        'size_changed': baseline.shape != current.shape,
+        'changed_pixels': changed_pixels,
+        'changed_ratio': changed_pixels / mask.size,
+        'hash_distance': hash_distance(baseline_hash, perceptual_hash(current)),
+        'regions': changed_regions(mask, tile) if changed_pixels else []
+    }
+
+class VisualBaseline:
+    """Baseline PNGs stored per screenshot name, with decoded copies cached in memory"""
+    
+    def __init__(self, root=None, threshold=DEFAULT_THRESHOLD, tile=DEFAULT_TILE, tolerance=0.001):
+        self.root = root or baseline_dir() or os.path.join(screenshots_dir(), "baselines")
+        self.threshold = threshold
+        self.tile = tile
+        self.tolerance = tolerance
+        self._cache = {}
+    
+    def path(self, name):
+        """Return where the baseline for a screenshot name lives"""
+        return os.path.join(self.root, f"{name}.png")
+    
+    def _load(self, name):
+        if name not in self._cache:
+            path = self.path(name)
+            if not os.path.exists(path):
+                return None
+            image = decode_png(path)
+            self._cache[name] = (image, perceptual_hash(image))
+        return self._cache[name]
+    
+    def update(self, name, source):
+        """Store source as the new baseline for name"""
+        os.makedirs(self.root, exist_ok=True)
+        image = decode_png(source)
+        Image.fromarray(image).save(self.path(name), format="PNG")
+        self._cache[name] = (image, perceptual_hash(image))
+    
+    def compare(self, name, source, update_missing=True):
+        """Compare a screenshot with its baseline; status is 'new', 'match' or 'changed'"""
+        start_time = time.perf_counter()
+        current = decode_png(source)
+        cached = self._load(name)
+        
+        if cached is None:
+            if update_missing:
+                self.update(name, current)
+            result = {'status': 'new'}
+        else:
+            baseline, baseline_hash = cached
+            result = diff_images(baseline, current, self.threshold, self.tile, baseline_hash)
+            changed = result['size_changed'] or result['changed_ratio'] > self.tolerance
+            result['status'] = 'changed' if changed else 'match'
+        
+        result['name'] = name
+        result['elapsed_ms'] = round((time.perf_counter() - start_time) * 1000, 2)
+        return result
+    
+    def compare_file(self, filepath, update_missing=True):
+        """Compare a screenshot file with the baseline for its timestamp-free name"""
+        return self.compare(baseline_name(filepath), filepath, update_missing)
+
+def print_result(result):
+    """Print a one-line summary of a comparison"""
+    if result['status'] == 'new':
+        print(f"  {result['name']}: new baseline stored")
+        return
+    
+    line = (f"  {result['name']}: {result['status']} - {result['changed_ratio']:.2%} pixels, "
+            f"hash distance {result['hash_distance']}, {result['elapsed_ms']} ms")
+    print(line)
+    for x, y, width, height in result['regions'][:5]:
+        print(f"    changed region at ({x}, {y}) size {width}x{height}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare screenshots against per-name baselines")
+    parser.add_argument("paths", nargs="+", help="PNG files or directories of PNG files")
+    parser.add_argument("--baselines", default=None, help="baseline directory (default: screenshots/baselines)")
+    parser.add_argument("--update", action="store_true", help="replace baselines with these screenshots")
+    parser.add_argument("--threshold", type=int, default=DEFAULT_THRESHOLD,
+                        help="per-channel difference a pixel must exceed to count as changed")
+    args = parser.parse_args(argv)
+    
+    files = []
+    for path in args.paths:
+        if os.path.isdir(path):
+            files.extend(os.path.join(path, f) for f in sorted(os.listdir(path)) if f.endswith(".png"))
+        else:
+            files.append(path)
+    
+    baselines = VisualBaseline(args.baselines, threshold=args.threshold)
+    changed = 0
+    for filepath in files:
+        if args.update:
+            baselines.update(baseline_name(filepath), filepath)
+            print(f"  {baseline_name(filepath)}: baseline updated")
+            continue
+        result = baselines.compare_file(filepath)
+        print_result(result)
+        changed += result['status'] == 'changed'
+    
+    print(f"\nCompared {len(files)} screenshots, {changed} changed")
+    return 1 if changed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())